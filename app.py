@@ -7,50 +7,132 @@ from pptx.shapes.placeholder import PlaceholderPicture
 from pptx.enum.shapes import PP_PLACEHOLDER
 from pptx.shapes.picture import Picture
 from pptx.shapes.graphfrm import GraphicFrame
-from pptx.util import Inches, Pt
+from pptx.util import Inches, Pt, Centipoints, Emu
 from pptx.dml.color import RGBColor
-from pptx.enum.text import PP_ALIGN
+from pptx.opc.packuri import PackURI
+from pptx.opc.oxml import serialize_part_xml
+from pptx.oxml import parse_xml
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.text.text import TextFrame, _Paragraph, _Run
+from pptx.enum.text import PP_ALIGN, MSO_AUTO_SIZE, MSO_UNDERLINE
+from lxml import etree
 import os
+import contextlib
+import contextvars
 import copy
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+import hashlib
+import logging
+import mmap
+import queue
+import random
+import re
+import shutil
+import sqlite3
+import struct
+import sys
+import threading
+import time
+import uuid
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Tuple, NamedTuple
+from dataclasses import dataclass, field
 
-@dataclass
-class RunFormat:
-    """텍스트 실행(Run)의 서식 정보를 저장하는 클래스"""
+# 모듈 로거: 기본 수준은 WARNING이므로 configure_logging()을 호출하지 않으면 경고와 오류만 출력됩니다
+logger = logging.getLogger("pptx_translator")
+
+class RunFormat(NamedTuple):
+    """텍스트 실행(Run)의 서식 정보를 저장하는 불변 값 (StyleTable에서 공유)"""
     font_name: Optional[str] = None
-    font_size: Optional[int] = None
+    font_size: Optional[float] = None
     font_bold: Optional[bool] = None
     font_italic: Optional[bool] = None
     font_underline: Optional[bool] = None
     font_color_rgb: Optional[tuple] = None
-    text_length: int = 0
 
-@dataclass
-class ParagraphFormat:
-    """단락의 서식 정보를 저장하는 클래스"""
+class ParagraphFormat(NamedTuple):
+    """단락의 서식 정보를 저장하는 불변 값 (runs는 StyleTable의 Run 서식 ID)"""
     alignment: Optional[int] = None
     level: int = 0
-    space_before: Optional[int] = None
-    space_after: Optional[int] = None
+    space_before: Optional[float] = None
+    space_after: Optional[float] = None
     line_spacing: Optional[float] = None
-    runs: List[RunFormat] = None
-    
-    def __post_init__(self):
-        if self.runs is None:
-            self.runs = []
+    runs: Tuple[int, ...] = ()
+
+class StyleTable:
+    """프레젠테이션 단위로 동일한 Run/단락 서식을 한 번만 저장하고 정수 ID로 참조하는 스타일 테이블
+
+    한 프레젠테이션을 처리하는 스레드에서만 사용합니다.
+    """
+
+    def __init__(self):
+        self._run_formats: List[RunFormat] = []
+        self._run_ids: Dict[RunFormat, int] = {}
+        self._paragraph_formats: List[ParagraphFormat] = []
+        self._paragraph_ids: Dict[ParagraphFormat, int] = {}
+        # 서식 ID별로 처음 적용한 결과 XML(a:rPr, 빈 a:r/a:p 원형)을 보관하여 같은 서식에 재사용합니다
+        self._applied_elements: Dict[Tuple[str, int], Any] = {}
+        self.run_count = 0
+        self.paragraph_count = 0
+
+    def intern_run(self, run_format: RunFormat) -> int:
+        """Run 서식을 등록하고 ID를 반환합니다."""
+        self.run_count += 1
+        style_id = self._run_ids.get(run_format)
+        if style_id is None:
+            style_id = len(self._run_formats)
+            self._run_formats.append(run_format)
+            self._run_ids[run_format] = style_id
+        return style_id
+
+    def intern_paragraph(self, paragraph_format: ParagraphFormat) -> int:
+        """단락 서식을 등록하고 ID를 반환합니다."""
+        self.paragraph_count += 1
+        style_id = self._paragraph_ids.get(paragraph_format)
+        if style_id is None:
+            style_id = len(self._paragraph_formats)
+            self._paragraph_formats.append(paragraph_format)
+            self._paragraph_ids[paragraph_format] = style_id
+        return style_id
+
+    def run(self, style_id: int) -> RunFormat:
+        return self._run_formats[style_id]
+
+    def paragraph(self, style_id: int) -> ParagraphFormat:
+        return self._paragraph_formats[style_id]
+
+    def applied_element(self, kind: str, style_id: int):
+        """이전에 서식을 적용한 결과 XML 요소를 반환합니다 (없으면 None).
+
+        kind는 "rPr"(Run 속성), "r"(빈 Run 원형), "p"(빈 단락 원형) 중 하나입니다.
+        """
+        return self._applied_elements.get((kind, style_id))
+
+    def remember_applied_element(self, kind: str, style_id: int, element) -> None:
+        self._applied_elements[(kind, style_id)] = element
+
+    def stats(self) -> Dict[str, int]:
+        """등록된 전체 서식 수와 고유 서식 수를 반환합니다."""
+        return {
+            'runs': self.run_count,
+            'run_styles': len(self._run_formats),
+            'paragraphs': self.paragraph_count,
+            'paragraph_styles': len(self._paragraph_formats)
+        }
 
 @dataclass
 class TextFrameTemplate:
-    """텍스트 프레임의 템플릿 정보를 저장하는 클래스"""
+    """텍스트 프레임의 템플릿 정보를 저장하는 클래스 (paragraphs는 StyleTable의 단락 서식 ID)"""
     original_text: str
-    paragraphs: List[ParagraphFormat]
+    paragraphs: Tuple[int, ...]
     margin_left: Optional[int] = None
     margin_right: Optional[int] = None
     margin_top: Optional[int] = None
     margin_bottom: Optional[int] = None
     word_wrap: Optional[bool] = None
     auto_size: Optional[int] = None
+    styles: Optional[StyleTable] = field(default=None, compare=False, repr=False)
 
 @dataclass
 class TextElement:
@@ -65,15 +147,1929 @@ class TextElement:
     col_idx: Optional[int] = None
     # 그룹화된 도형용 추가 정보
     child_idx: Optional[int] = None
+    # 증분 번역용 식별 정보
+    slide_id: Optional[int] = None
+    shape_id: Optional[int] = None
+    # 번역이 성공적으로 확보되었는지 여부 (실패 시 원문 유지)
+    is_translated: bool = False
+
+# 프롬프트가 바뀌면 캐시된 번역이 재사용되지 않도록 버전을 올립니다
+PROMPT_VERSION = "v1"
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".cache", "pptx-translation", "translation_cache.db")
+
+# 모델별 예상 비용 계산용 단가 (USD / 100만 토큰: 입력, 출력). 모델 ID에 키가 포함되면 적용됩니다
+MODEL_PRICES = {
+    "claude-3-5-sonnet": (3.0, 15.0),
+    "claude-3-7-sonnet": (3.0, 15.0),
+    "claude-3-5-haiku": (0.8, 4.0),
+    "claude-3-haiku": (0.25, 1.25),
+    "claude-3-opus": (15.0, 75.0),
+}
+
+# 기본 번역 모델과 짧은 세그먼트용 경량 모델
+DEFAULT_MODEL_ID = "us.anthropic.claude-3-5-sonnet-20240620-v1:0"
+DEFAULT_SMALL_MODEL_ID = "us.anthropic.claude-3-5-haiku-20241022-v1:0"
+
+# 문자 체계별 문자당 대략적인 모델 토큰 수 (숫자, 공백, 기호는 "other")
+SCRIPT_TOKENS_PER_CHAR = {"latin": 0.25, "cyrillic": 0.4, "hangul": 0.9, "kana": 0.8, "han": 1.0, "other": 0.3}
+# 대상 언어로 옮겼을 때의 토큰 증가율 (원문 토큰 수 대비, 목록에 없으면 1.2)
+TARGET_TOKEN_EXPANSION = {"en": 1.0, "ko": 1.5, "ja": 1.5, "zh": 1.3, "ru": 1.4}
+# 고유한 문자 체계를 쓰는 대상 언어 (이 문자 체계로만 쓰인 세그먼트는 이미 대상 언어로 보고 번역하지 않음)
+TARGET_SCRIPTS = {"ko": {"hangul"}, "ja": {"kana", "han"}, "zh": {"han"}, "ru": {"cyrillic"}}
+
+# 응답 최대 토큰 수 계산 시 예상 출력 토큰에 곱하는 여유 배수와 고정 여유분
+MAX_TOKENS_MARGIN = 1.5
+MAX_TOKENS_OVERHEAD = 32
+
+# 사전 추정(dry run) 기본 가정: 요청당 기본 지연(초), 출력 토큰당 생성 시간(초)
+ESTIMATED_REQUEST_LATENCY = 1.0
+ESTIMATED_SECONDS_PER_OUTPUT_TOKEN = 0.015
+
+# 일괄(배치 추론) 모드: 입력 JSONL/매니페스트 파일 이름과 온디맨드 대비 단가 배수
+BULK_INPUT_FILE = "records.jsonl"
+BULK_MANIFEST_FILE = "manifest.json"
+BULK_PRICE_FACTOR = 0.5
+
+# 요청 지연 시간 히스토그램 구간 경계 (초)
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+# 현재 번역 실행의 대상 언어별 체크포인트 저널 (작업자 스레드에서 번역 결과를 기록할 때 사용)
+current_journals: contextvars.ContextVar = contextvars.ContextVar("current_journals", default=None)
+
+# 현재 번역 실행의 계측 객체 (작업자 스레드에는 제출 시점의 컨텍스트가 복사되어 전달됩니다)
+current_run_metrics: contextvars.ContextVar = contextvars.ContextVar("current_run_metrics", default=None)
+
+# 현재 번역 중인 프레젠테이션의 용어집 (실행 시작 시 한 번 로드되어 모든 프롬프트의 고정 접두부에 포함)
+current_glossary: contextvars.ContextVar = contextvars.ContextVar("current_glossary", default=None)
+
+# Bedrock 프롬프트 캐시: 캐시 쓰기/읽기 입력 토큰의 단가 배수와 캐시되는 접두부의 최소 토큰 수
+PROMPT_CACHE_WRITE_FACTOR = 1.25
+PROMPT_CACHE_READ_FACTOR = 0.1
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+class Prompt(NamedTuple):
+    """모델 프롬프트: 호출마다 같은 지시문/용어집 접두부(prefix)와 세그먼트마다 달라지는 본문(body)"""
+    prefix: str
+    body: str
+
+    @property
+    def text(self) -> str:
+        """접두부와 본문을 이어 붙인 전체 프롬프트"""
+        return self.prefix + self.body
+
+def char_script(ch: str) -> str:
+    """문자의 문자 체계를 latin, cyrillic, hangul, kana, han, other 중 하나로 분류합니다."""
+    code = ord(ch)
+    if 0xAC00 <= code <= 0xD7A3 or 0x1100 <= code <= 0x11FF or 0x3130 <= code <= 0x318F:
+        return "hangul"
+    if 0x3040 <= code <= 0x30FF or 0x31F0 <= code <= 0x31FF or 0xFF66 <= code <= 0xFF9D:
+        return "kana"
+    if 0x4E00 <= code <= 0x9FFF or 0x3400 <= code <= 0x4DBF or 0xF900 <= code <= 0xFAFF:
+        return "han"
+    if 0x0400 <= code <= 0x04FF:
+        return "cyrillic"
+    if ch.isalpha() and code <= 0x024F:
+        return "latin"
+    return "other"
+
+def segment_tokens(text: str) -> int:
+    """문자 체계별 문자당 토큰 수로 세그먼트의 모델 토큰 수를 추정합니다."""
+    return int(sum(SCRIPT_TOKENS_PER_CHAR[char_script(ch)] for ch in text)) + 1
+
+def configure_logging(level: int = logging.INFO) -> None:
+    """모듈 로거가 지정한 수준 이상의 메시지를 표준 출력으로 내보내도록 설정합니다."""
+    if not any(getattr(handler, '_pptx_translator', False) for handler in logger.handlers):
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._pptx_translator = True
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(level)
+
+class XPathTextExtractor:
+    """python-pptx 프록시 객체를 거치지 않고 슬라이드 XML에서 직접 텍스트 요소와 서식 템플릿을 추출합니다.
+
+    extract_text_elements_from_slide와 같은 TextElement/TextFrameTemplate 결과를 생성합니다.
+    """
+
+    A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+    P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+    NAMESPACES = {
+        "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+        "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+        "c": "http://schemas.openxmlformats.org/drawingml/2006/chart",
+        "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    }
+    TABLE_URI = "http://schemas.openxmlformats.org/drawingml/2006/table"
+    CHART_URI = "http://schemas.openxmlformats.org/drawingml/2006/chart"
+    SHAPE_TAGS = frozenset({P + "sp", P + "grpSp", P + "graphicFrame", P + "cxnSp", P + "pic", P + "contentPart"})
+    AUTO_SIZE_TAGS = {
+        A + "spAutoFit": MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT,
+        A + "normAutofit": MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE,
+        A + "noAutofit": MSO_AUTO_SIZE.NONE,
+    }
+
+    _sp_tree = etree.XPath("./p:cSld/p:spTree", namespaces=NAMESPACES)
+    _shape_id = etree.XPath("./*[1]/p:cNvPr/@id", namespaces=NAMESPACES)
+    _graphic_data_uri = etree.XPath("./a:graphic/a:graphicData/@uri", namespaces=NAMESPACES)
+    _table_rows = etree.XPath("./a:graphic/a:graphicData/a:tbl/a:tr", namespaces=NAMESPACES)
+    _chart_rid = etree.XPath("./a:graphic/a:graphicData/c:chart/@r:id", namespaces=NAMESPACES)
+    _chart_title_rich = etree.XPath("./c:chart/c:title/c:tx/c:rich", namespaces=NAMESPACES)
+    _run_color = etree.XPath("./a:solidFill/a:srgbClr/@val", namespaces=NAMESPACES)
+    _run_typeface = etree.XPath("./a:latin/@typeface", namespaces=NAMESPACES)
+    _space_before = etree.XPath("./a:spcBef/a:spcPts/@val", namespaces=NAMESPACES)
+    _space_after = etree.XPath("./a:spcAft/a:spcPts/@val", namespaces=NAMESPACES)
+    _line_spacing_points = etree.XPath("./a:lnSpc/a:spcPts/@val", namespaces=NAMESPACES)
+    _line_spacing_percent = etree.XPath("./a:lnSpc/a:spcPct/@val", namespaces=NAMESPACES)
+
+    def shape_elements(self, container) -> List[Any]:
+        """spTree 또는 grpSp의 직계 도형 요소를 python-pptx와 같은 순서로 반환합니다."""
+        return [child for child in container if child.tag in self.SHAPE_TAGS]
+
+    def text_body(self, shape_elm):
+        """도형 요소(p:sp)의 p:txBody를 반환합니다."""
+        if shape_elm.tag != self.P + "sp":
+            return None
+        return shape_elm.find(self.P + "txBody")
+
+    def paragraph_text(self, p) -> str:
+        """a:p의 텍스트를 python-pptx와 같은 규칙으로 반환합니다 (a:br은 수직 탭)."""
+        parts = []
+        for child in p:
+            tag = child.tag
+            if tag == self.A + "r" or tag == self.A + "fld":
+                t = child.find(self.A + "t")
+                if t is not None and t.text:
+                    parts.append(t.text)
+            elif tag == self.A + "br":
+                parts.append("\v")
+        return "".join(parts)
+
+    def frame_text(self, txBody) -> str:
+        """텍스트 본문 전체 텍스트를 반환합니다."""
+        return "\n".join(self.paragraph_text(p) for p in txBody.iterchildren(self.A + "p"))
+
+    @staticmethod
+    def _xsd_bool(value: Optional[str]) -> Optional[bool]:
+        if value is None:
+            return None
+        if value in ("1", "true"):
+            return True
+        if value in ("0", "false"):
+            return False
+        raise ValueError(f"invalid boolean value: {value}")
+
+    def run_format(self, r) -> RunFormat:
+        """a:r의 서식 정보를 추출합니다."""
+        rPr = r.find(self.A + "rPr")
+        if rPr is None:
+            return RunFormat()
+        
+        try:
+            typeface = self._run_typeface(rPr)
+            size = rPr.get("sz")
+            underline = rPr.get("u")
+            if underline is not None:
+                underline = MSO_UNDERLINE.from_xml(underline)
+                if underline is MSO_UNDERLINE.NONE:
+                    underline = False
+                elif underline is MSO_UNDERLINE.SINGLE_LINE:
+                    underline = True
+            color = self._run_color(rPr)
+            
+            return RunFormat(
+                font_name=typeface[0] if typeface else None,
+                font_size=Centipoints(int(size)).pt if size is not None else None,
+                font_bold=self._xsd_bool(rPr.get("b")),
+                font_italic=self._xsd_bool(rPr.get("i")),
+                font_underline=underline,
+                font_color_rgb=tuple(RGBColor.from_string(color[0])) if color else None
+            )
+        except Exception as e:
+            logger.warning(f"    Run 서식 추출 중 오류: {str(e)}")
+            return RunFormat()
+
+    @staticmethod
+    def _spacing_points(values: List[str]) -> Optional[float]:
+        if not values:
+            return None
+        length = Centipoints(int(values[0]))
+        return length.pt if length else None
+
+    def paragraph_format(self, p, styles: StyleTable) -> ParagraphFormat:
+        """a:p의 서식 정보를 추출합니다 (Run 서식은 스타일 테이블에 등록)."""
+        runs_format = tuple(styles.intern_run(self.run_format(r)) for r in p.iterchildren(self.A + "r"))
+        pPr = p.find(self.A + "pPr")
+        if pPr is None:
+            return ParagraphFormat(runs=runs_format)
+        
+        try:
+            alignment = pPr.get("algn")
+            line_spacing = None
+            line_points = self._line_spacing_points(pPr)
+            if line_points:
+                line_spacing = Centipoints(int(line_points[0]))
+            else:
+                line_percent = self._line_spacing_percent(pPr)
+                if line_percent:
+                    value = line_percent[0]
+                    line_spacing = float(value[:-1]) / 100.0 if value.endswith("%") else int(value) / 100000.0
+            
+            return ParagraphFormat(
+                alignment=PP_ALIGN.from_xml(alignment) if alignment is not None else None,
+                level=int(pPr.get("lvl", 0)),
+                space_before=self._spacing_points(self._space_before(pPr)),
+                space_after=self._spacing_points(self._space_after(pPr)),
+                line_spacing=line_spacing,
+                runs=runs_format
+            )
+        except Exception as e:
+            logger.warning(f"    단락 서식 추출 중 오류: {str(e)}")
+            return ParagraphFormat()
+
+    @staticmethod
+    def _inset_points(bodyPr, name: str, default: int) -> Optional[float]:
+        value = bodyPr.get(name)
+        length = Emu(int(value)) if value is not None else Emu(default)
+        return length.pt if length else None
+
+    def template(self, txBody, styles: StyleTable) -> TextFrameTemplate:
+        """텍스트 본문(p:txBody, a:txBody, c:rich)의 템플릿 정보를 추출합니다."""
+        original_text = self.frame_text(txBody)
+        try:
+            bodyPr = txBody.find(self.A + "bodyPr")
+            auto_size = None
+            for child in bodyPr:
+                if child.tag in self.AUTO_SIZE_TAGS:
+                    auto_size = self.AUTO_SIZE_TAGS[child.tag]
+                    break
+            
+            return TextFrameTemplate(
+                original_text=original_text,
+                paragraphs=tuple(styles.intern_paragraph(self.paragraph_format(p, styles))
+                                 for p in txBody.iterchildren(self.A + "p")),
+                margin_left=self._inset_points(bodyPr, "lIns", 91440),
+                margin_right=self._inset_points(bodyPr, "rIns", 91440),
+                margin_top=self._inset_points(bodyPr, "tIns", 45720),
+                margin_bottom=self._inset_points(bodyPr, "bIns", 45720),
+                word_wrap={"square": True, "none": False}.get(bodyPr.get("wrap")),
+                auto_size=auto_size,
+                styles=styles
+            )
+        except Exception as e:
+            logger.warning(f"    텍스트 프레임 템플릿 추출 중 오류: {str(e)}")
+            return TextFrameTemplate(original_text=original_text, paragraphs=(), styles=styles)
+
+    def _text_element(self, txBody, styles: StyleTable, **location) -> Optional[TextElement]:
+        """텍스트가 있는 본문에서 TextElement를 생성합니다."""
+        if txBody is None:
+            return None
+        text = self.frame_text(txBody).strip()
+        if not text:
+            return None
+        return TextElement(original_text=text, template=self.template(txBody, styles), **location)
+
+    def extract(self, sld, slide_id: Optional[int] = None, resolve_chart=None,
+                styles: Optional[StyleTable] = None) -> List[TextElement]:
+        """슬라이드 XML(p:sld)에서 텍스트 요소를 추출합니다.
+
+        resolve_chart는 관계 ID로 차트 파트의 c:chartSpace 요소를 반환하는 함수입니다.
+        styles를 전달하면 서식이 프레젠테이션 단위 스타일 테이블에 등록됩니다.
+        """
+        if styles is None:
+            styles = StyleTable()
+        text_elements = []
+        sp_trees = self._sp_tree(sld)
+        if not sp_trees:
+            return text_elements
+        
+        for shape_idx, shape_elm in enumerate(self.shape_elements(sp_trees[0])):
+            try:
+                shape_ids = self._shape_id(shape_elm)
+                location = dict(shape_index=shape_idx, slide_id=slide_id,
+                                shape_id=int(shape_ids[0]) if shape_ids else None)
+                tag = shape_elm.tag
+                
+                # 1. 일반 도형
+                if tag == self.P + "sp":
+                    element = self._text_element(self.text_body(shape_elm), styles, element_type="shape", **location)
+                    if element is not None:
+                        text_elements.append(element)
+                
+                # 2. 그룹화된 도형 (직계 자식 도형만)
+                elif tag == self.P + "grpSp":
+                    for child_idx, child_elm in enumerate(self.shape_elements(shape_elm)):
+                        element = self._text_element(self.text_body(child_elm), styles, element_type="grouped_shape",
+                                                     child_idx=child_idx, **location)
+                        if element is not None:
+                            text_elements.append(element)
+                
+                elif tag == self.P + "graphicFrame":
+                    uri = self._graphic_data_uri(shape_elm)
+                    uri = uri[0] if uri else None
+                    
+                    # 3. 테이블
+                    if uri == self.TABLE_URI:
+                        for row_idx, tr in enumerate(self._table_rows(shape_elm)):
+                            for col_idx, tc in enumerate(tr.iterchildren(self.A + "tc")):
+                                element = self._text_element(tc.find(self.A + "txBody"), styles, element_type="table_cell",
+                                                             row_idx=row_idx, col_idx=col_idx, **location)
+                                if element is not None:
+                                    text_elements.append(element)
+                    
+                    # 4. 차트 제목
+                    elif uri == self.CHART_URI and resolve_chart is not None:
+                        rIds = self._chart_rid(shape_elm)
+                        chart_space = resolve_chart(rIds[0]) if rIds else None
+                        if chart_space is not None:
+                            rich = self._chart_title_rich(chart_space)
+                            element = self._text_element(rich[0] if rich else None, styles,
+                                                         element_type="chart_title", **location)
+                            if element is not None:
+                                text_elements.append(element)
+            
+            except Exception as e:
+                logger.warning(f"    도형 {shape_idx} 처리 중 오류: {str(e)}")
+        
+        return text_elements
+
+    def locate_text_body(self, sld, element: TextElement, resolve_chart=None):
+        """extract가 기록한 위치 정보로 텍스트 요소의 p:txBody(또는 차트의 c:rich)를 찾습니다."""
+        sp_trees = self._sp_tree(sld)
+        if not sp_trees:
+            return None
+        shapes = self.shape_elements(sp_trees[0])
+        if element.shape_index >= len(shapes):
+            return None
+        shape_elm = shapes[element.shape_index]
+        
+        if element.element_type == "shape":
+            return self.text_body(shape_elm)
+        if element.element_type == "grouped_shape":
+            children = self.shape_elements(shape_elm)
+            if element.child_idx is None or element.child_idx >= len(children):
+                return None
+            return self.text_body(children[element.child_idx])
+        if element.element_type == "table_cell":
+            rows = self._table_rows(shape_elm)
+            if element.row_idx is None or element.row_idx >= len(rows):
+                return None
+            cells = list(rows[element.row_idx].iterchildren(self.A + "tc"))
+            if element.col_idx is None or element.col_idx >= len(cells):
+                return None
+            return cells[element.col_idx].find(self.A + "txBody")
+        if element.element_type == "chart_title" and resolve_chart is not None:
+            rIds = self._chart_rid(shape_elm)
+            chart_space = resolve_chart(rIds[0]) if rIds else None
+            rich = self._chart_title_rich(chart_space) if chart_space is not None else []
+            return rich[0] if rich else None
+        return None
+
+class TranslationCache:
+    """번역 결과를 저장하는 2단계 캐시 (메모리 LRU + SQLite 영구 저장소)
+
+    디스크 적중의 마지막 사용 시각은 조회마다 커밋하지 않고 모아 두었다가 저장, 일정 개수/시간 경과, flush/close 때
+    한 번에 기록합니다.
+    """
+
+    TOUCH_FLUSH_SIZE = 1000
+    TOUCH_FLUSH_INTERVAL = 5.0
+
+    def __init__(self, db_path: Optional[str] = DEFAULT_CACHE_PATH, max_entries: int = 200000,
+                 memory_size: int = 10000):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.memory_size = memory_size
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._disk_count = 0
+        # 아직 기록하지 않은 디스크 적중 항목의 마지막 사용 시각
+        self._touched: Dict[str, float] = {}
+        self._last_flush = time.monotonic()
+
+        # 적중/미스 통계
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if db_path:
+            try:
+                directory = os.path.dirname(db_path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._conn = sqlite3.connect(db_path, check_same_thread=False)
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.execute("PRAGMA synchronous=NORMAL")
+                self._conn.execute(
+                    "CREATE TABLE IF NOT EXISTS translations ("
+                    "key TEXT PRIMARY KEY, translation TEXT NOT NULL, last_used REAL NOT NULL)"
+                )
+                self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON translations(last_used)")
+                self._conn.commit()
+                self._disk_count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+            except Exception as e:
+                logger.info(f"번역 캐시 파일을 열 수 없어 메모리 캐시만 사용합니다: {str(e)}")
+                self._conn = None
+
+    @staticmethod
+    def make_key(text: str, target_language: str, model_id: str, prompt_version: str = PROMPT_VERSION) -> str:
+        """(원문, 대상 언어, 모델, 프롬프트 버전)으로 캐시 키를 생성합니다."""
+        payload = json.dumps([text, target_language, model_id, prompt_version], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시에서 번역을 조회합니다. 없으면 None을 반환합니다."""
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute("SELECT translation FROM translations WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._touched[key] = time.time()
+                    if (len(self._touched) >= self.TOUCH_FLUSH_SIZE or
+                            time.monotonic() - self._last_flush >= self.TOUCH_FLUSH_INTERVAL):
+                        self._flush_touched()
+                        self._conn.commit()
+                    self._remember(key, row[0])
+                    self.disk_hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def contains(self, key: str) -> bool:
+        """캐시에 키가 있는지 확인합니다. 통계와 마지막 사용 시각은 바꾸지 않습니다."""
+        with self._lock:
+            if key in self._memory:
+                return True
+            if self._conn is None:
+                return False
+            return self._conn.execute("SELECT 1 FROM translations WHERE key = ?", (key,)).fetchone() is not None
+
+    def put(self, key: str, translation: str):
+        """번역 결과를 캐시에 저장합니다."""
+        with self._lock:
+            self._remember(key, translation)
+            if self._conn is None:
+                return
+            try:
+                # 이미 있는 키는 덮어쓰기만 하고, 새 행을 추가한 경우에만 항목 수를 늘립니다
+                now = time.time()
+                cursor = self._conn.execute(
+                    "UPDATE translations SET translation = ?, last_used = ? WHERE key = ?",
+                    (translation, now, key)
+                )
+                if cursor.rowcount == 0:
+                    self._conn.execute(
+                        "INSERT INTO translations (key, translation, last_used) VALUES (?, ?, ?)",
+                        (key, translation, now)
+                    )
+                    self._disk_count += 1
+                self._touched.pop(key, None)
+                # 모아 둔 사용 시각은 저장과 같은 커밋으로 기록합니다 (제거 순서에도 반영)
+                self._flush_touched()
+                if self._disk_count > self.max_entries:
+                    self._evict()
+                self._conn.commit()
+            except Exception as e:
+                logger.debug(f"번역 캐시 저장 중 오류 (무시됨): {str(e)}")
+
+    def _flush_touched(self):
+        """모아 둔 디스크 적중 항목의 마지막 사용 시각을 기록합니다 (커밋은 호출한 쪽에서 수행)."""
+        if self._touched:
+            self._conn.executemany("UPDATE translations SET last_used = ? WHERE key = ?",
+                                   [(used, key) for key, used in self._touched.items()])
+            self._touched.clear()
+        self._last_flush = time.monotonic()
+
+    def flush(self):
+        """모아 둔 마지막 사용 시각을 디스크에 기록합니다."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._flush_touched()
+                self._conn.commit()
+            except Exception as e:
+                logger.debug(f"번역 캐시 사용 시각 기록 중 오류 (무시됨): {str(e)}")
+
+    def _remember(self, key: str, translation: str):
+        """메모리 LRU 계층에 항목을 추가합니다."""
+        self._memory[key] = translation
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        """가장 오래 사용되지 않은 항목을 최대 크기의 90%까지 제거합니다."""
+        self._disk_count = self._conn.execute("SELECT COUNT(*) FROM translations").fetchone()[0]
+        excess = self._disk_count - int(self.max_entries * 0.9)
+        if excess <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM translations WHERE key IN "
+            "(SELECT key FROM translations ORDER BY last_used ASC LIMIT ?)",
+            (excess,)
+        )
+        self._disk_count -= excess
+        self.evictions += excess
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/미스 통계를 반환합니다."""
+        lookups = self.memory_hits + self.disk_hits + self.misses
+        return {
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": (self.memory_hits + self.disk_hits) / lookups if lookups else 0.0,
+            "disk_entries": self._disk_count,
+        }
+
+    def close(self):
+        """모아 둔 사용 시각을 기록하고 SQLite 연결을 닫습니다."""
+        self.flush()
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+class TranslationJournal:
+    """번역이 끝난 요소를 도착 즉시 한 줄씩 추가 기록하는 체크포인트 저널 (JSON Lines)
+
+    첫 줄은 덱 해시, 대상 언어, 모델, 프롬프트 버전을 담은 헤더이고 이후 각 줄은 요소 위치 키, 원문 해시,
+    번역 결과입니다. 프로세스가 중간에 종료되어 마지막 줄이 잘린 경우 그 줄만 버리고 이어서 기록합니다.
+    헤더가 현재 실행과 다르면(입력 파일이 바뀐 경우 등) 이전 기록을 버리고 새로 시작합니다.
+    """
+
+    def __init__(self, path: str, header: Dict[str, Any], fsync_interval: float = 1.0):
+        self.path = path
+        self.header = dict(header, journal=1)
+        self.fsync_interval = fsync_interval
+        self._lock = threading.Lock()
+        self._last_sync = time.monotonic()
+        self.entries: Dict[str, Dict[str, str]] = {}
+        self._by_hash: Dict[str, str] = {}
+        self.appended = 0
+
+        if self._load():
+            self._file = open(path, "ab")
+        else:
+            self.entries = {}
+            self._by_hash = {}
+            self._file = open(path, "wb")
+            self._file.write(json.dumps(self.header, ensure_ascii=False).encode("utf-8") + b"\n")
+            self._sync(force=True)
+
+    def _load(self) -> bool:
+        """기존 저널을 읽습니다. 이어서 기록할 수 있으면 True를 반환합니다."""
+        if not os.path.exists(self.path):
+            return False
+        with open(self.path, "rb") as f:
+            data = f.read()
+        lines = data.split(b"\n")
+        # 마지막 줄바꿈 뒤의 조각은 기록 도중 종료된 불완전한 줄이므로 잘라냅니다
+        partial = lines.pop()
+        if not lines:
+            return False
+        try:
+            if json.loads(lines[0]) != self.header:
+                logger.info(f"체크포인트 저널의 입력 파일이나 번역 조건이 달라 새로 시작합니다: {self.path}")
+                return False
+        except ValueError:
+            return False
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+                self.entries[record["key"]] = record
+                self._by_hash[record["text_hash"]] = record["translation"]
+            except (ValueError, KeyError, TypeError):
+                continue
+        if partial:
+            with open(self.path, "r+b") as f:
+                f.truncate(len(data) - len(partial))
+        return True
+
+    def _sync(self, force: bool = False):
+        self._file.flush()
+        now = time.monotonic()
+        if force or now - self._last_sync >= self.fsync_interval:
+            os.fsync(self._file.fileno())
+            self._last_sync = now
+
+    def record(self, key: str, text_hash: str, translation: str):
+        """번역 결과 하나를 저널 끝에 추가합니다. 프로세스가 종료되어도 유지되도록 즉시 플러시합니다."""
+        line = json.dumps({"key": key, "text_hash": text_hash, "translation": translation}, ensure_ascii=False)
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line.encode("utf-8") + b"\n")
+            self.appended += 1
+            self._sync()
+
+    def lookup(self, key: str, text_hash: str) -> Optional[str]:
+        """위치 키와 원문 해시가 모두 일치하는 기록이 있으면 번역을, 위치 기록이 없으면 같은 원문의 번역을 반환합니다.
+
+        중복 제거로 대표 요소만 기록되므로 같은 원문을 가진 다른 위치는 원문 해시로 찾습니다.
+        """
+        entry = self.entries.get(key)
+        if entry is not None:
+            return entry["translation"] if entry["text_hash"] == text_hash else None
+        return self._by_hash.get(text_hash)
+
+    def close(self):
+        """저널 파일을 디스크에 동기화하고 닫습니다."""
+        with self._lock:
+            if not self._file.closed:
+                self._sync(force=True)
+                self._file.close()
+
+    def discard(self):
+        """번역 결과가 저장되어 더 이상 필요 없는 저널을 닫고 삭제합니다."""
+        self.close()
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+class Glossary:
+    """프레젠테이션별 용어집: 원문 용어와 대상 언어별 번역을 프롬프트에 넣을 목록으로 만듭니다.
+
+    JSON 파일은 {"용어": "번역"} 또는 {"용어": {"ko": "번역", "ja": "번역"}} 형식이며,
+    텍스트 파일은 한 줄에 "용어 = 번역" 또는 "용어<TAB>번역"을 쓰고, 번역 없이 용어만 쓰면 원문 그대로 유지합니다.
+    """
+
+    def __init__(self, entries: Dict[str, Any], source: Optional[str] = None):
+        self.entries = entries
+        self.source = source
+        payload = json.dumps(entries, ensure_ascii=False, sort_keys=True)
+        self.fingerprint = hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def load(cls, path: str) -> "Glossary":
+        """용어집 파일을 읽습니다. 형식이 잘못되면 ValueError를 발생시킵니다."""
+        with open(path, encoding="utf-8") as f:
+            content = f.read()
+        if path.lower().endswith(".json"):
+            entries = json.loads(content)
+            if not isinstance(entries, dict):
+                raise ValueError("JSON 용어집은 객체여야 합니다")
+            return cls(entries, path)
+        
+        entries = {}
+        for line in content.splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            term, _, translation = line.partition("\t") if "\t" in line else line.partition("=")
+            entries[term.strip()] = translation.strip() or term.strip()
+        return cls(entries, path)
+
+    def terms_for(self, target_language: str) -> List[Tuple[str, str]]:
+        """대상 언어에 적용되는 (용어, 번역) 목록을 반환합니다."""
+        terms = []
+        for term, value in self.entries.items():
+            translation = value.get(target_language) if isinstance(value, dict) else value
+            if translation is not None:
+                terms.append((term, translation or term))
+        return terms
+
+    def format(self, target_languages: List[str]) -> str:
+        """프롬프트에 넣을 용어집 목록을 만듭니다. 적용되는 용어가 없으면 빈 문자열입니다."""
+        lines = []
+        if len(target_languages) == 1:
+            lines = [f"- {term} → {translation}" for term, translation in self.terms_for(target_languages[0])]
+        else:
+            per_language = {code: dict(self.terms_for(code)) for code in target_languages}
+            for term in self.entries:
+                translations = [f"{code}: {per_language[code][term]}" for code in target_languages
+                                if term in per_language[code]]
+                if translations:
+                    lines.append(f"- {term} → {', '.join(translations)}")
+        return "\n".join(lines)
+
+class AdaptiveRateLimiter:
+    """분당 요청/토큰 할당량과 AIMD 방식의 적응형 동시성 제한을 공유하는 스케줄러"""
+
+    def __init__(self, max_concurrency: int, requests_per_minute: Optional[int] = None,
+                 tokens_per_minute: Optional[int] = None, min_concurrency: int = 1,
+                 base_backoff: float = 1.0, max_backoff: float = 60.0):
+        self.max_concurrency = max(1, max_concurrency)
+        self.min_concurrency = max(1, min(min_concurrency, self.max_concurrency))
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+
+        # AIMD 동시성 창: 성공 시 1/창 크기만큼 증가, 제한 오류 시 절반으로 감소
+        self.concurrency_limit = float(self.max_concurrency)
+        self._in_flight = 0
+        self._cooldown_until = 0.0
+        self._condition = threading.Condition()
+
+        # 토큰 버킷 (분당 할당량을 초당 보충 속도로 환산)
+        self._request_bucket = float(requests_per_minute) if requests_per_minute else None
+        self._token_bucket = float(tokens_per_minute) if tokens_per_minute else None
+        self._last_refill = time.monotonic()
+
+        # 통계
+        self.requests = 0
+        self.throttles = 0
+        self.retries = 0
+        self.give_ups = 0
+        self.total_queue_wait = 0.0
+        self.max_queue_wait = 0.0
+
+    def _refill(self, now: float):
+        """경과 시간만큼 토큰 버킷을 보충합니다."""
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        if self._request_bucket is not None:
+            self._request_bucket = min(float(self.requests_per_minute),
+                                       self._request_bucket + elapsed * self.requests_per_minute / 60.0)
+        if self._token_bucket is not None:
+            self._token_bucket = min(float(self.tokens_per_minute),
+                                     self._token_bucket + elapsed * self.tokens_per_minute / 60.0)
+
+    def _wait_time(self, now: float, tokens: int) -> float:
+        """요청을 보낼 수 있을 때까지 기다려야 하는 시간을 계산합니다. 0이면 즉시 보낼 수 있습니다."""
+        if now < self._cooldown_until:
+            return self._cooldown_until - now
+        if self._in_flight >= int(self.concurrency_limit):
+            return 0.5
+        wait = 0.0
+        if self._request_bucket is not None and self._request_bucket < 1:
+            wait = max(wait, (1 - self._request_bucket) * 60.0 / self.requests_per_minute)
+        if self._token_bucket is not None:
+            # 분당 할당량보다 큰 요청은 버킷이 가득 찼을 때 보냅니다
+            needed = min(float(tokens), float(self.tokens_per_minute))
+            if self._token_bucket < needed:
+                wait = max(wait, (needed - self._token_bucket) * 60.0 / self.tokens_per_minute)
+        return wait
+
+    def acquire(self, tokens: int = 0):
+        """요청 슬롯과 할당량을 확보할 때까지 대기합니다."""
+        start = time.monotonic()
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(now, tokens)
+                if wait <= 0:
+                    break
+                self._condition.wait(timeout=wait)
+
+            self._in_flight += 1
+            self.requests += 1
+            if self._request_bucket is not None:
+                self._request_bucket -= 1
+            if self._token_bucket is not None:
+                self._token_bucket -= tokens
+
+            queue_wait = time.monotonic() - start
+            self.total_queue_wait += queue_wait
+            self.max_queue_wait = max(self.max_queue_wait, queue_wait)
+
+    def release(self, estimated_tokens: int = 0, actual_tokens: Optional[int] = None, throttled: bool = False):
+        """요청 슬롯을 반환하고 결과에 따라 동시성 창을 조정합니다."""
+        with self._condition:
+            self._in_flight -= 1
+            if self._token_bucket is not None and actual_tokens is not None:
+                # 추정치와 실제 사용량의 차이를 보정합니다
+                self._token_bucket += estimated_tokens - actual_tokens
+
+            if throttled:
+                self.throttles += 1
+                self.concurrency_limit = max(float(self.min_concurrency), self.concurrency_limit / 2)
+                # 제한 오류가 발생하면 모든 작업자가 함께 잠시 멈춥니다
+                self._cooldown_until = max(self._cooldown_until, time.monotonic() + self.base_backoff)
+            else:
+                self.concurrency_limit = min(float(self.max_concurrency),
+                                             self.concurrency_limit + 1.0 / self.concurrency_limit)
+            self._condition.notify_all()
+
+    def backoff(self, attempt: int) -> float:
+        """지터가 적용된 지수 백오프 대기 시간을 반환하고 재시도 횟수를 기록합니다."""
+        with self._condition:
+            self.retries += 1
+        return random.uniform(self.base_backoff, min(self.max_backoff, self.base_backoff * (2 ** (attempt + 1))))
+
+    def record_give_up(self):
+        """최대 재시도 횟수에 도달하여 포기한 요청을 기록합니다."""
+        with self._condition:
+            self.give_ups += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """스케줄러 통계를 반환합니다."""
+        return {
+            "requests": self.requests,
+            "throttles": self.throttles,
+            "retries": self.retries,
+            "give_ups": self.give_ups,
+            "total_queue_wait": round(self.total_queue_wait, 3),
+            "max_queue_wait": round(self.max_queue_wait, 3),
+            "avg_queue_wait": round(self.total_queue_wait / self.requests, 3) if self.requests else 0.0,
+            "concurrency_limit": round(self.concurrency_limit, 2),
+        }
+
+class SegmentDeduplicator:
+    """프레젠테이션 전체에서 공백을 정규화한 동일 세그먼트를 묶어 한 번만 번역하도록 관리합니다.
+
+    각 고유 세그먼트의 첫 번째 요소(대표 요소)만 번역 요청을 보내고,
+    이후 등장하는 같은 세그먼트는 대표 요소의 번역 결과를 공유합니다.
+    """
 
-class PowerPointTranslatorImproved:
     def __init__(self):
-        # Amazon Bedrock 클라이언트 설정
-        self.bedrock_client = boto3.client(
-            'bedrock-runtime',
-            region_name='us-west-2'
+        self._leaders: Dict[str, TextElement] = {}
+        self._futures: Dict[str, Future] = {}
+        self.total_segments = 0
+        self.duplicate_segments = 0
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """줄 구조는 유지하면서 각 줄의 연속 공백을 하나로 정규화합니다."""
+        return "\n".join(" ".join(line.split()) for line in text.strip().split("\n"))
+
+    def split(self, text_elements: List[TextElement]) -> Tuple[List[TextElement], List[Tuple[TextElement, TextElement]]]:
+        """요소를 번역이 필요한 대표 요소와 (중복 요소, 대표 요소) 쌍으로 나눕니다."""
+        leaders = []
+        followers = []
+        for element in text_elements:
+            if not element.original_text.strip():
+                leaders.append(element)
+                continue
+            
+            self.total_segments += 1
+            key = self.normalize(element.original_text)
+            leader = self._leaders.get(key)
+            if leader is None:
+                self._leaders[key] = element
+                leaders.append(element)
+            else:
+                self.duplicate_segments += 1
+                followers.append((element, leader))
+        return leaders, followers
+
+    def attach_future(self, batch: List[TextElement], future: Future):
+        """대표 요소들이 포함된 번역 작업을 기록합니다."""
+        for element in batch:
+            self._futures[self.normalize(element.original_text)] = future
+
+    def future_of(self, leader: TextElement) -> Optional[Future]:
+        """대표 요소의 번역 작업을 반환합니다. 캐시 등으로 이미 해결되었으면 None입니다."""
+        return self._futures.get(self.normalize(leader.original_text))
+
+    @staticmethod
+    def copy_translation(follower: TextElement, leader: TextElement):
+        """대표 요소의 번역 결과를 중복 요소에 복사합니다. 번역 실패 시 중복 요소의 원문을 유지합니다."""
+        if leader.is_translated:
+            follower.translated_text = leader.translated_text
+            follower.is_translated = True
+        else:
+            follower.translated_text = follower.original_text
+
+    def stats(self) -> Dict[str, Any]:
+        """중복 제거 통계를 반환합니다."""
+        unique = self.total_segments - self.duplicate_segments
+        return {
+            "total_segments": self.total_segments,
+            "unique_segments": unique,
+            "duplicate_segments": self.duplicate_segments,
+            "dedup_ratio": self.duplicate_segments / self.total_segments if self.total_segments else 0.0,
+        }
+
+class RunMetrics:
+    """번역 실행의 단계/슬라이드 타이머, 모델별 요청 지연 시간, 토큰 사용량, 예상 비용, 재시도 통계를 수집합니다.
+
+    작업자 스레드에서 동시에 기록되므로 모든 갱신은 잠금 안에서 수행됩니다.
+    parent를 지정하면 요청 측정값이 상위(번역기 전체) 계측 객체에도 함께 기록됩니다.
+    """
+
+    def __init__(self, parent: Optional["RunMetrics"] = None):
+        self._lock = threading.Lock()
+        self.parent = parent
+        self.started = time.time()
+        self._start_clock = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+        self.slides: Dict[int, Dict[str, Any]] = {}
+        self.models: Dict[str, Dict[str, Any]] = {}
+        self.prefiltered: Dict[str, int] = {}
+        self.saved_calls = 0
+
+    def add_stage_time(self, stage: str, seconds: float):
+        """단계별 누적 소요 시간에 더합니다."""
+        with self._lock:
+            self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+
+    def stage(self, stage: str):
+        """with 블록의 소요 시간을 단계별 누적 시간에 기록하는 컨텍스트 관리자를 반환합니다."""
+        @contextlib.contextmanager
+        def timer():
+            start = time.perf_counter()
+            try:
+                yield
+            finally:
+                self.add_stage_time(stage, time.perf_counter() - start)
+        return timer()
+
+    def record_slide(self, slide_idx: int, **values):
+        """슬라이드별 측정값(추출/번역/적용 시간, 요소 수 등)을 기록합니다. 시간 값은 누적됩니다."""
+        with self._lock:
+            slide = self.slides.setdefault(slide_idx, {"slide": slide_idx + 1})
+            for name, value in values.items():
+                if name.endswith("_seconds"):
+                    slide[name] = slide.get(name, 0.0) + value
+                else:
+                    slide[name] = value
+
+    def record_prefilter(self, reasons: Dict[str, int], saved_calls: int):
+        """사전 필터가 번역 없이 유지한 세그먼트 수(규칙별)와 절약한 모델 호출 수를 기록합니다."""
+        with self._lock:
+            for reason, count in reasons.items():
+                self.prefiltered[reason] = self.prefiltered.get(reason, 0) + count
+            self.saved_calls += saved_calls
+        if self.parent is not None:
+            self.parent.record_prefilter(reasons, saved_calls)
+
+    def _model(self, model_id: str) -> Dict[str, Any]:
+        return self.models.setdefault(model_id, {
+            "requests": 0, "errors": 0, "throttles": 0, "retries": 0, "give_ups": 0,
+            "input_tokens": 0, "output_tokens": 0, "cache_read_input_tokens": 0,
+            "cache_creation_input_tokens": 0, "latencies": []
+        })
+
+    def record_request(self, model_id: str, seconds: float, usage: Optional[Dict[str, int]] = None):
+        """성공한 모델 요청의 지연 시간과 토큰 사용량을 기록합니다."""
+        with self._lock:
+            model = self._model(model_id)
+            model["requests"] += 1
+            model["latencies"].append(seconds)
+            for name, value in (usage or {}).items():
+                if isinstance(value, int):
+                    model[name] = model.get(name, 0) + value
+        if self.parent is not None:
+            self.parent.record_request(model_id, seconds, usage)
+
+    def record_failure(self, model_id: str, kind: str, seconds: Optional[float] = None):
+        """실패한 요청을 기록합니다. kind는 "errors", "throttles", "retries", "give_ups" 중 하나입니다."""
+        with self._lock:
+            model = self._model(model_id)
+            model[kind] += 1
+            if seconds is not None:
+                model["latencies"].append(seconds)
+        if self.parent is not None:
+            self.parent.record_failure(model_id, kind, seconds)
+
+    @staticmethod
+    def estimate_cost(model_id: str, input_tokens: int, output_tokens: int, cache_read_tokens: int = 0,
+                      cache_write_tokens: int = 0) -> Optional[float]:
+        """단가표에 있는 모델이면 예상 비용(USD)을 반환합니다. 캐시 읽기/쓰기 토큰은 입력 단가에 배수를 적용합니다."""
+        for key, (input_price, output_price) in MODEL_PRICES.items():
+            if key in model_id:
+                cached = cache_read_tokens * PROMPT_CACHE_READ_FACTOR + cache_write_tokens * PROMPT_CACHE_WRITE_FACTOR
+                return round(((input_tokens + cached) * input_price + output_tokens * output_price) / 1_000_000, 6)
+        return None
+
+    @staticmethod
+    def latency_summary(latencies: List[float]) -> Dict[str, Any]:
+        """지연 시간 목록을 구간별 히스토그램과 백분위수로 요약합니다."""
+        buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        for seconds in latencies:
+            index = 0
+            while index < len(LATENCY_BUCKETS) and seconds > LATENCY_BUCKETS[index]:
+                index += 1
+            buckets[index] += 1
+        ordered = sorted(latencies)
+
+        def percentile(fraction):
+            if not ordered:
+                return None
+            return round(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))], 4)
+
+        labels = [f"<={bound}s" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}s"]
+        return {
+            "count": len(ordered),
+            "mean": round(sum(ordered) / len(ordered), 4) if ordered else None,
+            "p50": percentile(0.5),
+            "p90": percentile(0.9),
+            "p99": percentile(0.99),
+            "max": round(ordered[-1], 4) if ordered else None,
+            "histogram": dict(zip(labels, buckets))
+        }
+
+    def report(self) -> Dict[str, Any]:
+        """수집한 측정값을 JSON으로 직렬화할 수 있는 사전으로 반환합니다."""
+        with self._lock:
+            models = {}
+            totals = {"requests": 0, "input_tokens": 0, "output_tokens": 0, "cache_read_input_tokens": 0,
+                      "cache_creation_input_tokens": 0, "estimated_cost_usd": 0.0}
+            for model_id, model in self.models.items():
+                summary = {name: value for name, value in model.items() if name != "latencies"}
+                summary["estimated_cost_usd"] = self.estimate_cost(
+                    model_id, model["input_tokens"], model["output_tokens"],
+                    model["cache_read_input_tokens"], model["cache_creation_input_tokens"])
+                summary["latency"] = self.latency_summary(model["latencies"])
+                models[model_id] = summary
+                for name in ("requests", "input_tokens", "output_tokens", "cache_read_input_tokens",
+                             "cache_creation_input_tokens"):
+                    totals[name] += model[name]
+                totals["estimated_cost_usd"] += summary["estimated_cost_usd"] or 0.0
+            totals["estimated_cost_usd"] = round(totals["estimated_cost_usd"], 6)
+            return {
+                "started_at": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+                "wall_seconds": round(time.perf_counter() - self._start_clock, 4),
+                "stages": {name: round(seconds, 4) for name, seconds in self.stages.items()},
+                "slides": [
+                    {name: round(value, 4) if isinstance(value, float) else value for name, value in slide.items()}
+                    for _, slide in sorted(self.slides.items())
+                ],
+                "models": models,
+                "totals": totals,
+                "prefilter": {"segments": dict(self.prefiltered), "saved_calls": self.saved_calls}
+            }
+
+class SegmentFilter:
+    """모델을 호출하지 않고 그대로 둘 세그먼트(숫자, 백분율, 날짜, URL, 이메일, 코드, 기호, 이미 대상 언어인 텍스트)를
+    정규식과 유니코드 문자 체계로 판별합니다.
+
+    여러 줄 세그먼트는 모든 줄이 번역 불필요로 판별될 때만 건너뜁니다.
+    """
+
+    PATTERNS = {
+        "percentage": re.compile(r"^[(]?[-+−±]?\d[\d,.]*\s?(%|％|%p|pp|bps?)[)]?$", re.IGNORECASE),
+        "number": re.compile(r"^[(\[]?[-+−±]?[$€£¥₩]?\s?\d[\d,.\s]*(k|m|b|bn|mn|x)?[)\]]?$", re.IGNORECASE),
+        "date": re.compile(r"^(\d{1,4}[-./]\d{1,2}([-./]\d{1,4})?|\d{1,2}:\d{2}(:\d{2})?|"
+                           r"(Q[1-4]|H[12]|FY)\s?'?\d{2,4}|\d{4}\s?(Q[1-4]|H[12]))$", re.IGNORECASE),
+        # 스킴이나 www. 없는 호스트는 경로(/)가 있고 흔한 소문자 최상위 도메인일 때만 URL로 봅니다 (Node.js, README.md 등 제외)
+        "url": re.compile(r"^((https?|ftp)://\S+|www\.\S+|[\w-]+(\.[\w-]+)*\.(?-i:com|net|org|edu|gov|io|ai|app|dev|"
+                          r"cloud|co|info|biz|me|us|uk|eu|kr|jp|cn|de|fr|ca|au|in)/\S*)$", re.IGNORECASE),
+        "email": re.compile(r"^[\w.+-]+@[\w-]+(\.[\w-]+)+$"),
+        "code": re.compile(r"^(?=[^\d]*\d)[A-Z0-9]+([-_/.#:][A-Z0-9]+)*$"),
+    }
+    RULES = ("number", "percentage", "date", "url", "email", "code", "symbol", "target_script")
+
+    def __init__(self, rules: Optional[List[str]] = None, target_script_ratio: float = 0.9):
+        unknown = set(rules or ()) - set(self.RULES)
+        if unknown:
+            raise ValueError(f"지원하지 않는 사전 필터 규칙입니다: {sorted(unknown)}")
+        self.rules = tuple(rule for rule in self.RULES if rules is None or rule in rules)
+        self.target_script_ratio = target_script_ratio
+
+    def in_target_script(self, text: str, target_language: str) -> bool:
+        """글자의 대부분이 대상 언어 고유의 문자 체계이면 True를 반환합니다 (라틴 문자 언어는 판별하지 않음)."""
+        scripts = TARGET_SCRIPTS.get(target_language)
+        if not scripts:
+            return False
+        letters = [char_script(ch) for ch in text if ch.isalpha()]
+        if not letters:
+            return False
+        # 한자만으로 된 텍스트는 중국어일 수 있으므로 일본어는 가나가 있어야 합니다
+        if target_language == "ja" and "kana" not in letters:
+            return False
+        return sum(1 for script in letters if script in scripts) / len(letters) >= self.target_script_ratio
+
+    def classify_line(self, line: str, target_language: str) -> Optional[str]:
+        """한 줄이 번역이 필요 없으면 해당 규칙 이름을, 번역이 필요하면 None을 반환합니다."""
+        for rule in self.rules:
+            if rule == "symbol":
+                if not any(ch.isalnum() for ch in line):
+                    return rule
+            elif rule == "target_script":
+                if self.in_target_script(line, target_language):
+                    return rule
+            elif self.PATTERNS[rule].match(line):
+                return rule
+        return None
+
+    def classify(self, text: str, target_language: str) -> Optional[str]:
+        """세그먼트가 번역이 필요 없으면 첫 줄의 규칙 이름을, 번역이 필요하면 None을 반환합니다."""
+        reason = None
+        for line in text.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+            line_reason = self.classify_line(line, target_language)
+            if line_reason is None:
+                return None
+            reason = reason or line_reason
+        return reason
+
+class BedrockBackend:
+    """연결 풀을 조정한 bedrock-runtime 클라이언트로 모델을 호출하는 번역 백엔드"""
+
+    def __init__(self, region_name: str = 'us-west-2', pool_size: int = 10, keep_alive: bool = True,
+                 connect_timeout: int = 10, read_timeout: int = 120, client=None):
+        # client를 전달하면 같은 인터페이스의 클라이언트(예: 벤치마크용 모의 bedrock-runtime)를 사용합니다
+        if client is not None:
+            self.client = client
+            return
+        
+        from botocore.config import Config
+
+        # 재시도는 AdaptiveRateLimiter가 담당하므로 botocore 자체 재시도는 끕니다
+        config = Config(
+            max_pool_connections=pool_size,
+            tcp_keepalive=keep_alive,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            retries={'max_attempts': 1, 'mode': 'standard'}
+        )
+        self.client = boto3.client('bedrock-runtime', region_name=region_name, config=config)
+
+    def invoke(self, model_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """모델을 호출하고 전체 응답 본문을 반환합니다."""
+        response = self.client.invoke_model(modelId=model_id, body=json.dumps(body))
+        return json.loads(response['body'].read())
+
+    def invoke_stream(self, model_id: str, body: Dict[str, Any], on_text=None) -> Dict[str, Any]:
+        """응답 스트림으로 모델을 호출하고, 도착하는 텍스트 조각을 on_text로 전달합니다.
+
+        반환값은 invoke()와 같은 형태의 응답 본문입니다.
+        """
+        import botocore.exceptions
+
+        response = self.client.invoke_model_with_response_stream(modelId=model_id, body=json.dumps(body))
+        text_parts = []
+        usage = {}
+        stop_reason = None
+        for event in response['body']:
+            if 'chunk' not in event:
+                # 스트림 중간에 전달되는 오류 이벤트 (throttlingException 등)
+                error_name, error = next(iter(event.items()))
+                error_code = error_name[0].upper() + error_name[1:]
+                raise botocore.exceptions.ClientError(
+                    {'Error': {'Code': error_code, 'Message': error.get('message', '')}},
+                    'InvokeModelWithResponseStream'
+                )
+            
+            chunk = json.loads(event['chunk']['bytes'])
+            chunk_type = chunk.get('type')
+            if chunk_type == 'message_start':
+                usage.update(chunk.get('message', {}).get('usage', {}))
+            elif chunk_type == 'content_block_delta':
+                text = chunk.get('delta', {}).get('text', '')
+                if text:
+                    text_parts.append(text)
+                    if on_text is not None:
+                        on_text(text)
+            elif chunk_type == 'message_delta':
+                usage.update(chunk.get('usage', {}))
+                stop_reason = chunk.get('delta', {}).get('stop_reason', stop_reason)
+        
+        return {
+            'content': [{'type': 'text', 'text': ''.join(text_parts)}],
+            'usage': usage,
+            'stop_reason': stop_reason
+        }
+
+class StreamingJSONParser:
+    """스트림으로 도착하는 JSON 객체 응답에서 값이 완성된 "키": "문자열" 쌍을 도착하는 대로 파싱합니다.
+
+    배치/다국어 응답이 중간에 끊기거나(스트림 오류, 재시도 소진) 전체를 해석할 수 없을 때도 이미 완성된
+    세그먼트를 살려 실패한 세그먼트만 다시 요청할 수 있게 합니다. 재시도로 새 스트림이 시작되면 start()로
+    버퍼를 비우며, 이전 스트림에서 완성된 값은 유지합니다.
+    """
+
+    _pair = re.compile(r'\s*,?\s*("(?:[^"\\]|\\.)*")\s*:\s*("(?:[^"\\]|\\.)*")', re.DOTALL)
+
+    def __init__(self):
+        self.values: Dict[str, str] = {}
+        self.start()
+
+    def start(self):
+        """새 응답 스트림을 시작합니다."""
+        self._buffer = ""
+        self._pos = None
+
+    def feed(self, text: str):
+        """텍스트 조각을 추가하고 새로 완성된 쌍을 values에 기록합니다."""
+        self._buffer += text
+        if self._pos is None:
+            brace = self._buffer.find("{")
+            if brace < 0:
+                return
+            self._pos = brace + 1
+        while True:
+            match = self._pair.match(self._buffer, self._pos)
+            if match is None:
+                return
+            try:
+                key, value = json.loads(match.group(1)), json.loads(match.group(2))
+            except ValueError:
+                return
+            self.values[key] = value
+            self._pos = match.end()
+
+def default_stub_response(prompt: str) -> str:
+    """StubBackend의 기본 응답: 프롬프트에서 번역 대상을 찾아 그대로 돌려줍니다."""
+    for marker, suffix in (("번역할 세그먼트:\n", "\n\n번역 (JSON):"), ("번역할 텍스트:\n", "\n\n번역")):
+        if marker in prompt:
+            return prompt.split(marker, 1)[1].rsplit(suffix, 1)[0]
+    return prompt
+
+class StubBackend:
+    """Bedrock을 호출하지 않는 오프라인 테스트용 번역 백엔드"""
+
+    def __init__(self, responder=None, latency: float = 0.0):
+        self.responder = responder or default_stub_response
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+        self._cached_prefixes = set()
+
+    def invoke(self, model_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        """요청 본문의 마지막 사용자 메시지로 응답을 생성합니다.
+
+        cache_control이 붙은 시스템 블록은 Bedrock 프롬프트 캐시처럼 처음에는 캐시 쓰기, 이후에는 캐시 읽기로 집계합니다.
+        """
+        with self._lock:
+            self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        
+        content = body['messages'][-1]['content']
+        if isinstance(content, list):
+            content = "".join(block.get('text', '') for block in content)
+        text = self.responder(content)
+        usage = {'input_tokens': len(content.encode('utf-8')) // 4 + 1,
+                 'output_tokens': len(text.encode('utf-8')) // 4 + 1}
+        for block in body.get('system', []):
+            tokens = len(block['text'].encode('utf-8')) // 4 + 1
+            if 'cache_control' not in block or tokens < PROMPT_CACHE_MIN_TOKENS:
+                usage['input_tokens'] += tokens
+                continue
+            with self._lock:
+                cached = (model_id, block['text']) in self._cached_prefixes
+                self._cached_prefixes.add((model_id, block['text']))
+            usage['cache_read_input_tokens' if cached else 'cache_creation_input_tokens'] = tokens
+        return {
+            'content': [{'type': 'text', 'text': text}],
+            'usage': usage,
+            'stop_reason': 'end_turn'
+        }
+
+    def invoke_stream(self, model_id: str, body: Dict[str, Any], on_text=None) -> Dict[str, Any]:
+        """스트리밍 호출을 흉내 내어 응답 전체를 한 조각으로 전달합니다."""
+        response_body = self.invoke(model_id, body)
+        if on_text is not None:
+            on_text(response_body['content'][0]['text'])
+        return response_body
+
+class LocalBatchService:
+    """Bedrock 배치 추론 작업 서비스를 흉내 내는 로컬 파일 기반 대체 서비스
+
+    작업마다 root_dir 아래에 디렉터리를 만들고 입력 JSONL과 상태 파일을 저장합니다.
+    제출된 작업은 상태를 조회할 때 backend로 레코드를 하나씩 처리하여 Bedrock과 같은 형식의 출력 JSONL을 만듭니다.
+    """
+
+    def __init__(self, root_dir: str, backend=None):
+        self.root_dir = root_dir
+        self.backend = backend or StubBackend()
+
+    def _job_dir(self, job_id: str) -> str:
+        return os.path.join(self.root_dir, job_id)
+
+    def _write_state(self, job_id: str, state: Dict[str, Any]):
+        path = os.path.join(self._job_dir(job_id), "job.json")
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f, ensure_ascii=False, indent=2)
+        os.replace(path + ".tmp", path)
+
+    def _read_state(self, job_id: str) -> Dict[str, Any]:
+        with open(os.path.join(self._job_dir(job_id), "job.json"), encoding="utf-8") as f:
+            return json.load(f)
+
+    def submit(self, input_path: str, job_name: str, model_id: str) -> str:
+        """입력 JSONL을 작업 디렉터리로 복사하고 작업 ID를 반환합니다."""
+        job_id = f"{job_name}-{uuid.uuid4().hex[:8]}"
+        os.makedirs(self._job_dir(job_id))
+        shutil.copyfile(input_path, os.path.join(self._job_dir(job_id), os.path.basename(input_path)))
+        self._write_state(job_id, {"job_name": job_name, "model_id": model_id, "status": "Submitted",
+                                   "input_file": os.path.basename(input_path)})
+        return job_id
+
+    def process(self, job_id: str):
+        """제출된 작업의 레코드를 모두 처리하여 출력 JSONL(<입력 파일>.out)을 씁니다."""
+        state = self._read_state(job_id)
+        state["status"] = "InProgress"
+        self._write_state(job_id, state)
+        
+        input_path = os.path.join(self._job_dir(job_id), state["input_file"])
+        processed = failed = 0
+        with open(input_path, encoding="utf-8") as source, open(input_path + ".out", "w", encoding="utf-8") as out:
+            for line in source:
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                result = {"recordId": record["recordId"], "modelInput": record["modelInput"]}
+                try:
+                    result["modelOutput"] = self.backend.invoke(state["model_id"], record["modelInput"])
+                    processed += 1
+                except Exception as e:
+                    result["error"] = {"errorCode": 500, "errorMessage": str(e)}
+                    failed += 1
+                out.write(json.dumps(result, ensure_ascii=False) + "\n")
+        
+        state.update(status="Completed" if not failed else "PartiallyCompleted",
+                     processed_records=processed, failed_records=failed)
+        self._write_state(job_id, state)
+
+    def status(self, job_id: str) -> str:
+        """작업 상태를 반환합니다. 아직 처리되지 않은 작업은 이때 처리합니다."""
+        if self._read_state(job_id)["status"] == "Submitted":
+            self.process(job_id)
+        return self._read_state(job_id)["status"]
+
+    def download_output(self, job_id: str, destination: str) -> str:
+        """작업의 출력 JSONL을 destination으로 복사합니다."""
+        state = self._read_state(job_id)
+        shutil.copyfile(os.path.join(self._job_dir(job_id), state["input_file"] + ".out"), destination)
+        return destination
+
+class BedrockBatchService:
+    """Amazon Bedrock 배치 추론(CreateModelInvocationJob) 작업 서비스
+
+    입력 JSONL을 s3_uri 아래에 올리고 작업을 만들며, 완료된 작업의 출력 JSONL을 내려받습니다.
+    """
+
+    def __init__(self, s3_uri: str, role_arn: str, region_name: str = 'us-west-2'):
+        self.s3_uri = s3_uri.rstrip("/")
+        self.role_arn = role_arn
+        self.bedrock = boto3.client('bedrock', region_name=region_name)
+        self.s3 = boto3.client('s3', region_name=region_name)
+
+    @staticmethod
+    def split_s3_uri(uri: str) -> Tuple[str, str]:
+        """s3://버킷/키 형식의 URI를 (버킷, 키)로 나눕니다."""
+        bucket, _, key = uri[len("s3://"):].partition("/")
+        return bucket, key
+
+    def submit(self, input_path: str, job_name: str, model_id: str) -> str:
+        """입력 JSONL을 S3에 올리고 배치 추론 작업을 만들어 작업 ARN을 반환합니다."""
+        input_uri = f"{self.s3_uri}/{job_name}/input/{os.path.basename(input_path)}"
+        self.s3.upload_file(input_path, *self.split_s3_uri(input_uri))
+        response = self.bedrock.create_model_invocation_job(
+            jobName=job_name,
+            roleArn=self.role_arn,
+            modelId=model_id,
+            inputDataConfig={"s3InputDataConfig": {"s3Uri": input_uri}},
+            outputDataConfig={"s3OutputDataConfig": {"s3Uri": f"{self.s3_uri}/{job_name}/output/"}}
+        )
+        return response["jobArn"]
+
+    def status(self, job_id: str) -> str:
+        """작업 상태(Submitted, InProgress, Completed, PartiallyCompleted, Failed 등)를 반환합니다."""
+        return self.bedrock.get_model_invocation_job(jobIdentifier=job_id)["status"]
+
+    def download_output(self, job_id: str, destination: str) -> str:
+        """출력 위치의 <작업 ID>/<입력 파일>.out을 destination으로 내려받습니다."""
+        job = self.bedrock.get_model_invocation_job(jobIdentifier=job_id)
+        input_name = job["inputDataConfig"]["s3InputDataConfig"]["s3Uri"].rsplit("/", 1)[-1]
+        output_uri = job["outputDataConfig"]["s3OutputDataConfig"]["s3Uri"].rstrip("/")
+        bucket, key = self.split_s3_uri(f"{output_uri}/{job_id.rsplit('/', 1)[-1]}/{input_name}.out")
+        self.s3.download_file(bucket, key, destination)
+        return destination
+
+class SQLiteWorkQueue:
+    """SQLite 파일 하나로 조정자와 여러 작업자 프로세스가 함께 쓰는 번역 작업 큐
+
+    가져간 작업은 가시성 제한 시간(visibility_timeout) 동안 다른 작업자에게 보이지 않으며,
+    그 안에 완료되지 않으면 다시 가져갈 수 있습니다. 실패한 작업은 max_attempts번까지 지연 후 재시도됩니다.
+    작업 완료/실패는 가져갈 때 받은 영수증(receipt)이 일치할 때만 반영되므로 제한 시간이 지난 작업자의 결과는 무시됩니다.
+    끝난 작업에는 증가하는 완료 순번(finished_seq)을 매겨 조정자가 새로 끝난 작업만 읽을 수 있게 합니다.
+    여러 호스트에서 사용하려면 SQLite 잠금을 지원하는 공유 파일 시스템이 필요합니다.
+    """
+
+    # 끝난(완료 또는 최종 실패) 작업에 매기는 완료 순번 (쓰기 잠금 안에서 계산되므로 커밋 순서대로 증가)
+    NEXT_FINISHED_SEQ = "(SELECT COALESCE(MAX(finished_seq), 0) + 1 FROM tasks)"
+
+    def __init__(self, db_path: str, visibility_timeout: float = 300.0, max_attempts: int = 3,
+                 retry_delay: float = 5.0):
+        self.db_path = db_path
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(db_path, timeout=60.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, payload TEXT NOT NULL, "
+                           "created_at REAL NOT NULL)")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            "job_id TEXT NOT NULL, task_id TEXT NOT NULL, payload TEXT NOT NULL, state TEXT NOT NULL, "
+            "attempts INTEGER NOT NULL DEFAULT 0, visible_at REAL NOT NULL, worker TEXT, receipt TEXT, "
+            "result TEXT, error TEXT, updated_at REAL NOT NULL, finished_seq INTEGER, PRIMARY KEY (job_id, task_id))"
+        )
+        columns = [row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")]
+        if "finished_seq" not in columns:
+            # 완료 순번이 없던 이전 형식의 큐 파일은 열을 추가하고 이미 끝난 작업에 순번을 매깁니다
+            self._conn.execute("ALTER TABLE tasks ADD COLUMN finished_seq INTEGER")
+            self._conn.execute("UPDATE tasks SET finished_seq = rowid WHERE state IN ('done', 'failed')")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_state ON tasks(state, visible_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_finished ON tasks(finished_seq)")
+
+    def _write(self, sql: str, params: tuple = ()) -> int:
+        with self._lock:
+            return self._conn.execute(sql, params).rowcount
+
+    def create_job(self, job_id: str, payload: Dict[str, Any]):
+        """작업(job) 단위의 공통 정보(용어집, 모델 등)를 저장합니다."""
+        self._write("INSERT OR REPLACE INTO jobs (job_id, payload, created_at) VALUES (?, ?, ?)",
+                    (job_id, json.dumps(payload, ensure_ascii=False), time.time()))
+
+    def job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업의 공통 정보를 반환합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT payload FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row is not None else None
+
+    def put(self, job_id: str, task_id: str, payload: Dict[str, Any]) -> bool:
+        """번역 작업을 추가합니다. 같은 작업 ID가 이미 있으면 추가하지 않고 False를 반환합니다."""
+        now = time.time()
+        return self._write(
+            "INSERT OR IGNORE INTO tasks (job_id, task_id, payload, state, visible_at, updated_at) "
+            "VALUES (?, ?, ?, 'pending', ?, ?)",
+            (job_id, task_id, json.dumps(payload, ensure_ascii=False), now, now)
+        ) > 0
+
+    def claim(self, worker_id: str) -> Optional[Dict[str, Any]]:
+        """보이는 작업 하나를 가져갑니다. 가져갈 작업이 없으면 None을 반환합니다."""
+        now = time.time()
+        with self._lock:
+            # 다른 프로세스와 동시에 같은 작업을 가져가지 않도록 쓰기 잠금을 먼저 잡습니다
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._expire(now)
+                row = self._conn.execute(
+                    "SELECT job_id, task_id, payload, attempts FROM tasks "
+                    "WHERE state IN ('pending', 'claimed') AND visible_at <= ? ORDER BY rowid LIMIT 1", (now,)
+                ).fetchone()
+                if row is None:
+                    self._conn.execute("COMMIT")
+                    return None
+                receipt = uuid.uuid4().hex
+                self._conn.execute(
+                    "UPDATE tasks SET state = 'claimed', attempts = attempts + 1, visible_at = ?, worker = ?, "
+                    "receipt = ?, updated_at = ? WHERE job_id = ? AND task_id = ?",
+                    (now + self.visibility_timeout, worker_id, receipt, now, row[0], row[1])
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return {"job_id": row[0], "task_id": row[1], "payload": json.loads(row[2]),
+                "attempts": row[3] + 1, "receipt": receipt}
+
+    def _expire(self, now: float) -> int:
+        """제한 시간이 지났는데 재시도 횟수를 다 쓴 작업을 실패로 처리합니다."""
+        return self._conn.execute(
+            "UPDATE tasks SET state = 'failed', error = COALESCE(error, 'visibility timeout'), updated_at = ?, "
+            f"finished_seq = {self.NEXT_FINISHED_SEQ} WHERE state = 'claimed' AND visible_at <= ? AND attempts >= ?",
+            (now, now, self.max_attempts)
+        ).rowcount
+
+    def expire(self) -> int:
+        """작업을 가져가는 작업자가 없어도 제한 시간이 지난 작업을 최종 실패로 정리합니다. 정리한 작업 수를 반환합니다."""
+        with self._lock:
+            return self._expire(time.time())
+
+    def complete(self, task: Dict[str, Any], result: Any) -> bool:
+        """가져간 작업의 결과를 기록합니다. 제한 시간이 지나 다른 작업자가 가져갔으면 False를 반환합니다."""
+        return self._write(
+            f"UPDATE tasks SET state = 'done', result = ?, receipt = NULL, updated_at = ?, "
+            f"finished_seq = {self.NEXT_FINISHED_SEQ} "
+            "WHERE job_id = ? AND task_id = ? AND receipt = ? AND state = 'claimed'",
+            (json.dumps(result, ensure_ascii=False), time.time(), task["job_id"], task["task_id"], task["receipt"])
+        ) > 0
+
+    def fail(self, task: Dict[str, Any], error: str) -> bool:
+        """가져간 작업의 실패를 기록합니다. 재시도 횟수가 남았으면 지연 후 다시 보이게 하고 True를 반환합니다."""
+        now = time.time()
+        retry = task["attempts"] < self.max_attempts
+        self._write(
+            f"UPDATE tasks SET state = ?, error = ?, visible_at = ?, receipt = NULL, updated_at = ?, "
+            f"finished_seq = CASE WHEN ? THEN NULL ELSE {self.NEXT_FINISHED_SEQ} END "
+            "WHERE job_id = ? AND task_id = ? AND receipt = ? AND state = 'claimed'",
+            ("pending" if retry else "failed", error, now + self.retry_delay * task["attempts"], now, retry,
+             task["job_id"], task["task_id"], task["receipt"])
+        )
+        return retry
+
+    def finished_since(self, job_id: str, after_seq: int = 0) -> Tuple[int, Dict[str, Tuple[Dict[str, Any], Optional[Any]]]]:
+        """완료 순번이 after_seq보다 큰 끝난 작업(완료 또는 최종 실패)의 (입력, 결과)를 작업 ID별로 반환합니다.
+
+        다음 조회에 넘길 마지막 완료 순번을 함께 반환합니다. 실패한 작업의 결과는 None입니다.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT task_id, payload, state, result, finished_seq FROM tasks "
+                "WHERE job_id = ? AND finished_seq > ? ORDER BY finished_seq",
+                (job_id, after_seq)
+            ).fetchall()
+        finished = {task_id: (json.loads(payload), json.loads(result) if state == "done" else None)
+                    for task_id, payload, state, result, _ in rows}
+        return (rows[-1][4] if rows else after_seq), finished
+
+    def last_activity(self, job_id: str) -> Optional[float]:
+        """작업의 작업들이 마지막으로 추가, 수집, 완료 또는 실패한 시각을 반환합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(updated_at) FROM tasks WHERE job_id = ?", (job_id,)).fetchone()
+        return row[0]
+
+    def progress(self, job_id: Optional[str] = None) -> Dict[str, int]:
+        """상태별 작업 수와 재시도 횟수를 반환합니다. job_id를 지정하지 않으면 큐 전체를 집계합니다."""
+        where, params = ("WHERE job_id = ?", (job_id,)) if job_id else ("", ())
+        with self._lock:
+            rows = self._conn.execute(f"SELECT state, COUNT(*), SUM(MAX(attempts - 1, 0)) FROM tasks {where} "
+                                      f"GROUP BY state", params).fetchall()
+        progress = {"pending": 0, "claimed": 0, "done": 0, "failed": 0, "retries": 0}
+        for state, count, retries in rows:
+            progress[state] = count
+            progress["retries"] += retries or 0
+        progress["total"] = progress["pending"] + progress["claimed"] + progress["done"] + progress["failed"]
+        return progress
+
+    def job_ids(self) -> List[str]:
+        """큐에 있는 작업 ID 목록을 생성 순서대로 반환합니다."""
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT job_id FROM jobs ORDER BY created_at")]
+
+    def close(self):
+        """데이터베이스 연결을 닫습니다."""
+        with self._lock:
+            self._conn.close()
+
+class PartialPackageWriter:
+    """변경된 파트만 다시 직렬화하고 나머지 ZIP 항목은 원본의 압축 데이터를 그대로 복사하는 PPTX 저장기
+
+    압축 데이터 원시 복사는 zipfile의 비공개 내부 상태를 사용하므로 검증한 Python 버전에서 필요한 속성이 모두 있을 때만
+    사용하고, 그 밖의 환경에서는 공개 API로 항목을 풀어 같은 압축 방식으로 다시 압축합니다.
+    """
+
+    CHUNK_SIZE = 1024 * 1024
+    LOCAL_HEADER_SIZE = 30
+    DATA_DESCRIPTOR_FLAG = 0x08
+    ZIP64_EXTRA_ID = 0x0001
+    # 원시 복사가 의존하는 zipfile 내부 구현을 확인한 Python 버전 범위 (양 끝 포함)
+    RAW_COPY_PYTHON_VERSIONS = ((3, 8), (3, 13))
+    RAW_COPY_ZIPFILE_ATTRS = ("fp", "filelist", "NameToInfo", "start_dir", "_didModify")
+
+    def __init__(self, source_path: str):
+        self.source_path = source_path
+        self.copied_members = 0
+        self.recompressed_members = 0
+        self.rewritten_members = 0
+
+    @classmethod
+    def raw_copy_supported(cls, target: zipfile.ZipFile) -> bool:
+        """현재 Python의 zipfile 내부 구현이 원시 복사에 필요한 형태인지 확인합니다."""
+        low, high = cls.RAW_COPY_PYTHON_VERSIONS
+        if not low <= sys.version_info[:2] <= high:
+            return False
+        return (all(hasattr(target, attr) for attr in cls.RAW_COPY_ZIPFILE_ATTRS) and
+                callable(getattr(zipfile.ZipInfo, "FileHeader", None)))
+
+    def member_names(self) -> List[str]:
+        """원본 패키지의 ZIP 항목 이름 목록을 반환합니다."""
+        with zipfile.ZipFile(self.source_path) as source:
+            return source.namelist()
+
+    def read_member(self, name: str) -> bytes:
+        """원본 패키지에서 ZIP 항목 하나를 읽습니다."""
+        with zipfile.ZipFile(self.source_path) as source:
+            return source.read(name)
+
+    def write(self, output_path: str, replacements: Dict[str, bytes]) -> None:
+        """replacements에 있는 항목만 새로 압축하고 나머지는 원본 바이트를 복사하여 저장합니다.
+
+        원본과 같은 경로에 저장할 수 있도록 임시 파일에 쓴 뒤 교체합니다.
+        """
+        missing = set(replacements) - set(self.member_names())
+        if missing:
+            raise ValueError(f"원본 패키지에 없는 파트입니다: {sorted(missing)}")
+        
+        temp_path = f"{output_path}.tmp"
+        try:
+            with open(self.source_path, 'rb') as source_fp, zipfile.ZipFile(source_fp) as source, \
+                    zipfile.ZipFile(temp_path, 'w', zipfile.ZIP_DEFLATED) as target:
+                raw_copy = self.raw_copy_supported(target)
+                if not raw_copy:
+                    logger.debug("이 Python 버전에서는 ZIP 원시 복사를 사용할 수 없어 항목을 다시 압축합니다")
+                for info in source.infolist():
+                    if info.filename in replacements:
+                        self._write_member(target, info, replacements[info.filename])
+                    elif raw_copy:
+                        self._copy_raw(source_fp, target, info)
+                    else:
+                        self._copy_recompressed(source, target, info)
+            os.replace(temp_path, output_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def _write_member(self, target: zipfile.ZipFile, info: zipfile.ZipInfo, data: bytes) -> None:
+        """변경된 파트를 원본 항목의 이름과 시각을 유지한 채 새로 압축하여 기록합니다."""
+        new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        new_info.compress_type = zipfile.ZIP_DEFLATED
+        new_info.external_attr = info.external_attr
+        target.writestr(new_info, data)
+        self.rewritten_members += 1
+
+    def _copy_recompressed(self, source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+        """공개 API만 사용하여 원본 항목을 풀고 같은 이름, 시각, 압축 방식으로 다시 압축합니다."""
+        new_info = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+        new_info.compress_type = info.compress_type
+        new_info.external_attr = info.external_attr
+        new_info.file_size = info.file_size
+        with source.open(info) as source_member, \
+                target.open(new_info, 'w', force_zip64=info.file_size > zipfile.ZIP64_LIMIT) as target_member:
+            shutil.copyfileobj(source_member, target_member, self.CHUNK_SIZE)
+        self.recompressed_members += 1
+
+    def _copy_raw(self, source_fp, target: zipfile.ZipFile, info: zipfile.ZipInfo) -> None:
+        """압축을 풀지 않고 원본 항목의 압축 데이터를 그대로 대상 ZIP에 복사합니다."""
+        # 로컬 헤더의 파일 이름/추가 필드 길이는 중앙 디렉터리와 다를 수 있으므로 직접 읽습니다
+        source_fp.seek(info.header_offset)
+        header = source_fp.read(self.LOCAL_HEADER_SIZE)
+        name_length, extra_length = struct.unpack('<HH', header[26:30])
+        data_offset = info.header_offset + self.LOCAL_HEADER_SIZE + name_length + extra_length
+        
+        new_info = copy.copy(info)
+        # 크기와 CRC를 로컬 헤더에 기록하므로 데이터 디스크립터는 생략합니다
+        new_info.flag_bits &= ~self.DATA_DESCRIPTOR_FLAG
+        new_info.extra = self._strip_zip64_extra(info.extra)
+        new_info.header_offset = target.fp.tell()
+        zip64 = info.file_size > zipfile.ZIP64_LIMIT or info.compress_size > zipfile.ZIP64_LIMIT
+        target.fp.write(new_info.FileHeader(zip64))
+        
+        source_fp.seek(data_offset)
+        remaining = info.compress_size
+        while remaining > 0:
+            chunk = source_fp.read(min(self.CHUNK_SIZE, remaining))
+            if not chunk:
+                raise ValueError(f"ZIP 항목 데이터가 잘렸습니다: {info.filename}")
+            target.fp.write(chunk)
+            remaining -= len(chunk)
+        
+        # zipfile은 공개 API로 원시 복사를 지원하지 않으므로 중앙 디렉터리 정보를 직접 등록합니다
+        target.filelist.append(new_info)
+        target.NameToInfo[new_info.filename] = new_info
+        target.start_dir = target.fp.tell()
+        target._didModify = True
+        self.copied_members += 1
+
+    @classmethod
+    def _strip_zip64_extra(cls, extra: bytes) -> bytes:
+        """추가 필드에서 ZIP64 항목을 제거합니다 (필요하면 zipfile이 다시 기록합니다)."""
+        result = b''
+        position = 0
+        while position + 4 <= len(extra):
+            header_id, size = struct.unpack('<HH', extra[position:position + 4])
+            if header_id != cls.ZIP64_EXTRA_ID:
+                result += extra[position:position + 4 + size]
+            position += 4 + size
+        return result
+
+class SeekableMmap(mmap.mmap):
+    """zipfile이 요구하는 seekable()을 제공하는 읽기 전용 메모리 맵 (Python 3.13 미만 호환)"""
+
+    def seekable(self) -> bool:
+        return True
+
+class LazySlide:
+    """방문할 때만 XML을 파싱하고 사용 후 트리를 해제하는 텍스트 전용 슬라이드"""
+
+    def __init__(self, package: 'LazyPresentationPackage', partname: str, slide_id: Optional[int]):
+        self.package = package
+        self.partname = partname
+        self.slide_id = slide_id
+        self.element = None
+        self._charts: Dict[str, Any] = {}
+
+    def open(self):
+        """슬라이드 XML을 파싱합니다 (차트 파트는 요청될 때 파싱)."""
+        self.element = self.package.read_xml(self.partname)
+        self._charts = {}
+        return self.element
+
+    def chart_partname(self, rId: str) -> Optional[str]:
+        """관계 ID에 해당하는 차트 파트 이름을 반환합니다."""
+        return self.package.related_partnames(self.partname).get(rId)
+
+    def resolve_chart(self, rId: str):
+        """관계 ID로 차트 파트를 파싱하여 c:chartSpace 요소를 반환합니다."""
+        partname = self.chart_partname(rId)
+        if partname is None:
+            return None
+        if partname not in self._charts:
+            self._charts[partname] = self.package.read_xml(partname)
+        return self._charts[partname]
+
+    def parsed_charts(self) -> List[Tuple[str, Any]]:
+        """지금까지 파싱된 (차트 파트 이름, c:chartSpace 요소) 목록을 반환합니다."""
+        return list(self._charts.items())
+
+    def serialize(self, partname: Optional[str] = None) -> bytes:
+        """슬라이드 또는 파싱된 차트 파트를 python-pptx와 같은 형식으로 직렬화합니다."""
+        if partname is None or partname == self.partname:
+            return serialize_part_xml(self.element)
+        return serialize_part_xml(self._charts[partname])
+
+    def release(self):
+        """파싱한 슬라이드와 차트 트리를 해제합니다."""
+        self.element = None
+        self._charts = {}
+
+class LazyPresentationPackage:
+    """이미지/미디어 파트를 메모리에 올리지 않고 슬라이드 XML만 필요할 때 파싱하는 텍스트 전용 패키지
+
+    ZIP 파일은 가능하면 메모리 맵으로 열고, 슬라이드 순서와 관계 정보만 미리 읽어 둡니다.
+    """
+
+    OFFICE_DOCUMENT_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+    SLIDE_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/slide"
+    _slide_ids = etree.XPath("./p:sldIdLst/p:sldId", namespaces=XPathTextExtractor.NAMESPACES)
+    R_ID = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'rb')
+        self._mmap = None
+        try:
+            self._mmap = SeekableMmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # 빈 파일이나 메모리 맵을 지원하지 않는 파일 시스템은 일반 파일로 읽습니다
+            self._mmap = None
+        try:
+            self._zip = zipfile.ZipFile(self._mmap if self._mmap is not None else self._file)
+            self._rels_cache: Dict[str, Dict[str, str]] = {}
+            self.slides = self._load_slides()
+        except Exception:
+            self.close()
+            raise
+
+    def _load_slides(self) -> List[LazySlide]:
+        """presentation.xml에서 슬라이드 순서와 ID를 읽습니다."""
+        package_rels = self._read_rels('/', '_rels/.rels')
+        presentation_partname = next(
+            (target for target, reltype in package_rels.values() if reltype == self.OFFICE_DOCUMENT_RELTYPE), None)
+        if presentation_partname is None:
+            raise ValueError("프레젠테이션 파트를 찾을 수 없습니다.")
+        
+        presentation = etree.fromstring(self._zip.read(presentation_partname.lstrip('/')))
+        rels = self._part_rels(presentation_partname)
+        slides = []
+        for sldId in self._slide_ids(presentation):
+            partname, reltype = rels.get(sldId.get(self.R_ID), (None, None))
+            if partname is not None and reltype == self.SLIDE_RELTYPE:
+                slides.append(LazySlide(self, partname, int(sldId.get("id"))))
+        return slides
+
+    def _read_rels(self, base_uri: str, rels_member: str) -> Dict[str, Tuple[str, str]]:
+        """관계 파일을 읽어 관계 ID별 (대상 파트 이름, 관계 유형)을 반환합니다."""
+        if rels_member not in self._zip.NameToInfo:
+            return {}
+        rels = {}
+        for rel in etree.fromstring(self._zip.read(rels_member)):
+            if rel.get('TargetMode') == 'External':
+                continue
+            rels[rel.get('Id')] = (str(PackURI.from_rel_ref(base_uri, rel.get('Target'))), rel.get('Type'))
+        return rels
+
+    def _part_rels(self, partname: str) -> Dict[str, Tuple[str, str]]:
+        if partname not in self._rels_cache:
+            uri = PackURI(partname)
+            self._rels_cache[partname] = self._read_rels(uri.baseURI, uri.rels_uri.membername)
+        return self._rels_cache[partname]
+
+    def related_partnames(self, partname: str) -> Dict[str, str]:
+        """파트의 관계 ID별 대상 파트 이름을 반환합니다."""
+        return {rId: target for rId, (target, _) in self._part_rels(partname).items()}
+
+    def read_xml(self, partname: str):
+        """파트 XML을 python-pptx 요소 클래스로 파싱합니다."""
+        return parse_xml(self._zip.read(partname.lstrip('/')))
+
+    def close(self):
+        """ZIP 파일과 메모리 맵을 닫습니다."""
+        for resource in (getattr(self, '_zip', None), self._mmap, self._file):
+            if resource is not None:
+                try:
+                    resource.close()
+                except Exception:
+                    pass
+        self._zip = None
+        self._mmap = None
+        self._file = None
+
+def peak_memory_mb() -> Optional[float]:
+    """현재 프로세스의 최대 상주 메모리(MB)를 반환합니다 (지원하지 않는 플랫폼에서는 None)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위로 보고합니다
+    divisor = 1024 * 1024 if sys.platform == 'darwin' else 1024
+    return round(peak / divisor, 1)
+
+class PowerPointTranslatorImproved:
+    def __init__(self, max_workers: int = 4, batch_mode: bool = False,
+                 batch_token_budget: int = 1000, batch_max_segments: int = 40,
+                 cache_path: Optional[str] = DEFAULT_CACHE_PATH,
+                 requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None,
+                 max_retries: int = 8, backend=None, streaming: bool = False,
+                 stream_min_tokens: int = 500, extraction_engine: str = "pptx",
+                 partial_save: bool = True, lazy_loading: bool = False, apply_engine: str = "xml",
+                 write_report: bool = False, checkpoint: bool = False, model_id: str = DEFAULT_MODEL_ID,
+                 small_model_id: Optional[str] = None, small_model_max_tokens: int = 40,
+                 small_model_max_lines: int = 1, max_output_tokens: int = 4000, dynamic_max_tokens: bool = True,
+                 prefilter: bool = True, prefilter_rules: Optional[List[str]] = None,
+                 chunk_tokens: Optional[int] = None, prompt_caching: bool = False,
+                 glossary_path: Optional[str] = None):
+        # 동시에 진행할 수 있는 최대 번역 요청 수 (1이면 순차 처리)
+        self.max_workers = max(1, max_workers)
+        
+        # 번역 백엔드 설정 (기본값: 동시 요청 수에 맞춰 연결 풀을 키운 Amazon Bedrock 클라이언트)
+        self.backend = backend or BedrockBackend(region_name='us-west-2', pool_size=max(10, self.max_workers * 2))
+        self.model_id = model_id
+        
+        # 모델 라우팅: 짧고 단순한 세그먼트(추정 토큰 수와 줄 수가 기준 이하)만 묶인 요청은 경량 모델로 보냅니다
+        self.small_model_id = small_model_id
+        self.small_model_max_tokens = small_model_max_tokens
+        self.small_model_max_lines = small_model_max_lines
+        
+        # 응답 최대 토큰 수: 원문 길이와 대상 언어로 요청마다 계산하며 max_output_tokens를 넘지 않습니다
+        self.max_output_tokens = max_output_tokens
+        self.dynamic_max_tokens = dynamic_max_tokens
+        
+        # 사전 필터: 숫자, 날짜, URL, 코드, 이미 대상 언어인 텍스트 등은 모델을 호출하지 않고 그대로 유지
+        self.segment_filter = SegmentFilter(prefilter_rules) if prefilter else None
+        
+        # 분할 번역: 추정 토큰 수가 chunk_tokens를 넘는 세그먼트는 단락/문장 경계에서 나누어 병렬로 번역
+        self.chunk_tokens = chunk_tokens
+        self._chunk_executor = None
+        self._chunk_executor_lock = threading.Lock()
+        
+        # 프롬프트 캐시: 지시문과 용어집으로 된 고정 접두부를 시스템 블록에 두고 Bedrock cache_control로 표시
+        self.prompt_caching = prompt_caching
+        # 모든 프레젠테이션에 적용할 용어집 파일 (없으면 "<파일명>.glossary.json|.txt"를 찾아 사용)
+        self.glossary_path = glossary_path
+        
+        # 입력이 긴 배치/다국어 요청은 응답 스트림으로 받아 완성된 세그먼트를 도착하는 대로 파싱합니다
+        # (응답이 끊기거나 해석할 수 없어도 받은 세그먼트는 유지하고 나머지만 다시 요청)
+        self.streaming = streaming
+        self.stream_min_tokens = stream_min_tokens
+        
+        # 텍스트 추출 엔진: "pptx"(python-pptx 객체 순회) 또는 "xpath"(슬라이드 XML 직접 조회)
+        if extraction_engine not in ("pptx", "xpath"):
+            raise ValueError(f"지원하지 않는 추출 엔진입니다: {extraction_engine}")
+        self.extraction_engine = extraction_engine
+        self.xpath_extractor = XPathTextExtractor()
+        
+        # 번역 적용 엔진: "xml"(단락 서브트리를 한 번에 교체) 또는 "pptx"(python-pptx 객체로 단락/Run 재구성)
+        if apply_engine not in ("pptx", "xml"):
+            raise ValueError(f"지원하지 않는 적용 엔진입니다: {apply_engine}")
+        self.apply_engine = apply_engine
+        
+        # 부분 저장: 번역이 적용된 파트만 다시 직렬화하고 나머지 ZIP 항목은 원본 바이트를 복사
+        self.partial_save = partial_save
+        
+        # 지연 로딩: 미디어 파트를 읽지 않고 슬라이드 XML만 방문할 때 파싱 (항상 XPath 추출 엔진 사용)
+        self.lazy_loading = lazy_loading
+        
+        # 계측: 번역기 전체 요청 측정값 (실행별 측정값도 여기에 합산되며, 실행 밖의 요청은 여기에만 기록)
+        self.metrics = RunMetrics()
+        # 실행 보고서: 번역이 끝나면 출력 파일 옆에 JSON 보고서를 저장
+        self.write_report = write_report
+        # 체크포인트: 번역 결과를 도착 즉시 저널에 기록하고, 중단된 실행은 다음 실행에서 이어서 진행
+        self.checkpoint = checkpoint
+        
+        # 배치 모드: 여러 세그먼트를 토큰 예산 내에서 한 번의 요청으로 번역
+        self.batch_mode = batch_mode
+        self.batch_token_budget = batch_token_budget
+        self.batch_max_segments = batch_max_segments
+        
+        # 번역 메모리 캐시 (cache_path=None이면 메모리 캐시만 사용)
+        self.cache = TranslationCache(cache_path)
+        
+        # 모든 작업자가 공유하는 적응형 요청 스케줄러 (서비스 할당량 준수)
+        self.max_retries = max_retries
+        self.rate_limiter = AdaptiveRateLimiter(
+            max_concurrency=self.max_workers,
+            requests_per_minute=requests_per_minute,
+            tokens_per_minute=tokens_per_minute
         )
-        self.model_id = "us.anthropic.claude-3-5-sonnet-20240620-v1:0"
         
         # 지원하는 언어 목록
         self.supported_languages = {
@@ -88,6 +2084,16 @@ class PowerPointTranslatorImproved:
             'pt': '포르투갈어',
             'ru': '러시아어'
         }
+    @property
+    def bedrock_client(self):
+        """기본 Bedrock 백엔드의 boto3 클라이언트 (하위 호환용)"""
+        return getattr(self.backend, 'client', None)
+    def run_metrics(self) -> RunMetrics:
+        """현재 번역 실행의 계측 객체를 반환합니다 (실행 밖이면 번역기 전체 측정값)."""
+        return current_run_metrics.get() or self.metrics
+    def submit(self, executor: ThreadPoolExecutor, fn, *args) -> Future:
+        """현재 실행의 계측 컨텍스트를 유지한 채 작업을 실행기에 제출합니다."""
+        return executor.submit(contextvars.copy_context().run, fn, *args)
     def extract_run_format(self, run) -> RunFormat:
         """Run의 서식 정보를 추출합니다."""
         try:
@@ -111,7 +2117,7 @@ class PowerPointTranslatorImproved:
                             b = rgb_int & 0xFF
                             font_color_rgb = (r, g, b)
             except Exception as color_error:
-                print(f"      색상 추출 중 오류 (무시됨): {str(color_error)}")
+                logger.debug(f"      색상 추출 중 오류 (무시됨): {str(color_error)}")
                 font_color_rgb = None
             
             # 폰트 크기 추출 (개선된 방식)
@@ -120,7 +2126,7 @@ class PowerPointTranslatorImproved:
                 if font.size is not None:
                     font_size_pt = font.size.pt
             except Exception as size_error:
-                print(f"      폰트 크기 추출 중 오류 (무시됨): {str(size_error)}")
+                logger.debug(f"      폰트 크기 추출 중 오류 (무시됨): {str(size_error)}")
             
             return RunFormat(
                 font_name=font.name,
@@ -128,19 +2134,16 @@ class PowerPointTranslatorImproved:
                 font_bold=font.bold,
                 font_italic=font.italic,
                 font_underline=font.underline,
-                font_color_rgb=font_color_rgb,
-                text_length=len(run.text)
+                font_color_rgb=font_color_rgb
             )
         except Exception as e:
-            print(f"    Run 서식 추출 중 오류: {str(e)}")
-            return RunFormat(text_length=len(run.text) if hasattr(run, 'text') else 0)
+            logger.warning(f"    Run 서식 추출 중 오류: {str(e)}")
+            return RunFormat()
     
-    def extract_paragraph_format(self, paragraph) -> ParagraphFormat:
-        """단락의 서식 정보를 추출합니다."""
+    def extract_paragraph_format(self, paragraph, styles: StyleTable) -> ParagraphFormat:
+        """단락의 서식 정보를 추출합니다 (Run 서식은 스타일 테이블에 등록)."""
         try:
-            runs_format = []
-            for run in paragraph.runs:
-                runs_format.append(self.extract_run_format(run))
+            runs_format = tuple(styles.intern_run(self.extract_run_format(run)) for run in paragraph.runs)
             
             return ParagraphFormat(
                 alignment=paragraph.alignment,
@@ -151,17 +2154,15 @@ class PowerPointTranslatorImproved:
                 runs=runs_format
             )
         except Exception as e:
-            print(f"    단락 서식 추출 중 오류: {str(e)}")
-            return ParagraphFormat(runs=[])
+            logger.warning(f"    단락 서식 추출 중 오류: {str(e)}")
+            return ParagraphFormat()
     
-    def extract_text_frame_template(self, text_frame) -> TextFrameTemplate:
+    def extract_text_frame_template(self, text_frame, styles: StyleTable) -> TextFrameTemplate:
         """텍스트 프레임의 템플릿 정보를 추출합니다."""
         try:
-            paragraphs_format = []
             original_text = text_frame.text
-            
-            for paragraph in text_frame.paragraphs:
-                paragraphs_format.append(self.extract_paragraph_format(paragraph))
+            paragraphs_format = tuple(styles.intern_paragraph(self.extract_paragraph_format(paragraph, styles))
+                                      for paragraph in text_frame.paragraphs)
             
             return TextFrameTemplate(
                 original_text=original_text,
@@ -171,16 +2172,43 @@ class PowerPointTranslatorImproved:
                 margin_top=text_frame.margin_top.pt if text_frame.margin_top else None,
                 margin_bottom=text_frame.margin_bottom.pt if text_frame.margin_bottom else None,
                 word_wrap=text_frame.word_wrap,
-                auto_size=text_frame.auto_size
+                auto_size=text_frame.auto_size,
+                styles=styles
             )
         except Exception as e:
-            print(f"    텍스트 프레임 템플릿 추출 중 오류: {str(e)}")
+            logger.warning(f"    텍스트 프레임 템플릿 추출 중 오류: {str(e)}")
             return TextFrameTemplate(
                 original_text=text_frame.text if hasattr(text_frame, 'text') else "",
-                paragraphs=[]
+                paragraphs=(),
+                styles=styles
             )
-    def extract_text_elements_from_slide(self, slide) -> List[TextElement]:
-        """슬라이드에서 텍스트 요소와 서식 템플릿을 추출합니다."""
+    def extract_text_elements_from_slide_xpath(self, slide, styles: Optional[StyleTable] = None) -> List[TextElement]:
+        """XPath 추출 엔진으로 슬라이드의 텍스트 요소와 서식 템플릿을 추출합니다."""
+        slide_part = slide.part
+        
+        def resolve_chart(rId):
+            return slide_part.related_part(rId)._element
+        
+        return self.xpath_extractor.extract(slide._element, slide.slide_id, resolve_chart, styles)
+    def extract_text_elements_from_lazy_slide(self, slide: LazySlide,
+                                              styles: Optional[StyleTable] = None) -> List[TextElement]:
+        """지연 로딩 슬라이드의 XML을 파싱하여 텍스트 요소를 추출하고 트리를 바로 해제합니다."""
+        try:
+            return self.xpath_extractor.extract(slide.open(), slide.slide_id, slide.resolve_chart, styles)
+        finally:
+            slide.release()
+    def extract_text_elements_from_slide(self, slide, styles: Optional[StyleTable] = None) -> List[TextElement]:
+        """슬라이드에서 텍스트 요소와 서식 템플릿을 추출합니다.
+
+        styles를 전달하면 서식이 프레젠테이션 단위 스타일 테이블에 등록되어 슬라이드 간에 공유됩니다.
+        """
+        if styles is None:
+            styles = StyleTable()
+        if isinstance(slide, LazySlide):
+            return self.extract_text_elements_from_lazy_slide(slide, styles)
+        if self.extraction_engine == "xpath":
+            return self.extract_text_elements_from_slide_xpath(slide, styles)
+        
         text_elements = []
         
         for shape_idx, shape in enumerate(slide.shapes):
@@ -188,153 +2216,607 @@ class PowerPointTranslatorImproved:
                 # 1. 일반 도형의 텍스트 처리
                 if hasattr(shape, "text_frame") and shape.text_frame and shape.text_frame.text.strip():
                     text = shape.text_frame.text.strip()
-                    template = self.extract_text_frame_template(shape.text_frame)
+                    template = self.extract_text_frame_template(shape.text_frame, styles)
                     
                     text_elements.append(TextElement(
                         shape_index=shape_idx,
+                        slide_id=slide.slide_id,
+                        shape_id=shape.shape_id,
                         original_text=text,
                         element_type="shape",
                         template=template
                     ))
-                    print(f"    일반 도형 텍스트 추출: '{text[:30]}...' (shape_idx={shape_idx})")
+                    logger.debug(f"    일반 도형 텍스트 추출: '{text[:30]}...' (shape_idx={shape_idx})")
                 
                 # 2. 그룹화된 도형 처리
                 elif hasattr(shape, "shapes"):
                     for child_idx, child_shape in enumerate(shape.shapes):
                         if hasattr(child_shape, "text_frame") and child_shape.text_frame and child_shape.text_frame.text.strip():
                             text = child_shape.text_frame.text.strip()
-                            template = self.extract_text_frame_template(child_shape.text_frame)
+                            template = self.extract_text_frame_template(child_shape.text_frame, styles)
                             
                             text_elements.append(TextElement(
                                 shape_index=shape_idx,
+                                slide_id=slide.slide_id,
+                                shape_id=shape.shape_id,
                                 original_text=text,
                                 element_type="grouped_shape",
                                 template=template,
                                 child_idx=child_idx
                             ))
-                            print(f"    그룹 내 텍스트 추출: '{text[:30]}...' (shape_idx={shape_idx}, child_idx={child_idx})")
+                            logger.debug(f"    그룹 내 텍스트 추출: '{text[:30]}...' (shape_idx={shape_idx}, child_idx={child_idx})")
                 
                 # 3. 테이블 처리
-                elif isinstance(shape, GraphicFrame) and hasattr(shape, "table"):
+                elif isinstance(shape, GraphicFrame) and shape.has_table:
                     try:
                         table = shape.table
-                        print(f"    테이블 발견 (shape_idx={shape_idx})")
+                        logger.debug(f"    테이블 발견 (shape_idx={shape_idx})")
                         
                         for row_idx, row in enumerate(table.rows):
                             for col_idx, cell in enumerate(row.cells):
                                 if cell.text_frame and cell.text_frame.text.strip():
                                     text = cell.text_frame.text.strip()
-                                    template = self.extract_text_frame_template(cell.text_frame)
+                                    template = self.extract_text_frame_template(cell.text_frame, styles)
                                     
                                     text_elements.append(TextElement(
                                         shape_index=shape_idx,
+                                        slide_id=slide.slide_id,
+                                        shape_id=shape.shape_id,
                                         original_text=text,
                                         element_type="table_cell",
                                         template=template,
                                         row_idx=row_idx,
                                         col_idx=col_idx
                                     ))
-                                    print(f"      테이블 셀 텍스트 추출 [{row_idx},{col_idx}]: '{text[:30]}...'")
+                                    logger.debug(f"      테이블 셀 텍스트 추출 [{row_idx},{col_idx}]: '{text[:30]}...'")
                     except Exception as e:
-                        print(f"      테이블 처리 중 오류: {str(e)}")
+                        logger.warning(f"      테이블 처리 중 오류: {str(e)}")
                 
-                # 4. 차트 제목 처리
-                elif isinstance(shape, GraphicFrame) and hasattr(shape, "chart"):
+                # 4. 차트 제목 처리 (제목이 없는 차트에 빈 제목이 추가되지 않도록 먼저 확인)
+                elif isinstance(shape, GraphicFrame) and shape.has_chart:
                     try:
                         chart = shape.chart
-                        if (hasattr(chart, "chart_title") and chart.chart_title and 
-                            chart.chart_title.text_frame and chart.chart_title.text_frame.text.strip()):
+                        if (chart.has_title and chart.chart_title.has_text_frame and
+                            chart.chart_title.text_frame.text.strip()):
                             text = chart.chart_title.text_frame.text.strip()
-                            template = self.extract_text_frame_template(chart.chart_title.text_frame)
+                            template = self.extract_text_frame_template(chart.chart_title.text_frame, styles)
                             
                             text_elements.append(TextElement(
                                 shape_index=shape_idx,
+                                slide_id=slide.slide_id,
+                                shape_id=shape.shape_id,
                                 original_text=text,
                                 element_type="chart_title",
                                 template=template
                             ))
-                            print(f"    차트 제목 추출: '{text[:30]}...' (shape_idx={shape_idx})")
+                            logger.debug(f"    차트 제목 추출: '{text[:30]}...' (shape_idx={shape_idx})")
                     except Exception as e:
-                        print(f"      차트 처리 중 오류: {str(e)}")
+                        logger.warning(f"      차트 처리 중 오류: {str(e)}")
                 
             except Exception as e:
-                print(f"    도형 {shape_idx} 처리 중 오류: {str(e)}")
+                logger.warning(f"    도형 {shape_idx} 처리 중 오류: {str(e)}")
         
         return text_elements
-    def translate_text(self, text: str, target_language: str, source_language: str = 'auto') -> str:
-        """Amazon Bedrock Claude 3.5 Sonnet을 사용하여 텍스트를 번역합니다."""
-        import time
+    def route_model(self, texts: List[str]) -> str:
+        """번역 단위의 모든 세그먼트가 짧고 단순하면 경량 모델을, 아니면 기본 모델을 반환합니다."""
+        if self.small_model_id and all(
+                segment_tokens(text) <= self.small_model_max_tokens and
+                text.count("\n") + 1 <= self.small_model_max_lines for text in texts):
+            return self.small_model_id
+        return self.model_id
+    def cache_model(self, text: str, model_id: Optional[str] = None) -> str:
+        """번역 캐시 키에 사용할 모델 ID (지정하지 않으면 세그먼트 단독으로 라우팅했을 때의 모델)를 반환합니다.
+
+        용어집을 사용하면 번역 결과가 달라지므로 용어집 지문을 덧붙여 다른 캐시 항목으로 구분합니다.
+        """
+        glossary = current_glossary.get()
+        model_id = model_id or self.route_model([text])
+        return f"{model_id}+glossary:{glossary.fingerprint}" if glossary is not None else model_id
+    def cached_translation(self, text: str, target_language: str) -> Optional[str]:
+        """번역 캐시에서 세그먼트의 번역을 찾습니다. 없으면 None을 반환합니다.
+
+        캐시는 번역을 실제로 만든 모델로 키를 만듭니다. 경량 모델로 라우팅되는 세그먼트도 긴 세그먼트와 같은 배치에 묶이면
+        기본 모델이 번역하므로, 단독 라우팅 모델의 항목이 없으면 기본 모델의 항목을 찾습니다.
+        """
+        routed = self.route_model([text])
+        for model_id in dict.fromkeys((routed, self.model_id)):
+            cached = self.cache.get(self.cache.make_key(text, target_language, self.cache_model(text, model_id)))
+            if cached is not None:
+                return cached
+        return None
+    def has_cached_translation(self, text: str, target_language: str) -> bool:
+        """세그먼트의 번역이 캐시에 있는지 확인합니다 (cached_translation과 같은 순서, 캐시 상태는 바꾸지 않음)."""
+        routed = self.route_model([text])
+        return any(self.cache.contains(self.cache.make_key(text, target_language, self.cache_model(text, model_id)))
+                   for model_id in dict.fromkeys((routed, self.model_id)))
+    def expected_output_tokens(self, text: str, target_language: str) -> int:
+        """원문의 문자 체계별 토큰 수와 대상 언어의 토큰 증가율로 번역문의 토큰 수를 추정합니다."""
+        return int(segment_tokens(text) * TARGET_TOKEN_EXPANSION.get(target_language, 1.2)) + 1
+    def max_tokens_for(self, texts: List[str], target_languages: List[str]) -> int:
+        """요청의 응답 최대 토큰 수를 원문 길이와 언어 쌍으로 계산합니다 (JSON 응답은 세그먼트당 부가 토큰 포함)."""
+        if not self.dynamic_max_tokens:
+            return self.max_output_tokens
+        expected = sum(self.expected_output_tokens(text, lang) for text in texts for lang in target_languages)
+        if len(texts) * len(target_languages) > 1:
+            expected += 8 * len(texts) * len(target_languages)
+        return min(self.max_output_tokens, int(expected * MAX_TOKENS_MARGIN) + MAX_TOKENS_OVERHEAD)
+    def build_request_body(self, prompt: Prompt, max_tokens: int,
+                           prompt_caching: Optional[bool] = None) -> Dict[str, Any]:
+        """Bedrock 요청 본문을 만듭니다.
+
+        프롬프트 캐시를 사용하면 고정 접두부를 cache_control이 붙은 시스템 블록으로 보내
+        이후 요청에서는 캐시된 접두부를 재사용하고 세그먼트 본문만 새로 처리되도록 합니다.
+        """
+        body = {
+            "anthropic_version": "bedrock-2023-05-31",
+            "max_tokens": max_tokens,
+            "messages": [
+                {
+                    "role": "user",
+                    "content": prompt.text
+                }
+            ],
+            "temperature": 0.0
+        }
+        if prompt_caching is None:
+            prompt_caching = self.prompt_caching
+        if prompt_caching and prompt.prefix.strip():
+            body["system"] = [{"type": "text", "text": prompt.prefix.strip(), "cache_control": {"type": "ephemeral"}}]
+            body["messages"][0]["content"] = prompt.body
+        return body
+    def invoke_model(self, prompt: Prompt, max_tokens: Optional[int] = None,
+                     model_id: Optional[str] = None,
+                     stream_parser: Optional[StreamingJSONParser] = None) -> Optional[str]:
+        """Bedrock 모델을 호출하고 응답 텍스트를 반환합니다. 실패 시 None을 반환합니다.
+
+        응답이 max_tokens에서 잘리면 최대 출력 토큰 수로 한 번 더 요청합니다.
+        stream_parser를 전달하고 스트리밍 조건을 만족하면 응답 스트림의 조각을 도착하는 대로 파서에 넘깁니다.
+        """
         import botocore.exceptions
+
+        if isinstance(prompt, str):
+            prompt = Prompt("", prompt)
+        model_id = model_id or self.model_id
+        max_tokens = max_tokens or self.max_output_tokens
         
-        language_names = {
-            'ko': '한국어', 'en': '영어', 'ja': '일본어', 'zh': '중국어',
-            'fr': '프랑스어', 'de': '독일어', 'es': '스페인어', 'it': '이탈리아어',
-            'pt': '포르투갈어', 'ru': '러시아어'
-        }
+        # 토큰 할당량은 입력 토큰과 최대 출력 토큰 기준으로 예약하고 응답 후 실제 사용량으로 보정합니다
+        estimated_tokens = self.estimate_tokens(prompt.text) + max_tokens
         
-        target_lang_name = language_names.get(target_language, target_language)
+        metrics = self.run_metrics()
+        for attempt in range(self.max_retries):
+            self.rate_limiter.acquire(estimated_tokens)
+            throttled = False
+            truncated = False
+            actual_tokens = None
+            start = time.perf_counter()
+            try:
+                body = self.build_request_body(prompt, max_tokens)
+                
+                if (stream_parser is not None and self.streaming and
+                        estimated_tokens - max_tokens >= self.stream_min_tokens):
+                    stream_parser.start()
+                    response_body = self.backend.invoke_stream(model_id, body, stream_parser.feed)
+                else:
+                    response_body = self.backend.invoke(model_id, body)
+                usage = response_body.get('usage', {})
+                if usage:
+                    actual_tokens = usage.get('input_tokens', 0) + usage.get('output_tokens', 0)
+                metrics.record_request(model_id, time.perf_counter() - start, usage)
+                truncated = response_body.get('stop_reason') == 'max_tokens' and max_tokens < self.max_output_tokens
+                if not truncated:
+                    return response_body['content'][0]['text'].strip()
+                
+            except botocore.exceptions.ClientError as e:
+                error_code = e.response.get('Error', {}).get('Code', '')
+                
+                if error_code in ('ThrottlingException', 'TooManyRequestsException') or 'ThrottlingException' in str(e):
+                    throttled = True
+                    metrics.record_failure(model_id, "throttles", time.perf_counter() - start)
+                else:
+                    metrics.record_failure(model_id, "errors", time.perf_counter() - start)
+                    logger.warning(f"  번역 중 오류 발생: {str(e)}")
+                    return None
+            
+            except Exception as e:
+                metrics.record_failure(model_id, "errors", time.perf_counter() - start)
+                logger.warning(f"  번역 중 오류 발생: {str(e)}")
+                return None
+            
+            finally:
+                self.rate_limiter.release(estimated_tokens, actual_tokens, throttled)
+            
+            if truncated:
+                logger.info(f"  응답이 max_tokens({max_tokens})에서 잘려 {self.max_output_tokens}로 다시 요청합니다")
+                return self.invoke_model(prompt, self.max_output_tokens, model_id, stream_parser)
+            
+            if attempt < self.max_retries - 1:
+                wait_time = self.rate_limiter.backoff(attempt)
+                metrics.record_failure(model_id, "retries")
+                logger.info(f"  API 제한으로 인한 오류 발생: {wait_time:.1f}초 후 재시도 ({attempt+1}/{self.max_retries})...")
+                time.sleep(wait_time)
         
-        prompt = f"""다음 텍스트를 {target_lang_name}로 번역해주세요. 
+        self.rate_limiter.record_give_up()
+        metrics.record_failure(model_id, "give_ups")
+        logger.warning(f"  경고: 최대 재시도 횟수({self.max_retries}회) 도달, 원문을 유지합니다")
+        return None
+    def prompt_prefix(self, instructions: str, target_languages: List[str]) -> str:
+        """지시문 뒤에 현재 실행의 용어집을 붙여 호출마다 같은 프롬프트 접두부를 만듭니다."""
+        glossary = current_glossary.get()
+        terms = glossary.format(target_languages) if glossary is not None else ""
+        if terms:
+            instructions += f"\n\n용어집 (아래 용어는 반드시 지정된 번역을 사용):\n{terms}"
+        return instructions + "\n\n"
+    def build_translation_prompt(self, text: str, target_language: str) -> Prompt:
+        """단일 세그먼트 번역 프롬프트를 생성합니다."""
+        target_lang_name = self.supported_languages.get(target_language, target_language)
+        
+        instructions = f"""다음 텍스트를 {target_lang_name}로 번역해주세요. 
 번역할 때 다음 사항을 고려해주세요:
 1. 원문의 의미와 뉘앙스를 정확히 전달
 2. 자연스러운 표현 사용
 3. 전문 용어는 해당 언어의 표준 용어 사용
 4. 고유 명사는 원문 그대로 유지 (예: Amazon Bedrock, Nova, Claude 등)
 5. 서식이나 특수문자는 그대로 유지
-6. 번역된 텍스트만 출력 (설명이나 부가 정보 없이)
-
-번역할 텍스트:
+6. 번역된 텍스트만 출력 (설명이나 부가 정보 없이)"""
+        return Prompt(self.prompt_prefix(instructions, [target_language]), f"""번역할 텍스트:
 {text}
 
-번역:"""
+번역:""")
+    def translate_text(self, text: str, target_language: str, source_language: str = 'auto') -> str:
+        """Amazon Bedrock으로 텍스트를 번역합니다 (모델은 세그먼트 길이에 따라 라우팅)."""
+        translated_text = self.invoke_model(self.build_translation_prompt(text, target_language),
+                                            self.max_tokens_for([text], [target_language]), self.route_model([text]))
+        return translated_text if translated_text is not None else text
+    def estimate_tokens(self, text: str) -> int:
+        """텍스트의 대략적인 토큰 수를 추정합니다 (UTF-8 4바이트당 1토큰)."""
+        return len(text.encode('utf-8')) // 4 + 1
+    def parse_json_object(self, response_text: str) -> Optional[Dict[str, Any]]:
+        """모델 응답에서 JSON 객체를 찾아 파싱합니다. 실패 시 None을 반환합니다."""
+        try:
+            start = response_text.index('{')
+            end = response_text.rindex('}') + 1
+            parsed = json.loads(response_text[start:end])
+        except (ValueError, json.JSONDecodeError):
+            return None
+        return parsed if isinstance(parsed, dict) else None
+    def parse_batch_response(self, response_text: str, count: int) -> Optional[List[str]]:
+        """배치 번역 응답(JSON 객체)을 개별 세그먼트 목록으로 파싱합니다. 실패 시 None을 반환합니다."""
+        parsed = self.parse_json_object(response_text)
+        if parsed is None:
+            return None
+        
+        results = []
+        for i in range(1, count + 1):
+            value = parsed.get(str(i))
+            if not isinstance(value, str):
+                return None
+            results.append(value.strip())
+        return results
+    def translate_batch(self, texts: List[str], target_language: str, allow_chunking: bool = True,
+                        model_id: Optional[str] = None) -> List[Optional[str]]:
+        """여러 세그먼트를 번호가 매겨진 JSON 형식으로 묶어 한 번의 모델 호출로 번역합니다.
 
-        max_retries = 5
-        retry_delay = 5
+        번역에 실패한 세그먼트는 None으로 반환됩니다. model_id를 지정하지 않으면 세그먼트 길이로 라우팅합니다.
+        """
+        return self.translate_batch_routed(texts, target_language, allow_chunking, model_id)[0]
+    def translate_batch_routed(self, texts: List[str], target_language: str, allow_chunking: bool = True,
+                               model_id: Optional[str] = None,
+                               max_tokens: Optional[int] = None) -> Tuple[List[Optional[str]], List[str]]:
+        """translate_batch와 같지만 세그먼트별로 실제 번역에 사용한 모델 ID 목록을 함께 반환합니다.
+
+        응답을 해석하지 못해 배치를 나누면 나뉜 절반마다 다시 라우팅하므로 세그먼트마다 모델이 다를 수 있습니다.
+        model_id와 max_tokens를 지정하면 이 요청에는 라우팅과 응답 토큰 계산 대신 지정한 값을 사용합니다.
+        """
+        if allow_chunking and len(texts) == 1 and self.needs_chunking(texts[0]):
+            return [self.translate_chunked(texts[0], target_language)], [model_id or self.route_model(texts)]
         
-        for attempt in range(max_retries):
-            try:
-                body = {
-                    "anthropic_version": "bedrock-2023-05-31",
-                    "max_tokens": 4000,
-                    "messages": [
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    "temperature": 0.0
-                }
-                
-                response = self.bedrock_client.invoke_model(
-                    modelId=self.model_id,
-                    body=json.dumps(body)
-                )
-                
-                response_body = json.loads(response['body'].read())
-                translated_text = response_body['content'][0]['text'].strip()
-                
-                return translated_text
-                
-            except botocore.exceptions.ClientError as e:
-                error_code = e.response.get('Error', {}).get('Code', '')
-                
-                if error_code == 'ThrottlingException' or 'ThrottlingException' in str(e):
-                    if attempt < max_retries - 1:
-                        wait_time = retry_delay * (attempt + 1)
-                        print(f"  API 제한으로 인한 오류 발생: {wait_time}초 후 재시도 ({attempt+1}/{max_retries})...")
-                        time.sleep(wait_time)
-                    else:
-                        print(f"  최대 재시도 횟수 도달: {str(e)}")
-                        return text
-                else:
-                    print(f"  번역 중 오류 발생: {str(e)}")
-                    return text
-            
-            except Exception as e:
-                print(f"  번역 중 오류 발생: {str(e)}")
-                return text
+        max_tokens = max_tokens or self.max_tokens_for(texts, [target_language])
+        routed_model = model_id or self.route_model(texts)
+        if len(texts) == 1:
+            return [self.invoke_model(self.build_translation_prompt(texts[0], target_language), max_tokens,
+                                      routed_model)], [routed_model]
+        
+        # 스트리밍 응답은 완성된 세그먼트를 도착하는 대로 파싱해 두어 응답이 끊겨도 받은 부분을 살립니다
+        parser = StreamingJSONParser() if self.streaming else None
+        response_text = self.invoke_model(self.build_batch_prompt(texts, target_language), max_tokens, routed_model,
+                                          parser)
+        streamed = self.streamed_segments(parser, len(texts))
+        if response_text is None:
+            # 호출 자체가 실패했으면(재시도 소진, 비스로틀 오류) 분할해도 같은 엔드포인트에 부하만 더하므로
+            # 스트림으로 받은 세그먼트만 사용하고 나머지는 실패로 보고하여 원문을 유지합니다
+            failed = sum(1 for value in streamed if value is None)
+            logger.warning(f"    배치 호출 실패: {failed}개 세그먼트를 원문으로 유지합니다"
+                           f"{f' (스트림으로 받은 {len(texts) - failed}개는 사용)' if failed < len(texts) else ''}")
+            return streamed, [routed_model] * len(texts)
+        results = self.parse_batch_response(response_text, len(texts))
+        if results is not None:
+            return results, [routed_model] * len(texts)
+        
+        missing = [i for i, value in enumerate(streamed) if value is None]
+        if len(missing) < len(texts):
+            # 스트림으로 완성된 세그먼트는 유지하고 나머지만 다시 요청합니다
+            logger.info(f"    배치 응답 파싱 실패: 스트림으로 받은 {len(texts) - len(missing)}개를 유지하고 "
+                        f"{len(missing)}개 세그먼트만 다시 요청합니다")
+            retried, retried_models = self.translate_batch_routed([texts[i] for i in missing], target_language,
+                                                                  model_id=model_id)
+            models = [routed_model] * len(texts)
+            for i, value, retried_model in zip(missing, retried, retried_models):
+                streamed[i] = value
+                models[i] = retried_model
+            return streamed, models
+        
+        # 응답을 해석할 수 없으면 배치를 절반으로 나누어 재시도합니다
+        logger.info(f"    배치 응답 파싱 실패: {len(texts)}개 세그먼트를 분할하여 재시도합니다")
+        middle = len(texts) // 2
+        first, first_models = self.translate_batch_routed(texts[:middle], target_language, model_id=model_id)
+        second, second_models = self.translate_batch_routed(texts[middle:], target_language, model_id=model_id)
+        return first + second, first_models + second_models
+    def streamed_segments(self, parser: Optional[StreamingJSONParser], count: int) -> List[Optional[str]]:
+        """스트림 파서가 완성한 배치 응답 값을 세그먼트 순서대로 반환합니다 (받지 못한 세그먼트는 None)."""
+        values = parser.values if parser is not None else {}
+        results = []
+        for i in range(1, count + 1):
+            value = values.get(str(i))
+            results.append(value.strip() if isinstance(value, str) else None)
+        return results
+    def build_batch_prompt(self, texts: List[str], target_language: str) -> Prompt:
+        """여러 세그먼트를 번호가 매겨진 JSON 객체로 묶은 배치 번역 프롬프트를 생성합니다."""
+        target_lang_name = self.supported_languages.get(target_language, target_language)
+        segments = {str(i): text for i, text in enumerate(texts, 1)}
+        
+        instructions = f"""다음 JSON 객체의 각 값을 {target_lang_name}로 번역해주세요. 
+번역할 때 다음 사항을 고려해주세요:
+1. 원문의 의미와 뉘앙스를 정확히 전달
+2. 자연스러운 표현 사용
+3. 전문 용어는 해당 언어의 표준 용어 사용
+4. 고유 명사는 원문 그대로 유지 (예: Amazon Bedrock, Nova, Claude 등)
+5. 서식이나 특수문자, 줄바꿈(\\n)은 그대로 유지
+6. 각 값은 독립된 세그먼트이므로 서로 합치거나 나누지 말 것
+7. 입력과 같은 키를 가진 JSON 객체만 출력 (설명이나 부가 정보 없이)"""
+        return Prompt(self.prompt_prefix(instructions, [target_language]), f"""번역할 세그먼트:
+{json.dumps(segments, ensure_ascii=False, indent=0)}
+
+번역 (JSON):""")
+    def needs_chunking(self, text: str) -> bool:
+        """분할 번역 모드에서 세그먼트가 한 번의 요청으로 보내기에 너무 큰지 확인합니다."""
+        return bool(self.chunk_tokens) and self.estimate_tokens(text) > self.chunk_tokens
+    def split_sentences(self, line: str) -> List[str]:
+        """한 줄(단락)을 문장 경계에서 나누고, 그래도 chunk_tokens보다 긴 문장은 단어 또는 글자 단위로 나눕니다."""
+        pieces = []
+        for sentence in re.split(r"(?<=[.!?。！？])\s+|(?<=[。！？])", line):
+            if not sentence:
+                continue
+            if self.estimate_tokens(sentence) <= self.chunk_tokens:
+                pieces.append(sentence)
+                continue
+            words = sentence.split(" ") if " " in sentence else list(sentence)
+            separator = " " if " " in sentence else ""
+            current = []
+            for word in words:
+                if current and self.estimate_tokens(separator.join(current + [word])) > self.chunk_tokens:
+                    pieces.append(separator.join(current))
+                    current = []
+                current.append(word)
+            if current:
+                pieces.append(separator.join(current))
+        return pieces
+    def chunk_segments(self, text: str) -> List[List[Tuple[int, str]]]:
+        """큰 세그먼트를 (줄 번호, 조각) 목록의 청크들로 나눕니다.
+
+        줄(단락)은 서식 템플릿의 ParagraphFormat과 1:1로 대응하므로 줄 번호를 유지하며,
+        청크는 토큰 예산 안에서 연속한 조각을 순서대로 묶습니다.
+        """
+        pieces = []
+        for line_idx, line in enumerate(text.split("\n")):
+            if not line.strip():
+                continue
+            if self.estimate_tokens(line) <= self.chunk_tokens:
+                pieces.append((line_idx, line))
+            else:
+                pieces.extend((line_idx, sentence) for sentence in self.split_sentences(line))
+        
+        chunks = []
+        current = []
+        current_tokens = 0
+        for line_idx, piece in pieces:
+            tokens = self.estimate_tokens(piece)
+            if current and current_tokens + tokens > self.chunk_tokens:
+                chunks.append(current)
+                current = []
+                current_tokens = 0
+            current.append((line_idx, piece))
+            current_tokens += tokens
+        if current:
+            chunks.append(current)
+        return chunks
+    def chunk_executor(self) -> ThreadPoolExecutor:
+        """청크 번역 전용 실행기를 반환합니다 (번역 단위 작업자가 청크를 기다리므로 공유 작업 큐와 분리)."""
+        with self._chunk_executor_lock:
+            if self._chunk_executor is None:
+                self._chunk_executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="chunk")
+            return self._chunk_executor
+    def translate_chunked(self, text: str, target_language: str) -> Optional[str]:
+        """큰 세그먼트를 청크로 나누어 병렬로 번역한 뒤 원래 줄 구조대로 다시 조립합니다.
+
+        한 청크 안의 조각들은 번호가 매겨진 JSON 배치로 번역되어 각 조각이 원래 줄 번호에 대응합니다.
+        하나라도 실패하면 None을 반환하여 원문을 유지합니다.
+        """
+        chunks = self.chunk_segments(text)
+        logger.debug(f"    분할 번역: {self.estimate_tokens(text)}토큰 세그먼트를 {len(chunks)}개 청크로 나눕니다")
+        # 한 세그먼트의 청크는 모두 세그먼트 전체로 라우팅한 모델로 번역하여 결과를 한 모델의 번역으로 캐시합니다
+        model_id = self.route_model([text])
+        
+        def translate_chunk(chunk):
+            return self.translate_batch([piece for _, piece in chunk], target_language, allow_chunking=False,
+                                        model_id=model_id)
+        
+        if self.max_workers <= 1 or len(chunks) <= 1:
+            results = [translate_chunk(chunk) for chunk in chunks]
+        else:
+            executor = self.chunk_executor()
+            results = [future.result() for future in
+                       [self.submit(executor, translate_chunk, chunk) for chunk in chunks]]
+        
+        # 같은 줄에서 나온 문장 조각은 공백으로(일본어/중국어는 공백 없이) 이어 붙입니다
+        separator = "" if target_language in ("ja", "zh") else " "
+        lines: List[List[str]] = [[] for _ in text.split("\n")]
+        for chunk, translations in zip(chunks, results):
+            for (line_idx, _), translated in zip(chunk, translations):
+                if translated is None:
+                    return None
+                lines[line_idx].append(translated)
+        return "\n".join(separator.join(parts) for parts in lines)
+    def translate_text_multi(self, text: str, target_languages: List[str]) -> Dict[str, Optional[str]]:
+        """하나의 세그먼트를 여러 언어로 한 번의 모델 호출에서 번역합니다.
+
+        응답에서 누락된 언어는 단일 언어 프롬프트로 다시 번역하며, 실패한 언어는 None으로 반환됩니다.
+        """
+        if self.needs_chunking(text):
+            return {code: self.translate_chunked(text, code) for code in target_languages}
         
-        return text
+        model_id = self.route_model([text])
+        if len(target_languages) == 1:
+            return {target_languages[0]: self.invoke_model(self.build_translation_prompt(text, target_languages[0]),
+                                                           self.max_tokens_for([text], target_languages), model_id)}
+        
+        results: Dict[str, Optional[str]] = {}
+        parser = StreamingJSONParser() if self.streaming else None
+        response_text = self.invoke_model(self.build_multi_prompt(text, target_languages),
+                                          self.max_tokens_for([text], target_languages), model_id, parser)
+        # 전체 응답을 해석할 수 없으면 스트림으로 완성된 언어만 사용하고 나머지는 개별 요청으로 재시도합니다
+        parsed = (self.parse_json_object(response_text) if response_text is not None else None) or \
+            (parser.values if parser is not None else None)
+        for code in target_languages:
+            value = parsed.get(code) if parsed else None
+            results[code] = value.strip() if isinstance(value, str) else None
+        
+        missing = [code for code, value in results.items() if value is None]
+        if missing:
+            logger.info(f"    다국어 응답에서 {missing} 번역을 찾지 못해 개별 요청으로 재시도합니다")
+            for code in missing:
+                results[code] = self.invoke_model(self.build_translation_prompt(text, code),
+                                                  self.max_tokens_for([text], [code]), model_id)
+        return results
+    def build_multi_prompt(self, text: str, target_languages: List[str]) -> Prompt:
+        """하나의 세그먼트를 여러 언어로 번역하여 언어 코드별 JSON 객체로 받는 프롬프트를 생성합니다."""
+        language_list = ", ".join(f"{code}({self.supported_languages.get(code, code)})" for code in target_languages)
+        instructions = f"""다음 텍스트를 {language_list}로 각각 번역해주세요. 
+번역할 때 다음 사항을 고려해주세요:
+1. 원문의 의미와 뉘앙스를 정확히 전달
+2. 자연스러운 표현 사용
+3. 전문 용어는 해당 언어의 표준 용어 사용
+4. 고유 명사는 원문 그대로 유지 (예: Amazon Bedrock, Nova, Claude 등)
+5. 서식이나 특수문자, 줄바꿈(\\n)은 그대로 유지
+6. 언어 코드를 키로, 번역문을 값으로 하는 JSON 객체만 출력 (설명이나 부가 정보 없이)"""
+        return Prompt(self.prompt_prefix(instructions, target_languages), f"""번역할 텍스트:
+{text}
+
+번역 (JSON):""")
+    def build_translation_batches(self, text_elements: List[TextElement]) -> List[List[TextElement]]:
+        """텍스트 요소들을 토큰 예산에 맞춰 배치로 묶습니다."""
+        if not self.batch_mode:
+            return [[element] for element in text_elements]
+        
+        batches = []
+        current_batch = []
+        current_tokens = 0
+        for element in text_elements:
+            tokens = self.estimate_tokens(element.original_text)
+            if current_batch and (current_tokens + tokens > self.batch_token_budget or
+                                  len(current_batch) >= self.batch_max_segments):
+                batches.append(current_batch)
+                current_batch = []
+                current_tokens = 0
+            current_batch.append(element)
+            current_tokens += tokens
+        
+        if current_batch:
+            batches.append(current_batch)
+        return batches
+    def translate_unit(self, batch: List[TextElement], target_language: str) -> List[TextElement]:
+        """하나의 번역 단위(단일 요소 또는 배치)를 번역하여 요소에 기록합니다."""
+        try:
+            translations, models = self.translate_batch_routed([element.original_text for element in batch],
+                                                               target_language)
+        except Exception as e:
+            logger.warning(f"    번역 작업 중 오류 발생: {str(e)}")
+            translations, models = [None] * len(batch), [None] * len(batch)
+        
+        for element, translated_text, model_id in zip(batch, translations, models):
+            if translated_text is None:
+                # 실패한 번역은 캐시하지 않고 원문을 유지합니다
+                element.translated_text = element.original_text
+            else:
+                element.translated_text = translated_text
+                element.is_translated = True
+                # 세그먼트 단독 라우팅이 아니라 실제로 번역한 모델로 캐시합니다
+                self.cache.put(self.cache.make_key(element.original_text, target_language,
+                                                   self.cache_model(element.original_text, model_id)), translated_text)
+                self.checkpoint_translation(element, target_language)
+            logger.debug(f"    번역 완료: '{element.original_text[:30]}...' -> '{element.translated_text[:30]}...'")
+        return batch
+    def prepare_translation_units(self, text_elements: List[TextElement], target_language: str) -> List[List[TextElement]]:
+        """빈 텍스트, 사전 필터 대상, 캐시 적중 요소를 처리하고, 모델 호출이 필요한 요소를 번역 단위로 묶어 반환합니다."""
+        pending = []
+        filtered = []
+        reasons: Dict[str, int] = {}
+        cached_count = 0
+        for element in text_elements:
+            if not element.original_text.strip():
+                element.translated_text = element.original_text
+                element.is_translated = True
+                continue
+            
+            # 번역이 필요 없는 세그먼트는 원문을 그대로 사용합니다
+            reason = self.segment_filter.classify(element.original_text, target_language) if self.segment_filter else None
+            if reason is not None:
+                element.translated_text = element.original_text
+                element.is_translated = True
+                reasons[reason] = reasons.get(reason, 0) + 1
+                filtered.append(element)
+                continue
+            
+            # 모델 호출 전에 번역 캐시를 먼저 확인합니다
+            cached = self.cached_translation(element.original_text, target_language)
+            if cached is not None:
+                element.translated_text = cached
+                element.is_translated = True
+                cached_count += 1
+            else:
+                pending.append(element)
+
+        if cached_count:
+            logger.debug(f"    번역 캐시 적중: {cached_count}개 요소")
+
+        batches = self.build_translation_batches(pending)
+        if self.batch_mode and pending:
+            logger.debug(f"    {len(pending)}개 요소를 {len(batches)}개 배치 요청으로 묶었습니다")
+        if filtered:
+            saved_calls = len(self.build_translation_batches(pending + filtered)) - len(batches)
+            self.run_metrics().record_prefilter(reasons, saved_calls)
+            logger.debug(f"    사전 필터: {len(filtered)}개 요소를 번역 없이 유지 ({reasons})")
+        return batches
+    def translate_elements(self, text_elements: List[TextElement], target_language: str,
+                           deduplicator: Optional[SegmentDeduplicator] = None) -> int:
+        """여러 텍스트 요소를 동시 요청 수를 제한하며 병렬로 번역합니다. 동일한 세그먼트는 한 번만 번역합니다."""
+        deduplicator = deduplicator or SegmentDeduplicator()
+        leaders, followers = deduplicator.split(text_elements)
+        batches = self.prepare_translation_units(leaders, target_language)
+
+        # 순차 처리 모드
+        if self.max_workers <= 1 or len(batches) <= 1:
+            for batch in batches:
+                self.translate_unit(batch, target_language)
+        else:
+            # 병렬 처리 모드: 결과는 요소 객체에 직접 기록되므로 완료 순서와 무관하게 올바른 도형에 적용됩니다
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for future in [self.submit(executor, self.translate_unit, batch, target_language) for batch in batches]:
+                    future.result()
+
+        for follower, leader in followers:
+            deduplicator.copy_translation(follower, leader)
+
+        return sum(1 for element in text_elements if element.is_translated)
     def apply_run_format(self, run, run_format: RunFormat):
         """Run에 서식을 적용합니다."""
         try:
@@ -345,35 +2827,35 @@ class PowerPointTranslatorImproved:
                 try:
                     font.name = run_format.font_name
                 except Exception as e:
-                    print(f"        폰트명 적용 실패: {str(e)}")
+                    logger.warning(f"        폰트명 적용 실패: {str(e)}")
             
             # 폰트 크기 적용
             if run_format.font_size:
                 try:
                     font.size = Pt(run_format.font_size)
                 except Exception as e:
-                    print(f"        폰트 크기 적용 실패: {str(e)}")
+                    logger.warning(f"        폰트 크기 적용 실패: {str(e)}")
             
             # 굵기 적용
             if run_format.font_bold is not None:
                 try:
                     font.bold = run_format.font_bold
                 except Exception as e:
-                    print(f"        굵기 적용 실패: {str(e)}")
+                    logger.warning(f"        굵기 적용 실패: {str(e)}")
             
             # 기울임 적용
             if run_format.font_italic is not None:
                 try:
                     font.italic = run_format.font_italic
                 except Exception as e:
-                    print(f"        기울임 적용 실패: {str(e)}")
+                    logger.warning(f"        기울임 적용 실패: {str(e)}")
             
             # 밑줄 적용
             if run_format.font_underline is not None:
                 try:
                     font.underline = run_format.font_underline
                 except Exception as e:
-                    print(f"        밑줄 적용 실패: {str(e)}")
+                    logger.warning(f"        밑줄 적용 실패: {str(e)}")
             
             # 색상 적용 (개선된 방식)
             if run_format.font_color_rgb:
@@ -381,10 +2863,27 @@ class PowerPointTranslatorImproved:
                     r, g, b = run_format.font_color_rgb
                     font.color.rgb = RGBColor(r, g, b)
                 except Exception as e:
-                    print(f"        색상 적용 실패: {str(e)}")
+                    logger.warning(f"        색상 적용 실패: {str(e)}")
                 
         except Exception as e:
-            print(f"      Run 서식 적용 중 전체 오류: {str(e)}")
+            logger.warning(f"      Run 서식 적용 중 전체 오류: {str(e)}")
+    
+    def apply_run_style(self, run, styles: StyleTable, style_id: int):
+        """스타일 테이블의 Run 서식을 적용합니다.
+
+        새로 추가된 Run에는 같은 스타일을 처음 적용했을 때의 a:rPr 결과를 복사하여 재사용합니다.
+        """
+        r = run._r
+        if r.rPr is None:
+            cached = styles.applied_element("rPr", style_id)
+            if cached is not None:
+                r.insert(0, copy.deepcopy(cached))
+                return
+            self.apply_run_format(run, styles.run(style_id))
+            if r.rPr is not None:
+                styles.remember_applied_element("rPr", style_id, copy.deepcopy(r.rPr))
+            return
+        self.apply_run_format(run, styles.run(style_id))
     
     def apply_paragraph_format(self, paragraph, para_format: ParagraphFormat):
         """단락에 서식을 적용합니다."""
@@ -405,7 +2904,7 @@ class PowerPointTranslatorImproved:
                 paragraph.line_spacing = para_format.line_spacing
                 
         except Exception as e:
-            print(f"      단락 서식 적용 중 오류: {str(e)}")
+            logger.warning(f"      단락 서식 적용 중 오류: {str(e)}")
     
     def distribute_text_to_runs(self, translated_text: str, run_formats: List[RunFormat]) -> List[tuple]:
         """번역된 텍스트를 기존 Run 구조에 맞게 분배합니다."""
@@ -444,40 +2943,145 @@ class PowerPointTranslatorImproved:
                 return [(translated_text, run_formats[0])]
                 
         except Exception as e:
-            print(f"      텍스트 분배 중 오류, 단순 방식 사용: {str(e)}")
+            logger.warning(f"      텍스트 분배 중 오류, 단순 방식 사용: {str(e)}")
             # 오류 발생 시 첫 번째 Run 서식으로 모든 텍스트 할당
             return [(translated_text, run_formats[0])]
+    def apply_text_frame_properties(self, text_frame, template: TextFrameTemplate):
+        """템플릿의 텍스트 프레임 속성(여백, 줄 바꿈, 자동 맞춤)을 복원합니다."""
+        try:
+            if template.margin_left is not None:
+                text_frame.margin_left = Pt(template.margin_left)
+            if template.margin_right is not None:
+                text_frame.margin_right = Pt(template.margin_right)
+            if template.margin_top is not None:
+                text_frame.margin_top = Pt(template.margin_top)
+            if template.margin_bottom is not None:
+                text_frame.margin_bottom = Pt(template.margin_bottom)
+            if template.word_wrap is not None:
+                text_frame.word_wrap = template.word_wrap
+            if template.auto_size is not None:
+                text_frame.auto_size = template.auto_size
+        except Exception as e:
+            logger.debug(f"      텍스트 프레임 속성 복원 중 오류 (무시됨): {str(e)}")
+    def apply_text_frame_properties_xml(self, txBody, template: TextFrameTemplate):
+        """apply_text_frame_properties와 같은 속성을 a:bodyPr에 직접 설정합니다."""
+        try:
+            bodyPr = txBody.bodyPr
+            for attribute, value in (("lIns", template.margin_left), ("rIns", template.margin_right),
+                                     ("tIns", template.margin_top), ("bIns", template.margin_bottom)):
+                if value is not None:
+                    setattr(bodyPr, attribute, Pt(value))
+            if template.word_wrap is not None:
+                bodyPr.wrap = "square" if template.word_wrap else "none"
+            if template.auto_size is not None:
+                bodyPr.autofit = template.auto_size
+        except Exception as e:
+            logger.debug(f"      텍스트 프레임 속성 복원 중 오류 (무시됨): {str(e)}")
+    def _run_prototype(self, styles: StyleTable, style_id: int):
+        """Run 서식을 적용한 빈 a:r 원형을 반환합니다 (스타일별로 한 번만 생성)."""
+        prototype = styles.applied_element("r", style_id)
+        if prototype is None:
+            run = _Run(OxmlElement('a:p').add_r(), None)
+            self.apply_run_style(run, styles, style_id)
+            prototype = run._r
+            prototype.getparent().remove(prototype)
+            styles.remember_applied_element("r", style_id, prototype)
+        return prototype
+    def _paragraph_prototype(self, styles: StyleTable, style_id: int):
+        """단락 서식을 적용한 빈 a:p 원형을 반환합니다 (스타일별로 한 번만 생성)."""
+        prototype = styles.applied_element("p", style_id)
+        if prototype is None:
+            prototype = OxmlElement('a:p')
+            self.apply_paragraph_format(_Paragraph(prototype, None), styles.paragraph(style_id))
+            styles.remember_applied_element("p", style_id, prototype)
+        return prototype
+    def _append_line(self, p, line: str, para_format: ParagraphFormat, styles: StyleTable):
+        """단락 요소에 번역된 줄을 첫 번째 Run 서식으로 추가합니다 (Run 서식이 없으면 일반 텍스트)."""
+        if not para_format.runs:
+            _Paragraph(p, None).text = line
+            return
+        r = copy.deepcopy(self._run_prototype(styles, para_format.runs[0]))
+        r.text = line
+        # python-pptx의 add_r와 같이 a:endParaRPr 앞에 추가합니다
+        end = p.find(XPathTextExtractor.A + "endParaRPr")
+        if end is not None:
+            end.addprevious(r)
+        else:
+            p.append(r)
+    def build_translated_paragraphs(self, txBody, translated_text: str, template: TextFrameTemplate) -> List[Any]:
+        """템플릿과 번역된 줄로 교체할 a:p 요소 목록을 한 번에 만듭니다.
+
+        기존 python-pptx 적용 방식과 같은 XML을 생성하며, 원본 텍스트 본문은 변경하지 않습니다.
+        """
+        A = XPathTextExtractor.A
+        styles = template.styles
+        translated_lines = translated_text.split('\n')
+        
+        # 첫 번째 단락은 기존 단락 속성과 필드/줄바꿈을 유지하고 Run만 교체합니다
+        first_p = copy.deepcopy(txBody.find(A + "p"))
+        for r in first_p.findall(A + "r"):
+            first_p.remove(r)
+        paragraphs = [first_p]
+        if translated_lines[0]:
+            first_format = styles.paragraph(template.paragraphs[0])
+            self._append_line(first_p, translated_lines[0], first_format, styles)
+            self.apply_paragraph_format(_Paragraph(first_p, None), first_format)
+        
+        # 나머지 줄은 단락 서식별 원형을 복사하여 새 단락으로 만듭니다
+        for i, line in enumerate(translated_lines[1:], 1):
+            if not line.strip():
+                continue
+            style_id = template.paragraphs[i] if i < len(template.paragraphs) else template.paragraphs[0]
+            p = copy.deepcopy(self._paragraph_prototype(styles, style_id))
+            self._append_line(p, line, styles.paragraph(style_id), styles)
+            paragraphs.append(p)
+        return paragraphs
+    def apply_template_to_text_frame_xml(self, text_frame, translated_text: str, template: TextFrameTemplate):
+        """교체할 단락 서브트리를 미리 만든 뒤 텍스트 본문의 기존 단락과 한 번에 바꿉니다."""
+        txBody = text_frame._txBody
+        new_paragraphs = self.build_translated_paragraphs(txBody, translated_text, template)
+        self.apply_text_frame_properties_xml(txBody, template)
+        
+        old_paragraphs = txBody.findall(XPathTextExtractor.A + "p")
+        start = txBody.index(old_paragraphs[0])
+        end = txBody.index(old_paragraphs[-1]) + 1
+        if end - start == len(old_paragraphs):
+            txBody[start:end] = new_paragraphs
+        else:
+            # 단락 사이에 다른 요소가 끼어 있는 비정형 XML은 하나씩 교체합니다
+            for p in old_paragraphs:
+                txBody.remove(p)
+            for offset, p in enumerate(new_paragraphs):
+                txBody.insert(start + offset, p)
     def apply_template_to_text_frame(self, text_frame, translated_text: str, template: TextFrameTemplate) -> bool:
         """템플릿을 사용하여 텍스트 프레임에 번역된 텍스트를 적용합니다."""
-        try:
-            # 텍스트 프레임 속성 복원 (안전하게)
+        if self.apply_engine == "xml" and template.styles is not None and template.paragraphs:
             try:
-                if template.margin_left is not None:
-                    text_frame.margin_left = Pt(template.margin_left)
-                if template.margin_right is not None:
-                    text_frame.margin_right = Pt(template.margin_right)
-                if template.margin_top is not None:
-                    text_frame.margin_top = Pt(template.margin_top)
-                if template.margin_bottom is not None:
-                    text_frame.margin_bottom = Pt(template.margin_bottom)
-                if template.word_wrap is not None:
-                    text_frame.word_wrap = template.word_wrap
-                if template.auto_size is not None:
-                    text_frame.auto_size = template.auto_size
+                self.apply_template_to_text_frame_xml(text_frame, translated_text, template)
+                return True
             except Exception as e:
-                print(f"      텍스트 프레임 속성 복원 중 오류 (무시됨): {str(e)}")
+                logger.warning(f"      XML 적용 엔진 오류, 기존 방식으로 재시도: {str(e)}")
+        
+        try:
+            # 텍스트 프레임 속성 복원 (안전하게)
+            self.apply_text_frame_properties(text_frame, template)
             
             # 번역된 텍스트를 줄바꿈으로 분할
             translated_lines = translated_text.split('\n')
             
-            # 기존 단락들의 서식 정보 백업
-            original_paragraphs = []
-            for para in text_frame.paragraphs:
-                try:
-                    para_format = self.extract_paragraph_format(para)
-                    original_paragraphs.append(para_format)
-                except:
-                    original_paragraphs.append(ParagraphFormat())
+            # 기존 단락들의 서식 정보 (추출 시 스타일 테이블에 등록된 템플릿을 사용하고, 없으면 현재 단락에서 추출)
+            styles = template.styles
+            if styles is not None and template.paragraphs:
+                original_paragraphs = [styles.paragraph(style_id) for style_id in template.paragraphs]
+            else:
+                styles = StyleTable()
+                original_paragraphs = []
+                for para in text_frame.paragraphs:
+                    try:
+                        para_format = self.extract_paragraph_format(para, styles)
+                        original_paragraphs.append(para_format)
+                    except:
+                        original_paragraphs.append(ParagraphFormat())
             
             # 모든 기존 단락 제거 (첫 번째 제외)
             while len(text_frame.paragraphs) > 1:
@@ -496,7 +3100,7 @@ class PowerPointTranslatorImproved:
                     for run in first_para.runs[:]:
                         run._r.getparent().remove(run._r)
                 except Exception as e:
-                    print(f"      기존 runs 제거 중 오류: {str(e)}")
+                    logger.warning(f"      기존 runs 제거 중 오류: {str(e)}")
                 
                 # 첫 번째 줄 적용
                 first_line = translated_lines[0] if translated_lines else ""
@@ -509,7 +3113,7 @@ class PowerPointTranslatorImproved:
                             # 첫 번째 Run의 서식으로 통일하여 안정성 확보
                             run = first_para.add_run()
                             run.text = first_line
-                            self.apply_run_format(run, para_format.runs[0])
+                            self.apply_run_style(run, styles, para_format.runs[0])
                         else:
                             first_para.text = first_line
                     else:
@@ -537,7 +3141,7 @@ class PowerPointTranslatorImproved:
                         if para_format.runs:
                             run = para.add_run()
                             run.text = line
-                            self.apply_run_format(run, para_format.runs[0])
+                            self.apply_run_style(run, styles, para_format.runs[0])
                         else:
                             para.text = line
                         
@@ -545,7 +3149,7 @@ class PowerPointTranslatorImproved:
                         self.apply_paragraph_format(para, para_format)
                         
                     except Exception as e:
-                        print(f"      단락 {i} 추가 중 오류: {str(e)}")
+                        logger.warning(f"      단락 {i} 추가 중 오류: {str(e)}")
                         # 실패 시 기본 방식으로 단락 추가
                         try:
                             para = text_frame.add_paragraph()
@@ -556,17 +3160,38 @@ class PowerPointTranslatorImproved:
             return True
             
         except Exception as e:
-            print(f"      템플릿 적용 중 전체 오류: {str(e)}")
+            logger.warning(f"      템플릿 적용 중 전체 오류: {str(e)}")
             # 실패 시 기본 방식으로 폴백
             try:
                 text_frame.text = translated_text
-                print(f"      기본 방식으로 폴백 완료")
+                logger.debug(f"      기본 방식으로 폴백 완료")
                 return True
             except Exception as fallback_error:
-                print(f"      기본 방식 폴백도 실패: {str(fallback_error)}")
+                logger.warning(f"      기본 방식 폴백도 실패: {str(fallback_error)}")
                 return False
-    def apply_translation_to_slide(self, slide, text_elements: List[TextElement]) -> int:
-        """슬라이드에 번역된 텍스트를 적용합니다."""
+    def apply_translation_to_slide(self, slide, text_elements: List[TextElement],
+                                   modified_parts: Optional[Dict[str, Any]] = None) -> int:
+        """슬라이드에 번역된 텍스트를 적용합니다.
+
+        modified_parts를 전달하면 번역이 적용된 슬라이드/차트 파트를 파트 이름별로 기록합니다.
+        """
+        if isinstance(slide, LazySlide):
+            return self.apply_translation_to_lazy_slide(slide, text_elements, modified_parts)
+        if self.apply_engine == "xml":
+            # python-pptx 도형 프록시를 만들지 않고 슬라이드 XML에서 텍스트 본문을 직접 찾습니다
+            chart_parts = {}
+            
+            def resolve_chart(rId):
+                chart_part = slide.part.related_part(rId)
+                chart_parts[chart_part._element] = chart_part
+                return chart_part._element
+            
+            success_count, changed_charts = self.apply_translation_to_slide_xml(slide._element, text_elements, resolve_chart)
+            if success_count and modified_parts is not None:
+                modified_parts[str(slide.part.partname)] = slide.part
+                for chart_space in changed_charts:
+                    modified_parts[str(chart_parts[chart_space].partname)] = chart_parts[chart_space]
+            return success_count
         success_count = 0
         
         for element in text_elements:
@@ -578,9 +3203,9 @@ class PowerPointTranslatorImproved:
                     if hasattr(shape, "text_frame") and shape.text_frame:
                         if self.apply_template_to_text_frame(shape.text_frame, element.translated_text, element.template):
                             success_count += 1
-                            print(f"      일반 도형 번역 적용 완료: '{element.original_text[:20]}...' -> '{element.translated_text[:20]}...'")
+                            logger.debug(f"      일반 도형 번역 적용 완료: '{element.original_text[:20]}...' -> '{element.translated_text[:20]}...'")
                         else:
-                            print(f"      일반 도형 번역 적용 실패")
+                            logger.warning(f"      일반 도형 번역 적용 실패")
                 
                 elif element.element_type == "grouped_shape":
                     # 그룹화된 도형
@@ -589,128 +3214,1885 @@ class PowerPointTranslatorImproved:
                         if hasattr(child_shape, "text_frame") and child_shape.text_frame:
                             if self.apply_template_to_text_frame(child_shape.text_frame, element.translated_text, element.template):
                                 success_count += 1
-                                print(f"      그룹 내 도형 번역 적용 완료: '{element.original_text[:20]}...' -> '{element.translated_text[:20]}...'")
+                                logger.debug(f"      그룹 내 도형 번역 적용 완료: '{element.original_text[:20]}...' -> '{element.translated_text[:20]}...'")
                             else:
-                                print(f"      그룹 내 도형 번역 적용 실패")
+                                logger.warning(f"      그룹 내 도형 번역 적용 실패")
                 
                 elif element.element_type == "table_cell":
                     # 테이블 셀
-                    if isinstance(shape, GraphicFrame) and hasattr(shape, "table"):
+                    if isinstance(shape, GraphicFrame) and shape.has_table:
                         table = shape.table
                         if element.row_idx is not None and element.col_idx is not None:
                             cell = table.cell(element.row_idx, element.col_idx)
                             if cell.text_frame:
                                 if self.apply_template_to_text_frame(cell.text_frame, element.translated_text, element.template):
                                     success_count += 1
-                                    print(f"      테이블 셀 번역 적용 완료 [{element.row_idx},{element.col_idx}]: '{element.original_text[:20]}...' -> '{element.translated_text[:20]}...'")
+                                    logger.debug(f"      테이블 셀 번역 적용 완료 [{element.row_idx},{element.col_idx}]: '{element.original_text[:20]}...' -> '{element.translated_text[:20]}...'")
                                 else:
-                                    print(f"      테이블 셀 번역 적용 실패")
+                                    logger.warning(f"      테이블 셀 번역 적용 실패")
                 
                 elif element.element_type == "chart_title":
                     # 차트 제목
-                    if isinstance(shape, GraphicFrame) and hasattr(shape, "chart"):
+                    if isinstance(shape, GraphicFrame) and shape.has_chart:
                         chart = shape.chart
-                        if hasattr(chart, "chart_title") and chart.chart_title and chart.chart_title.text_frame:
+                        if chart.has_title and chart.chart_title.has_text_frame:
                             if self.apply_template_to_text_frame(chart.chart_title.text_frame, element.translated_text, element.template):
                                 success_count += 1
-                                print(f"      차트 제목 번역 적용 완료: '{element.original_text[:20]}...' -> '{element.translated_text[:20]}...'")
+                                if modified_parts is not None:
+                                    modified_parts[str(shape.chart_part.partname)] = shape.chart_part
+                                logger.debug(f"      차트 제목 번역 적용 완료: '{element.original_text[:20]}...' -> '{element.translated_text[:20]}...'")
                             else:
-                                print(f"      차트 제목 번역 적용 실패")
+                                logger.warning(f"      차트 제목 번역 적용 실패")
                 
             except Exception as e:
-                print(f"      텍스트 요소 적용 중 오류: {str(e)}")
+                logger.warning(f"      텍스트 요소 적용 중 오류: {str(e)}")
         
+        if success_count and modified_parts is not None:
+            modified_parts[str(slide.part.partname)] = slide.part
+        return success_count
+    def apply_translation_to_slide_xml(self, sld, text_elements: List[TextElement],
+                                       resolve_chart=None) -> Tuple[int, set]:
+        """슬라이드 XML에서 추출 위치 정보로 텍스트 본문을 직접 찾아 번역을 적용합니다.
+
+        (성공한 요소 수, 변경된 차트 파트의 c:chartSpace 요소 집합)을 반환합니다.
+        """
+        success_count = 0
+        changed_charts = set()
+        for element in text_elements:
+            try:
+                txBody = self.xpath_extractor.locate_text_body(sld, element, resolve_chart)
+                if txBody is None:
+                    logger.warning(f"      텍스트 요소를 찾을 수 없습니다: {self.element_location_key(element)}")
+                    continue
+                if self.apply_template_to_text_frame(TextFrame(txBody, None), element.translated_text, element.template):
+                    success_count += 1
+                    if element.element_type == "chart_title":
+                        changed_charts.add(txBody.getroottree().getroot())
+                    logger.debug(f"      번역 적용 완료: '{element.original_text[:20]}...' -> '{element.translated_text[:20]}...'")
+                else:
+                    logger.warning(f"      번역 적용 실패")
+            except Exception as e:
+                logger.warning(f"      텍스트 요소 적용 중 오류: {str(e)}")
+        return success_count, changed_charts
+    def apply_translation_to_lazy_slide(self, slide: LazySlide, text_elements: List[TextElement],
+                                        modified_parts: Optional[Dict[str, Any]] = None) -> int:
+        """지연 로딩 슬라이드에 번역을 적용하고, 변경된 파트를 직렬화한 뒤 트리와 서식 템플릿을 해제합니다."""
+        sld = slide.open()
+        try:
+            success_count, changed_charts = self.apply_translation_to_slide_xml(sld, text_elements, slide.resolve_chart)
+            for element in text_elements:
+                element.template = None
+            
+            if success_count and modified_parts is not None:
+                modified_parts[slide.partname] = slide.serialize()
+                for partname, chart_space in slide.parsed_charts():
+                    if chart_space in changed_charts:
+                        modified_parts[partname] = slide.serialize(partname)
+        finally:
+            slide.release()
         return success_count
-    def translate_presentation(self, input_file: str, output_file: str, target_language: str) -> bool:
-        """PowerPoint 프레젠테이션을 템플릿 기반 방식으로 번역합니다."""
+    def slide_parts_renamed(self, prs, writer: PartialPackageWriter) -> bool:
+        """python-pptx가 슬라이드 순서에 맞춰 파트 이름을 바꿨는지 원본 관계 파일과 비교하여 확인합니다."""
+        source_rels = etree.fromstring(writer.read_member('ppt/_rels/presentation.xml.rels'))
+        source_partnames = {
+            rel.get('Id'): PackURI.from_rel_ref(prs.part.partname.baseURI, rel.get('Target'))
+            for rel in source_rels if rel.get('TargetMode') != 'External'
+        }
+        for rel in prs.part.rels.values():
+            if not rel.is_external and source_partnames.get(rel.rId) != rel.target_part.partname:
+                return True
+        return False
+    def load_presentation(self, input_file: str):
+        """설정에 따라 python-pptx 프레젠테이션 또는 텍스트 전용 지연 로딩 패키지를 엽니다."""
+        if self.lazy_loading:
+            return LazyPresentationPackage(input_file)
+        return Presentation(input_file)
+    def close_presentation(self, prs):
+        """지연 로딩 패키지의 파일 핸들과 메모리 맵을 닫습니다."""
+        if isinstance(prs, LazyPresentationPackage):
+            prs.close()
+    def print_peak_memory(self):
+        """프로세스 최대 메모리 사용량을 출력합니다."""
+        peak = peak_memory_mb()
+        if peak is not None:
+            logger.info(f"최대 메모리 사용량: {peak} MB")
+    def log_partial_save(self, writer: PartialPackageWriter):
+        """부분 저장 결과(재직렬화, 원본 복사, 재압축한 항목 수)를 출력합니다."""
+        message = f"부분 저장: {writer.rewritten_members}개 파트 재직렬화, {writer.copied_members}개 항목 원본 복사"
+        if writer.recompressed_members:
+            message += f", {writer.recompressed_members}개 항목 재압축"
+        logger.info(message)
+    def save_presentation(self, prs, input_file: str, output_file: str,
+                          modified_parts: Optional[Dict[str, Any]] = None) -> None:
+        """번역된 프레젠테이션을 저장합니다.
+
+        부분 저장이 가능하면 변경된 파트만 다시 직렬화하고, 파트 이름이 바뀌었거나 실패하면 전체를 저장합니다.
+        """
+        if isinstance(prs, LazyPresentationPackage):
+            # 지연 로딩 패키지는 python-pptx 객체가 없으므로 항상 부분 저장을 사용합니다
+            writer = PartialPackageWriter(input_file)
+            writer.write(output_file, {partname.lstrip('/'): blob for partname, blob in (modified_parts or {}).items()})
+            self.log_partial_save(writer)
+            return
+        if self.partial_save and modified_parts is not None and isinstance(input_file, str):
+            try:
+                writer = PartialPackageWriter(input_file)
+                if not self.slide_parts_renamed(prs, writer):
+                    replacements = {partname.lstrip('/'): part.blob for partname, part in modified_parts.items()}
+                    writer.write(output_file, replacements)
+                    self.log_partial_save(writer)
+                    return
+                logger.info("슬라이드 파트 이름이 변경되어 전체 저장을 사용합니다.")
+            except Exception as e:
+                logger.warning(f"부분 저장 실패, 전체 저장으로 대체합니다: {str(e)}")
+        prs.save(output_file)
+    def compare_extraction_engines(self, input_file: str) -> List[str]:
+        """python-pptx 추출기와 XPath 추출기의 결과를 비교하여 차이점 목록을 반환합니다 (빈 목록이면 동일)."""
+        # python-pptx 추출기는 XML에 빈 요소를 추가할 수 있으므로 각각 새로 로드한 프레젠테이션을 사용합니다
+        pptx_prs = Presentation(input_file)
+        xpath_prs = Presentation(input_file)
+        engine = self.extraction_engine
+        # 두 엔진이 같은 스타일 테이블을 사용해야 서식 ID가 일치합니다
+        styles = StyleTable()
+        differences = []
+        try:
+            for slide_idx, (pptx_slide, xpath_slide) in enumerate(zip(pptx_prs.slides, xpath_prs.slides)):
+                self.extraction_engine = "pptx"
+                expected = self.extract_text_elements_from_slide(pptx_slide, styles)
+                self.extraction_engine = "xpath"
+                actual = self.extract_text_elements_from_slide(xpath_slide, styles)
+                
+                if len(expected) != len(actual):
+                    differences.append(f"슬라이드 {slide_idx + 1}: 요소 수 {len(expected)} != {len(actual)}")
+                for expected_element, actual_element in zip(expected, actual):
+                    if expected_element != actual_element:
+                        differences.append(
+                            f"슬라이드 {slide_idx + 1} {self.element_location_key(expected_element)}: "
+                            f"{expected_element} != {actual_element}"
+                        )
+        finally:
+            self.extraction_engine = engine
+        return differences
+    def benchmark_apply_engines(self, input_file: str, repeat: int = 3) -> Dict[str, Any]:
+        """python-pptx 적용 방식과 XML 적용 엔진의 적용 시간을 비교하고 결과 XML이 같은지 확인합니다.
+
+        원문을 번역 결과로 사용하므로 Bedrock을 호출하지 않습니다. 각 엔진의 가장 빠른 실행 시간을 보고합니다.
+        """
+        engine = self.apply_engine
+        timings = {}
+        outputs = {}
+        text_frames = 0
+        try:
+            for apply_engine in ("pptx", "xml"):
+                self.apply_engine = apply_engine
+                for _ in range(max(1, repeat)):
+                    # 적용은 XML을 변경하므로 실행마다 새로 로드합니다
+                    prs = Presentation(input_file)
+                    styles = StyleTable()
+                    slide_elements = [self.extract_text_elements_from_slide(slide, styles) for slide in prs.slides]
+                    for element in (element for elements in slide_elements for element in elements):
+                        element.translated_text = element.original_text
+                    start = time.perf_counter()
+                    for slide, elements in zip(prs.slides, slide_elements):
+                        self.apply_translation_to_slide(slide, elements)
+                    elapsed = time.perf_counter() - start
+                    timings[apply_engine] = min(elapsed, timings.get(apply_engine, elapsed))
+                text_frames = sum(len(elements) for elements in slide_elements)
+                outputs[apply_engine] = [etree.tostring(slide._element) for slide in prs.slides]
+        finally:
+            self.apply_engine = engine
+        
+        return {
+            'text_frames': text_frames,
+            'pptx_seconds': round(timings['pptx'], 4),
+            'xml_seconds': round(timings['xml'], 4),
+            'speedup': round(timings['pptx'] / timings['xml'], 1) if timings['xml'] else None,
+            'identical': outputs['pptx'] == outputs['xml']
+        }
+    def estimate_presentation(self, input_file: str, target_languages: List[str],
+                              request_latency: float = ESTIMATED_REQUEST_LATENCY,
+                              seconds_per_output_token: float = ESTIMATED_SECONDS_PER_OUTPUT_TOKEN) -> Dict[str, Any]:
+        """추출 단계만 실행하여 번역에 필요한 모델 호출 수, 토큰 수, 예상 비용과 소요 시간을 추정합니다.
+
+        Bedrock은 호출하지 않습니다. 현재 설정(배치 모드, 모델 라우팅, 동시 요청 수, 분당 할당량, 번역 캐시)을 그대로 반영하며
+        소요 시간은 요청 지연 가정과 동시성/할당량 중 가장 느린 제약으로 계산합니다.
+        """
+        glossary_token = current_glossary.set(self.load_glossary(input_file))
+        try:
+            return self._estimate_presentation(input_file, target_languages, request_latency, seconds_per_output_token)
+        finally:
+            current_glossary.reset(glossary_token)
+    def _estimate_presentation(self, input_file: str, target_languages: List[str], request_latency: float,
+                               seconds_per_output_token: float) -> Dict[str, Any]:
+        start = time.perf_counter()
+        prs = self.load_presentation(input_file)
+        try:
+            styles = StyleTable()
+            elements = [element for slide in prs.slides
+                        for element in self.extract_text_elements_from_slide(slide, styles)]
+            total_slides = len(prs.slides)
+        finally:
+            self.close_presentation(prs)
+        extraction_seconds = time.perf_counter() - start
+        
+        element_types: Dict[str, int] = {}
+        for element in elements:
+            element_types[element.element_type] = element_types.get(element.element_type, 0) + 1
+        leaders, _ = SegmentDeduplicator().split(elements)
+        leaders = [element for element in leaders if element.original_text.strip()]
+        
+        concurrency = self.max_workers
+        rpm = self.rate_limiter.requests_per_minute
+        tpm = self.rate_limiter.tokens_per_minute
+        languages = {}
+        for lang in target_languages:
+            # 사전 필터로 처리되거나 번역 캐시에 있는 세그먼트는 모델을 호출하지 않으므로 제외합니다
+            # (추정은 캐시 통계와 마지막 사용 시각을 바꾸지 않도록 읽기 전용으로 조회합니다)
+            filtered = []
+            pending = []
+            for element in leaders:
+                if self.segment_filter and self.segment_filter.classify(element.original_text, lang) is not None:
+                    filtered.append(element)
+                elif not self.has_cached_translation(element.original_text, lang):
+                    pending.append(element)
+            input_tokens = 0
+            output_tokens = 0
+            cache_read_tokens = 0
+            cache_write_tokens = 0
+            model_tokens: Dict[str, List[int]] = {}
+            cached_prefixes = set()
+            latencies = []
+            batches = []
+            for batch in self.build_translation_batches(pending):
+                texts = [element.original_text for element in batch]
+                if len(texts) == 1 and self.needs_chunking(texts[0]):
+                    # 분할 번역 대상은 청크마다 별도의 배치 요청이 되며 모두 세그먼트 전체로 라우팅한 모델을 사용합니다
+                    model_id = self.route_model(texts)
+                    batches.extend(([piece for _, piece in chunk], model_id) for chunk in self.chunk_segments(texts[0]))
+                else:
+                    batches.append((texts, self.route_model(texts)))
+            for texts, model_id in batches:
+                if len(texts) == 1:
+                    prompt = self.build_translation_prompt(texts[0], lang)
+                    batch_output = self.expected_output_tokens(texts[0], lang)
+                else:
+                    prompt = self.build_batch_prompt(texts, lang)
+                    # JSON 키와 따옴표 등 배치 응답 형식의 부가 토큰을 세그먼트당 4개로 가정합니다
+                    batch_output = sum(self.expected_output_tokens(text, lang) + 4 for text in texts)
+                prompt_tokens = self.estimate_tokens(prompt.text)
+                usage = model_tokens.setdefault(model_id, [0, 0, 0, 0, 0])
+                # 프롬프트 캐시: 최소 길이 이상인 접두부는 모델별 첫 요청에서 캐시에 쓰고 이후에는 캐시에서 읽습니다
+                prefix_tokens = self.estimate_tokens(prompt.prefix)
+                if self.prompt_caching and prefix_tokens >= PROMPT_CACHE_MIN_TOKENS:
+                    prompt_tokens -= prefix_tokens
+                    if (model_id, prompt.prefix) in cached_prefixes:
+                        usage[3] += prefix_tokens
+                        cache_read_tokens += prefix_tokens
+                    else:
+                        cached_prefixes.add((model_id, prompt.prefix))
+                        usage[4] += prefix_tokens
+                        cache_write_tokens += prefix_tokens
+                input_tokens += prompt_tokens
+                output_tokens += batch_output
+                usage[0] += 1
+                usage[1] += prompt_tokens
+                usage[2] += batch_output
+                latencies.append(request_latency + batch_output * seconds_per_output_token)
+            
+            # 동시성, 분당 요청 수, 분당 토큰 수 중 가장 느린 제약이 번역 시간을 결정합니다
+            limits = {"concurrency": max(sum(latencies) / concurrency, max(latencies, default=0.0))}
+            if rpm:
+                limits["rpm"] = len(batches) / rpm * 60.0
+            if tpm:
+                limits["tpm"] = (input_tokens + output_tokens) / tpm * 60.0
+            bottleneck = max(limits, key=limits.get)
+            languages[lang] = {
+                "prefiltered_segments": len(filtered),
+                "cached_segments": len(leaders) - len(pending) - len(filtered),
+                "segments_to_translate": len(pending),
+                "model_calls": len(batches),
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "cache_read_input_tokens": cache_read_tokens,
+                "cache_creation_input_tokens": cache_write_tokens,
+                "models": {model_id: {"model_calls": usage[0], "input_tokens": usage[1], "output_tokens": usage[2],
+                                      "cache_read_input_tokens": usage[3], "cache_creation_input_tokens": usage[4]}
+                           for model_id, usage in model_tokens.items()},
+                "estimated_cost_usd": self.estimate_models_cost(model_tokens),
+                "projected_translate_seconds": round(limits[bottleneck], 2),
+                "bottleneck": bottleneck
+            }
+        
+        totals = {name: sum(language[name] for language in languages.values())
+                  for name in ("model_calls", "input_tokens", "output_tokens", "cache_read_input_tokens",
+                               "cache_creation_input_tokens")}
+        costs = [language["estimated_cost_usd"] for language in languages.values()]
+        totals["estimated_cost_usd"] = round(sum(costs), 6) if None not in costs else None
+        # 모든 언어의 요청은 같은 동시성 제한과 할당량을 공유하므로 언어별 시간의 합으로 추정합니다
+        totals["projected_seconds"] = round(extraction_seconds + sum(
+            language["projected_translate_seconds"] for language in languages.values()), 2)
+        return {
+            "input_file": input_file,
+            "model_id": self.model_id,
+            "slides": total_slides,
+            "elements": len(elements),
+            "element_types": element_types,
+            "characters": sum(len(element.original_text) for element in elements),
+            "unique_segments": len(leaders),
+            "duplicate_segments": len(elements) - len(leaders),
+            "extraction_seconds": round(extraction_seconds, 4),
+            "languages": languages,
+            "totals": totals,
+            "assumptions": {
+                "max_workers": concurrency,
+                "requests_per_minute": rpm,
+                "tokens_per_minute": tpm,
+                "batch_mode": self.batch_mode,
+                "request_latency": request_latency,
+                "seconds_per_output_token": seconds_per_output_token,
+                "small_model_id": self.small_model_id,
+                "small_model_max_tokens": self.small_model_max_tokens,
+                "chunk_tokens": self.chunk_tokens,
+                "prompt_caching": self.prompt_caching,
+                "glossary": current_glossary.get().source if current_glossary.get() is not None else None
+            }
+        }
+    @staticmethod
+    def estimate_models_cost(model_tokens: Dict[str, List[int]]) -> Optional[float]:
+        """모델별 [호출 수, 입력 토큰, 출력 토큰, 캐시 읽기 토큰, 캐시 쓰기 토큰]으로 예상 비용을 합산합니다.
+
+        단가를 모르는 모델이 있으면 None입니다.
+        """
+        total = 0.0
+        for model_id, (_, input_tokens, output_tokens, cache_read, cache_write) in model_tokens.items():
+            cost = RunMetrics.estimate_cost(model_id, input_tokens, output_tokens, cache_read, cache_write)
+            if cost is None:
+                return None
+            total += cost
+        return round(total, 6)
+    def print_estimate(self, estimate: Dict[str, Any]):
+        """사전 추정 결과를 요약하여 출력합니다."""
+        element_types = ", ".join(f"{name} {count}개" for name, count in estimate["element_types"].items())
+        logger.info(f"사전 추정: {estimate['input_file']} ({estimate['slides']}개 슬라이드)")
+        logger.info(f"  텍스트 요소 {estimate['elements']}개 ({element_types or '없음'}), "
+                    f"고유 세그먼트 {estimate['unique_segments']}개")
+        for lang, language in estimate["languages"].items():
+            cost = language["estimated_cost_usd"]
+            logger.info(f"  {lang}: 사전 필터 {language['prefiltered_segments']}개, "
+                        f"호출 {language['model_calls']}회, 입력 {language['input_tokens']}토큰, "
+                        f"출력 약 {language['output_tokens']}토큰, 예상 비용 "
+                        f"{'알 수 없음' if cost is None else f'${cost:.4f}'}, "
+                        f"예상 번역 시간 {language['projected_translate_seconds']}초 (제약: {language['bottleneck']})")
+            if language["cache_read_input_tokens"] or language["cache_creation_input_tokens"]:
+                logger.info(f"    프롬프트 캐시: 캐시 읽기 약 {language['cache_read_input_tokens']}토큰, "
+                            f"캐시 쓰기 약 {language['cache_creation_input_tokens']}토큰")
+    def estimate_path(self, output_file: str) -> str:
+        """출력 파일 옆에 저장되는 사전 추정 보고서 경로를 반환합니다."""
+        return f"{output_file}.estimate.json"
+    def collect_translation_requests(self, input_file: str, target_languages: List[str]) -> List[Tuple[str, List[str]]]:
+        """덱에서 모델 호출이 필요한 번역 단위를 (대상 언어, 원문 목록)으로 모읍니다.
+
+        빈 텍스트, 사전 필터 대상, 번역 캐시에 있는 세그먼트는 제외되며 현재 용어집 컨텍스트를 사용합니다.
+        """
+        prs = self.load_presentation(input_file)
+        try:
+            styles = StyleTable()
+            elements = [element for slide in prs.slides
+                        for element in self.extract_text_elements_from_slide(slide, styles)]
+        finally:
+            self.close_presentation(prs)
+        
+        leaders, _ = SegmentDeduplicator().split(elements)
+        return [(lang, [element.original_text for element in batch])
+                for lang in target_languages for batch in self.prepare_translation_units(leaders, lang)]
+    def bulk_record_id(self, model_id: str, body: Dict[str, Any]) -> str:
+        """요청 내용으로 11자리 영숫자 배치 추론 레코드 ID를 만듭니다 (같은 요청은 실행이 달라도 같은 ID)."""
+        payload = json.dumps([model_id, body], ensure_ascii=False, sort_keys=True)
+        value = int(hashlib.sha256(payload.encode("utf-8")).hexdigest(), 16)
+        digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+        record_id = ""
+        for _ in range(11):
+            value, index = divmod(value, len(digits))
+            record_id += digits[index]
+        return record_id
+    def load_bulk_manifest(self, job_dir: str) -> Dict[str, Any]:
+        """일괄 작업 디렉터리의 매니페스트를 읽습니다."""
+        with open(os.path.join(job_dir, BULK_MANIFEST_FILE), encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("bulk_job") != 1:
+            raise ValueError(f"일괄 작업 매니페스트가 아닙니다: {job_dir}")
+        return manifest
+    def save_bulk_manifest(self, job_dir: str, manifest: Dict[str, Any]):
+        """일괄 작업 매니페스트를 원자적으로 저장합니다."""
+        path = os.path.join(job_dir, BULK_MANIFEST_FILE)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(path + ".tmp", path)
+    def prepare_bulk_job(self, input_files: List[str], target_languages: List[str], job_dir: str,
+                         output_dir: Optional[str] = None) -> Dict[str, Any]:
+        """여러 덱에서 번역할 세그먼트를 추출하여 Bedrock 배치 추론 입력 JSONL과 매니페스트를 만듭니다.
+
+        빈 텍스트, 사전 필터 대상, 번역 캐시에 있는 세그먼트는 제외하며, 같은 요청은 덱이 달라도 한 레코드로 합칩니다.
+        배치 추론은 잘린 응답을 다시 요청할 수 없으므로 max_tokens는 항상 최대 출력 토큰 수를 사용합니다.
+        """
+        os.makedirs(job_dir, exist_ok=True)
+        input_path = os.path.join(job_dir, BULK_INPUT_FILE)
+        records: Dict[str, Dict[str, Any]] = {}
+        decks = []
+        with open(input_path + ".tmp", "w", encoding="utf-8") as f:
+            for input_file in input_files:
+                glossary = self.load_glossary(input_file)
+                glossary_token = current_glossary.set(glossary)
+                try:
+                    deck_records = set()
+                    for lang, texts in self.collect_translation_requests(input_file, target_languages):
+                        if len(texts) == 1:
+                            prompt = self.build_translation_prompt(texts[0], lang)
+                        else:
+                            prompt = self.build_batch_prompt(texts, lang)
+                        body = self.build_request_body(prompt, self.max_output_tokens, prompt_caching=False)
+                        record_id = self.bulk_record_id(self.model_id, body)
+                        deck_records.add(record_id)
+                        if record_id in records:
+                            continue
+                        records[record_id] = {"target_language": lang, "texts": texts,
+                                              "glossary": glossary.fingerprint if glossary is not None else None}
+                        f.write(json.dumps({"recordId": record_id, "modelInput": body}, ensure_ascii=False) + "\n")
+                finally:
+                    current_glossary.reset(glossary_token)
+                
+                decks.append({
+                    "input_file": os.path.abspath(input_file),
+                    "deck_hash": self.deck_hash(input_file),
+                    "target_languages": target_languages,
+                    "output_files": {lang: os.path.abspath(self.build_output_path(input_file, lang, output_dir))
+                                     for lang in target_languages},
+                    "records": len(deck_records)
+                })
+                logger.info(f"{input_file}: 레코드 {len(deck_records)}개")
+        os.replace(input_path + ".tmp", input_path)
+        
+        manifest = {
+            "bulk_job": 1,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "model_id": self.model_id,
+            "prompt_version": PROMPT_VERSION,
+            "input_file": BULK_INPUT_FILE,
+            "decks": decks,
+            "records": records,
+            "job": None
+        }
+        self.save_bulk_manifest(job_dir, manifest)
+        return manifest
+    def submit_bulk_job(self, job_dir: str, service) -> str:
+        """준비된 입력 JSONL을 배치 추론 작업 서비스에 제출하고 작업 ID를 매니페스트에 기록합니다."""
+        manifest = self.load_bulk_manifest(job_dir)
+        job_name = f"pptx-translation-{time.strftime('%Y%m%d-%H%M%S')}"
+        job_id = service.submit(os.path.join(job_dir, manifest["input_file"]), job_name, manifest["model_id"])
+        manifest["job"] = {"job_id": job_id, "job_name": job_name, "service": type(service).__name__,
+                           "submitted_at": time.strftime("%Y-%m-%dT%H:%M:%S")}
+        self.save_bulk_manifest(job_dir, manifest)
+        return job_id
+    def download_bulk_output(self, job_dir: str, service) -> Optional[str]:
+        """제출한 작업이 끝났으면 출력 JSONL을 작업 디렉터리로 내려받아 경로를 반환합니다. 끝나지 않았으면 None입니다."""
+        manifest = self.load_bulk_manifest(job_dir)
+        if not manifest.get("job"):
+            raise ValueError("제출된 작업이 없습니다")
+        job_id = manifest["job"]["job_id"]
+        status = service.status(job_id)
+        if status not in ("Completed", "PartiallyCompleted"):
+            logger.info(f"배치 추론 작업 {job_id} 상태: {status}")
+            return None
+        return service.download_output(job_id, os.path.join(job_dir, manifest["input_file"] + ".out"))
+    def read_bulk_output(self, output_path: str, records: Dict[str, Dict[str, Any]]) -> Tuple[Dict[Tuple, str], Dict[str, Any]]:
+        """배치 추론 출력 JSONL을 읽어 (대상 언어, 용어집 지문, 원문)별 번역과 처리 요약을 반환합니다."""
+        translations: Dict[Tuple, str] = {}
+        summary = {"records": 0, "failed_records": 0, "unknown_records": 0, "input_tokens": 0, "output_tokens": 0}
+        with open(output_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                result = json.loads(line)
+                record = records.get(result.get("recordId"))
+                if record is None:
+                    summary["unknown_records"] += 1
+                    continue
+                summary["records"] += 1
+                
+                output = result.get("modelOutput")
+                texts = record["texts"]
+                values = None
+                if output and output.get("stop_reason") != "max_tokens":
+                    usage = output.get("usage", {})
+                    summary["input_tokens"] += usage.get("input_tokens", 0)
+                    summary["output_tokens"] += usage.get("output_tokens", 0)
+                    response_text = output["content"][0]["text"].strip()
+                    values = [response_text] if len(texts) == 1 else self.parse_batch_response(response_text, len(texts))
+                if values is None:
+                    summary["failed_records"] += 1
+                    continue
+                for text, translated in zip(texts, values):
+                    translations[(record["target_language"], record["glossary"], text)] = translated
+        return translations, summary
+    def apply_bulk_translations(self, input_file: str, output_file: str, target_language: str,
+                                translations: Dict[Tuple, str], model_id: Optional[str] = None,
+                                models: Optional[Dict[Tuple, str]] = None) -> int:
+        """배치 추론 결과를 덱에 적용하여 저장하고, 번역을 찾지 못해 원문을 유지한 세그먼트 수를 반환합니다.
+
+        결과는 번역한 모델(models에 세그먼트별로 있으면 그 모델, 없으면 model_id, 기본값은 기본 모델)의 키로
+        번역 캐시에도 저장되므로 이후의 온디맨드 실행에서 재사용됩니다.
+        """
+        model_id = model_id or self.model_id
+        glossary = current_glossary.get()
+        fingerprint = glossary.fingerprint if glossary is not None else None
+        prs = self.load_presentation(input_file)
+        try:
+            styles = StyleTable()
+            slide_elements = [self.extract_text_elements_from_slide(slide, styles) for slide in prs.slides]
+            deduplicator = SegmentDeduplicator()
+            leaders, followers = deduplicator.split([element for elements in slide_elements for element in elements])
+            
+            missing = 0
+            for batch in self.prepare_translation_units(leaders, target_language):
+                for element in batch:
+                    key = (target_language, fingerprint, element.original_text)
+                    translated = translations.get(key)
+                    if translated is None:
+                        element.translated_text = element.original_text
+                        missing += 1
+                        continue
+                    element.translated_text = translated
+                    element.is_translated = True
+                    self.cache.put(self.cache.make_key(element.original_text, target_language,
+                                                       self.cache_model(element.original_text,
+                                                                        (models or {}).get(key, model_id))),
+                                   translated)
+            for follower, leader in followers:
+                deduplicator.copy_translation(follower, leader)
+            
+            modified_parts: Dict[str, Any] = {}
+            for slide, elements in zip(prs.slides, slide_elements):
+                self.apply_translation_to_slide(slide, elements, modified_parts)
+            output_dir = os.path.dirname(output_file)
+            if output_dir:
+                os.makedirs(output_dir, exist_ok=True)
+            self.save_presentation(prs, input_file, output_file, modified_parts)
+        finally:
+            self.close_presentation(prs)
+        return missing
+    def ingest_bulk_output(self, job_dir: str, output_path: Optional[str] = None) -> Dict[str, bool]:
+        """배치 추론 출력 JSONL을 읽어 매니페스트의 모든 덱과 언어에 번역을 적용하고 저장합니다.
+
+        output_path를 지정하지 않으면 작업 디렉터리에 내려받은 출력 파일을 사용합니다.
+        결과는 출력 파일 경로별 성공 여부입니다.
+        """
+        manifest = self.load_bulk_manifest(job_dir)
+        output_path = output_path or os.path.join(job_dir, manifest["input_file"] + ".out")
+        translations, summary = self.read_bulk_output(output_path, manifest["records"])
+        cost = RunMetrics.estimate_cost(manifest["model_id"], summary["input_tokens"], summary["output_tokens"])
+        logger.info(f"배치 추론 결과: 레코드 {summary['records']}개 (실패 {summary['failed_records']}개), "
+                    f"입력 {summary['input_tokens']}토큰, 출력 {summary['output_tokens']}토큰, 예상 비용 "
+                    f"{'알 수 없음' if cost is None else f'${cost * BULK_PRICE_FACTOR:.4f}'}")
+        
+        results = {}
+        for deck in manifest["decks"]:
+            input_file = deck["input_file"]
+            if not os.path.exists(input_file):
+                logger.warning(f"{input_file}: 입력 파일을 찾을 수 없습니다")
+                results.update({output_file: False for output_file in deck["output_files"].values()})
+                continue
+            if self.deck_hash(input_file) != deck["deck_hash"]:
+                logger.warning(f"{input_file}: 작업을 준비한 뒤 파일이 바뀌어 일부 세그먼트는 원문으로 남을 수 있습니다")
+            
+            glossary_token = current_glossary.set(self.load_glossary(input_file))
+            try:
+                for lang, output_file in deck["output_files"].items():
+                    try:
+                        missing = self.apply_bulk_translations(input_file, output_file, lang, translations,
+                                                               manifest["model_id"])
+                    except Exception as e:
+                        logger.warning(f"{output_file}: 번역 적용 중 오류 발생: {str(e)}")
+                        results[output_file] = False
+                        continue
+                    if missing:
+                        logger.warning(f"{output_file}: 번역 결과가 없는 세그먼트 {missing}개는 원문을 유지합니다")
+                    logger.info(f"{output_file}: 저장 완료")
+                    results[output_file] = True
+            finally:
+                current_glossary.reset(glossary_token)
+        return results
+    def translate_files_distributed(self, input_files: List[str], target_languages: List[str], work_queue,
+                                    output_dir: Optional[str] = None, poll_interval: float = 1.0,
+                                    timeout: Optional[float] = None,
+                                    stall_timeout: Optional[float] = None) -> Dict[str, bool]:
+        """조정자: 덱에서 번역 작업을 추출하여 작업 큐에 넣고, 작업자가 돌려준 결과를 덱별로 적용하여 저장합니다.
+
+        같은 (대상 언어, 용어집, 원문 목록)의 작업은 덱이 달라도 한 번만 큐에 넣으며,
+        덱의 작업이 모두 끝나는 대로 그 덱을 먼저 저장합니다. 최종 실패한 세그먼트는 원문을 유지합니다.
+        작업자가 모두 멈춰 stall_timeout초 동안 어떤 작업도 수집, 완료, 실패되지 않으면 기다리기를 멈춥니다
+        (기본값: 가시성 제한 시간의 2배 + 최대 재시도 지연, 0 이하이면 사용 안 함).
+        결과는 출력 파일 경로별 성공 여부입니다.
+        """
+        job_id = f"job-{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        glossaries: Dict[str, Dict[str, Any]] = {}
+        pending_decks = []
+        tasks: List[Tuple[str, Dict[str, Any]]] = []
+        results: Dict[str, bool] = {}
+        for input_file in input_files:
+            glossary = self.load_glossary(input_file)
+            fingerprint = glossary.fingerprint if glossary is not None else None
+            if glossary is not None:
+                glossaries[fingerprint] = glossary.entries
+            glossary_token = current_glossary.set(glossary)
+            try:
+                requests = self.collect_translation_requests(input_file, target_languages)
+            except Exception as e:
+                logger.warning(f"{input_file}: 텍스트 추출 중 오류 발생: {str(e)}")
+                results.update({self.build_output_path(input_file, lang, output_dir): False for lang in target_languages})
+                continue
+            finally:
+                current_glossary.reset(glossary_token)
+            
+            deck_tasks = {lang: set() for lang in target_languages}
+            for lang, texts in requests:
+                # 작업자의 설정과 관계없이 조정자가 정한 모델과 응답 토큰 수로 번역하도록 작업에 함께 기록합니다
+                payload = {"target_language": lang, "glossary": fingerprint, "texts": texts,
+                           "model_id": self.route_model(texts), "max_tokens": self.max_tokens_for(texts, [lang])}
+                task_id = hashlib.sha256(json.dumps(payload, ensure_ascii=False).encode("utf-8")).hexdigest()[:32]
+                deck_tasks[lang].add(task_id)
+                tasks.append((task_id, payload))
+            for lang in target_languages:
+                pending_decks.append((input_file, lang, self.build_output_path(input_file, lang, output_dir),
+                                      deck_tasks[lang]))
+        
+        # 작업자가 작업을 가져가기 전에 용어집 등 공통 정보를 먼저 저장합니다
+        work_queue.create_job(job_id, {"model_id": self.model_id, "glossaries": glossaries})
+        queued = sum(1 for task_id, payload in tasks if work_queue.put(job_id, task_id, payload))
+        logger.info(f"분산 번역 작업 {job_id}: 파일 {len(input_files)}개, 번역 작업 {queued}개를 큐에 넣었습니다")
+        
+        if stall_timeout is None:
+            stall_timeout = work_queue.visibility_timeout * 2 + work_queue.retry_delay * work_queue.max_attempts
+        start = time.monotonic()
+        last_progress = None
+        translations: Dict[Tuple, str] = {}
+        models: Dict[Tuple, str] = {}
+        finished_ids = set()
+        cursor = 0
+        while pending_decks:
+            # 작업자가 모두 멈춰도 재시도 횟수를 다 쓴 작업이 최종 실패로 정리되도록 조정자도 만료를 처리합니다
+            work_queue.expire()
+            cursor, finished = work_queue.finished_since(job_id, cursor)
+            for task_id, (payload, result) in finished.items():
+                finished_ids.add(task_id)
+                if result is None:
+                    continue
+                for text, translated, model_id in zip(payload["texts"], result["translations"], result["models"]):
+                    key = (payload["target_language"], payload["glossary"], text)
+                    translations[key] = translated
+                    models[key] = model_id
+            
+            for deck in [deck for deck in pending_decks if deck[3] <= finished_ids]:
+                pending_decks.remove(deck)
+                input_file, lang, output_file, _ = deck
+                glossary_token = current_glossary.set(self.load_glossary(input_file))
+                try:
+                    missing = self.apply_bulk_translations(input_file, output_file, lang, translations, models=models)
+                    if missing:
+                        logger.warning(f"{output_file}: 번역하지 못한 세그먼트 {missing}개는 원문을 유지합니다")
+                    logger.info(f"{output_file}: 저장 완료")
+                    results[output_file] = True
+                except Exception as e:
+                    logger.warning(f"{output_file}: 번역 적용 중 오류 발생: {str(e)}")
+                    results[output_file] = False
+                finally:
+                    current_glossary.reset(glossary_token)
+            
+            progress = work_queue.progress(job_id)
+            if progress != last_progress:
+                logger.info(f"분산 번역 진행: 완료 {progress['done']}/{progress['total']}, 처리 중 {progress['claimed']}, "
+                            f"대기 {progress['pending']}, 재시도 {progress['retries']}, 실패 {progress['failed']}, "
+                            f"저장한 파일 {len(results)}개")
+                last_progress = progress
+            if not pending_decks:
+                break
+            if timeout is not None and time.monotonic() - start > timeout:
+                logger.warning(f"분산 번역 제한 시간({timeout}초)을 넘어 남은 {len(pending_decks)}개 파일을 저장하지 못했습니다")
+                results.update({deck[2]: False for deck in pending_decks})
+                break
+            last_activity = work_queue.last_activity(job_id)
+            if stall_timeout > 0 and last_activity is not None and time.time() - last_activity > stall_timeout:
+                logger.warning(f"{stall_timeout:.0f}초 동안 작업자 활동이 없어 남은 {len(pending_decks)}개 파일을 저장하지 못했습니다 "
+                               f"(남은 작업은 큐에 유지되므로 작업자를 다시 시작할 수 있습니다)")
+                results.update({deck[2]: False for deck in pending_decks})
+                break
+            time.sleep(poll_interval)
+        return results
+    def process_queue_task(self, work_queue, task: Dict[str, Any], jobs: Dict[str, Dict[str, Any]]) -> bool:
+        """작업 큐에서 가져온 작업 하나를 번역하여 결과를 기록합니다. 성공하면 True를 반환합니다."""
+        job = jobs.get(task["job_id"])
+        if job is None:
+            job = jobs[task["job_id"]] = work_queue.job(task["job_id"]) or {}
+            if job.get("model_id") and job["model_id"] != self.model_id:
+                logger.warning(f"작업 {task['job_id']}의 모델({job['model_id']})과 작업자 모델({self.model_id})이 다릅니다")
+        
+        payload = task["payload"]
+        entries = job.get("glossaries", {}).get(payload["glossary"]) if payload["glossary"] else None
+        glossary_token = current_glossary.set(Glossary(entries) if entries is not None else None)
+        try:
+            translations, models = self.translate_batch_routed(payload["texts"], payload["target_language"],
+                                                               model_id=payload.get("model_id"),
+                                                               max_tokens=payload.get("max_tokens"))
+        except Exception as e:
+            translations = None
+            logger.warning(f"    번역 작업 중 오류 발생: {str(e)}")
+        finally:
+            current_glossary.reset(glossary_token)
+        
+        if translations is None or None in translations:
+            retry = work_queue.fail(task, "translation failed")
+            logger.info(f"  작업 {task['task_id'][:8]} 실패 ({task['attempts']}회째){', 다시 시도합니다' if retry else ''}")
+            return False
+        # 조정자가 번역한 모델로 캐시할 수 있도록 세그먼트별 모델도 함께 돌려줍니다
+        if not work_queue.complete(task, {"translations": translations, "models": models}):
+            logger.info(f"  작업 {task['task_id'][:8]}의 가시성 제한 시간이 지나 결과가 반영되지 않았습니다")
+            return False
+        return True
+    def run_worker(self, work_queue, worker_id: Optional[str] = None, poll_interval: float = 1.0,
+                   idle_timeout: Optional[float] = None, stop_event: Optional[threading.Event] = None) -> Dict[str, int]:
+        """작업자: 작업 큐에서 번역 작업을 가져와 모델을 호출하고 결과를 돌려줍니다.
+
+        max_workers개의 스레드가 각각 작업을 가져가며, idle_timeout초 동안 가져갈 작업이 없으면 종료합니다.
+        처리한 작업 수를 반환합니다.
+        """
+        import socket
+
+        worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        stop_event = stop_event or threading.Event()
+        stats = {"completed": 0, "failed": 0}
+        stats_lock = threading.Lock()
+        jobs: Dict[str, Dict[str, Any]] = {}
+        
+        def loop(thread_idx):
+            idle_since = time.monotonic()
+            while not stop_event.is_set():
+                task = work_queue.claim(f"{worker_id}/{thread_idx}")
+                if task is None:
+                    if idle_timeout is not None and time.monotonic() - idle_since >= idle_timeout:
+                        return
+                    stop_event.wait(poll_interval)
+                    continue
+                ok = self.process_queue_task(work_queue, task, jobs)
+                with stats_lock:
+                    stats["completed" if ok else "failed"] += 1
+                idle_since = time.monotonic()
+        
+        logger.info(f"작업자 {worker_id} 시작: 스레드 {self.max_workers}개, 큐 {getattr(work_queue, 'db_path', work_queue)}")
+        threads = [threading.Thread(target=loop, args=(i,), name=f"worker-{i}", daemon=True)
+                   for i in range(self.max_workers)]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(0.5)
+        except KeyboardInterrupt:
+            stop_event.set()
+        logger.info(f"작업자 {worker_id} 종료: 완료 {stats['completed']}개, 실패 {stats['failed']}개")
+        return stats
+    def element_location_key(self, element: TextElement) -> str:
+        """슬라이드/도형 ID와 요소 위치로 텍스트 요소의 고유 위치 키를 생성합니다."""
+        return ":".join(str(value) if value is not None else "-" for value in (
+            element.slide_id, element.shape_id, element.element_type,
+            element.row_idx, element.col_idx, element.child_idx
+        ))
+    def text_hash(self, text: str) -> str:
+        """원문 텍스트의 해시를 반환합니다."""
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+    def manifest_path(self, output_file: str) -> str:
+        """출력 파일 옆에 저장되는 증분 번역 매니페스트 경로를 반환합니다."""
+        return f"{output_file}.manifest.json"
+    def load_manifest(self, output_file: str, target_language: str) -> Dict[str, Dict[str, str]]:
+        """이전 실행의 매니페스트를 읽어옵니다. 조건이 맞지 않으면 빈 사전을 반환합니다."""
+        path = self.manifest_path(output_file)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except Exception as e:
+            logger.warning(f"매니페스트 읽기 실패, 전체 번역을 수행합니다: {str(e)}")
+            return {}
+        
+        # 대상 언어, 모델, 프롬프트가 바뀌었으면 이전 번역을 재사용하지 않습니다
+        if (manifest.get("target_language") != target_language or
+                manifest.get("model_id") != self.model_id or
+                manifest.get("prompt_version") != PROMPT_VERSION):
+            logger.info("매니페스트의 번역 조건이 달라 전체 번역을 수행합니다.")
+            return {}
+        return manifest.get("elements", {})
+    def save_manifest(self, output_file: str, target_language: str, text_elements: List[TextElement]):
+        """번역에 성공한 요소들의 지문과 번역 결과를 매니페스트로 저장합니다."""
+        elements = {}
+        for element in text_elements:
+            if element.is_translated:
+                elements[self.element_location_key(element)] = {
+                    "text_hash": self.text_hash(element.original_text),
+                    "translation": element.translated_text
+                }
+        manifest = {
+            "version": 1,
+            "target_language": target_language,
+            "model_id": self.model_id,
+            "prompt_version": PROMPT_VERSION,
+            "elements": elements
+        }
+        path = self.manifest_path(output_file)
+        try:
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.debug(f"매니페스트 저장 중 오류 (무시됨): {str(e)}")
+    def reuse_manifest_translations(self, text_elements: List[TextElement],
+                                    manifest: Dict[str, Dict[str, str]]) -> List[TextElement]:
+        """매니페스트와 원문 해시가 일치하는 요소에 이전 번역을 적용하고, 새로 번역할 요소만 반환합니다."""
+        changed = []
+        for element in text_elements:
+            entry = manifest.get(self.element_location_key(element))
+            if entry and entry.get("text_hash") == self.text_hash(element.original_text):
+                element.translated_text = entry["translation"]
+                element.is_translated = True
+            else:
+                changed.append(element)
+        return changed
+    def glossary_file_for(self, input_file: str) -> Optional[str]:
+        """프레젠테이션에 적용할 용어집 파일 경로를 반환합니다 (지정한 파일, 없으면 입력 파일 옆의 용어집)."""
+        if self.glossary_path:
+            return self.glossary_path
+        base = os.path.splitext(input_file)[0]
+        for extension in (".glossary.json", ".glossary.txt"):
+            if os.path.exists(base + extension):
+                return base + extension
+        return None
+    def load_glossary(self, input_file: str) -> Optional[Glossary]:
+        """번역 실행을 시작할 때 용어집을 한 번 읽습니다. 없거나 읽을 수 없으면 None을 반환합니다."""
+        path = self.glossary_file_for(input_file)
+        if path is None:
+            return None
+        try:
+            glossary = Glossary.load(path)
+        except Exception as e:
+            logger.warning(f"용어집을 읽을 수 없어 용어집 없이 진행합니다: {path} ({str(e)})")
+            return None
+        logger.info(f"용어집 사용: {path} ({len(glossary.entries)}개 용어)")
+        return glossary
+    def journal_path(self, output_file: str) -> str:
+        """출력 파일 옆에 저장되는 체크포인트 저널 경로를 반환합니다."""
+        return f"{output_file}.journal.jsonl"
+    def deck_hash(self, input_file: str) -> str:
+        """입력 파일 내용의 해시를 반환합니다 (저널이 같은 덱에서 만들어졌는지 확인하는 데 사용)."""
+        digest = hashlib.sha256()
+        with open(input_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    def open_journal(self, input_file: str, output_file: str, target_language: str) -> Optional[TranslationJournal]:
+        """체크포인트 저널을 열거나 새로 만듭니다. 열 수 없으면 체크포인트 없이 진행하도록 None을 반환합니다."""
+        try:
+            return TranslationJournal(self.journal_path(output_file), {
+                "deck_hash": self.deck_hash(input_file),
+                "target_language": target_language,
+                "model_id": self.model_id,
+                "prompt_version": PROMPT_VERSION,
+                "glossary": current_glossary.get().fingerprint if current_glossary.get() is not None else None
+            })
+        except Exception as e:
+            logger.warning(f"체크포인트 저널을 열 수 없어 체크포인트 없이 진행합니다: {str(e)}")
+            return None
+    def checkpoint_translation(self, element: TextElement, target_language: str):
+        """현재 실행에 체크포인트 저널이 있으면 번역이 끝난 요소를 기록합니다."""
+        journal = (current_journals.get() or {}).get(target_language)
+        if journal is None:
+            return
+        try:
+            journal.record(self.element_location_key(element), self.text_hash(element.original_text),
+                           element.translated_text)
+        except Exception as e:
+            logger.warning(f"체크포인트 기록 중 오류 (무시됨): {str(e)}")
+    def restore_from_journal(self, text_elements: List[TextElement],
+                             journal: TranslationJournal) -> List[TextElement]:
+        """저널에 기록된 번역을 요소에 적용하고, 아직 번역되지 않은 요소만 반환합니다."""
+        remaining = []
+        for element in text_elements:
+            translation = journal.lookup(self.element_location_key(element), self.text_hash(element.original_text))
+            if translation is not None:
+                element.translated_text = translation
+                element.is_translated = True
+            else:
+                remaining.append(element)
+        return remaining
+    def translate_presentation(self, input_file: str, output_file: str, target_language: str,
+                               incremental: bool = False, executor: Optional[ThreadPoolExecutor] = None,
+                               dry_run: bool = False) -> bool:
+        """PowerPoint 프레젠테이션을 템플릿 기반 방식으로 번역합니다.
+
+        incremental=True이면 출력 파일 옆의 매니페스트와 비교하여 새로 추가되거나 변경된 요소만 번역합니다.
+        executor를 전달하면 여러 파일이 하나의 번역 작업 큐와 동시성 제한을 공유합니다.
+        dry_run=True이면 추출만 수행하여 호출 수, 토큰, 비용, 소요 시간을 추정하고 파일은 저장하지 않습니다.
+        """
         
         if target_language not in self.supported_languages:
-            print(f"지원하지 않는 언어입니다. 지원 언어: {list(self.supported_languages.keys())}")
+            logger.error(f"지원하지 않는 언어입니다. 지원 언어: {list(self.supported_languages.keys())}")
             return False
         
+        if dry_run:
+            try:
+                estimate = self.estimate_presentation(input_file, [target_language])
+            except Exception as e:
+                logger.warning(f"사전 추정 중 오류 발생: {str(e)}")
+                return False
+            self.print_estimate(estimate)
+            if self.write_report:
+                self.save_run_report(output_file, estimate, self.estimate_path(output_file))
+            return True
+        
+        prs = None
+        journal = None
+        metrics = RunMetrics(parent=self.metrics)
+        metrics_token = current_run_metrics.set(metrics)
+        journals_token = current_journals.set({})
+        glossary_token = current_glossary.set(self.load_glossary(input_file))
         try:
             # PowerPoint 파일 로드
-            prs = Presentation(input_file)
+            with metrics.stage("load"):
+                prs = self.load_presentation(input_file)
             total_slides = len(prs.slides)
             
-            print(f"번역 시작: {total_slides}개 슬라이드를 {self.supported_languages[target_language]}로 번역합니다...")
-            print("템플릿 기반 서식 보존 방식을 사용합니다.\n")
+            if self.checkpoint:
+                journal = self.open_journal(input_file, output_file, target_language)
+                if journal is not None:
+                    current_journals.get()[target_language] = journal
+                    if journal.entries:
+                        logger.info(f"체크포인트 저널에서 이전 실행을 이어서 진행합니다: {len(journal.entries)}개 요소 기록됨")
             
+            logger.info(f"번역 시작: {total_slides}개 슬라이드를 {self.supported_languages[target_language]}로 번역합니다...")
+            logger.info("템플릿 기반 서식 보존 방식을 사용합니다.")
+            if self.lazy_loading:
+                logger.info("텍스트 전용 지연 로딩을 사용합니다 (미디어 파트는 읽지 않음).")
+            logger.info(f"동시 번역 요청 수: {self.max_workers}\n")
+
             # 성공/실패 통계
             total_success = 0
             total_failed = 0
             slide_success = 0
             slide_failed = 0
-            
-            # 각 슬라이드 처리
-            for slide_idx, slide in enumerate(prs.slides):
+            reused_count = 0
+            resumed_count = 0
+
+            manifest = self.load_manifest(output_file, target_language) if incremental else {}
+            manifest_elements: List[TextElement] = []
+            deduplicator = SegmentDeduplicator()
+            modified_parts: Dict[str, Any] = {}
+            styles = StyleTable()
+
+            # 슬라이드 단위 파이프라인: 추출과 적용은 메인 스레드에서, 번역은 작업자 스레드에서 수행합니다.
+            # 각 슬라이드의 마지막 번역 단위가 끝나면 슬라이드 번호가 완료 큐에 들어가고 즉시 적용됩니다.
+            slide_elements: Dict[int, Optional[List[TextElement]]] = {}
+            remaining_units: Dict[int, int] = {}
+            remaining_lock = threading.Lock()
+            completed_slides = queue.Queue()
+            submitted_at: Dict[int, float] = {}
+
+            def on_unit_done(slide_idx):
+                with remaining_lock:
+                    remaining_units[slide_idx] -= 1
+                    finished = remaining_units[slide_idx] == 0
+                if finished:
+                    metrics.record_slide(slide_idx, translate_seconds=time.perf_counter() - submitted_at[slide_idx])
+                    completed_slides.put(slide_idx)
+
+            def apply_slide(slide_idx):
+                nonlocal total_success, total_failed, slide_success, slide_failed
+                text_elements = slide_elements.pop(slide_idx)
+                if incremental and text_elements:
+                    manifest_elements.extend(text_elements)
                 try:
-                    print(f"슬라이드 {slide_idx + 1}/{total_slides} 처리 중...")
-                    
-                    # 1단계: 텍스트 요소와 서식 템플릿 추출
-                    print("  1단계: 텍스트 및 서식 정보 추출 중...")
-                    text_elements = self.extract_text_elements_from_slide(slide)
-                    
+                    if text_elements is None:
+                        slide_failed += 1
+                        return
+
                     if not text_elements:
-                        print("  번역할 텍스트가 없습니다.")
+                        logger.debug(f"  슬라이드 {slide_idx + 1}: 번역할 텍스트가 없습니다.")
                         slide_success += 1
-                        continue
-                    
-                    # 2단계: 텍스트 번역
-                    print(f"  2단계: {len(text_elements)}개 텍스트 요소 번역 중...")
-                    for element in text_elements:
-                        if element.original_text.strip():
-                            element.translated_text = self.translate_text(element.original_text, target_language)
-                            print(f"    번역 완료: '{element.original_text[:30]}...' -> '{element.translated_text[:30]}...'")
-                        else:
-                            element.translated_text = element.original_text
-                    
-                    # 3단계: 서식을 보존하면서 번역된 텍스트 적용
-                    print("  3단계: 서식 보존하며 번역 텍스트 적용 중...")
-                    applied_count = self.apply_translation_to_slide(slide, text_elements)
+                        return
+
+                    logger.debug(f"  3단계: 슬라이드 {slide_idx + 1} 서식 보존하며 번역 텍스트 적용 중...")
+                    start = time.perf_counter()
+                    applied_count = self.apply_translation_to_slide(prs.slides[slide_idx], text_elements, modified_parts)
+                    elapsed = time.perf_counter() - start
+                    metrics.add_stage_time("apply", elapsed)
+                    metrics.record_slide(slide_idx, apply_seconds=elapsed, applied=applied_count)
                     
                     total_success += applied_count
                     total_failed += len(text_elements) - applied_count
                     
                     if applied_count > 0:
                         slide_success += 1
-                        print(f"  슬라이드 {slide_idx + 1} 완료: {applied_count}/{len(text_elements)}개 요소 성공")
+                        logger.debug(f"  슬라이드 {slide_idx + 1} 완료: {applied_count}/{len(text_elements)}개 요소 성공")
                     else:
                         slide_failed += 1
-                        print(f"  슬라이드 {slide_idx + 1} 실패: 번역 적용되지 않음")
+                        logger.warning(f"  슬라이드 {slide_idx + 1} 실패: 번역 적용되지 않음")
                     
                 except Exception as e:
-                    print(f"  슬라이드 {slide_idx + 1} 처리 중 오류 발생: {str(e)}")
+                    logger.warning(f"  슬라이드 {slide_idx + 1} 처리 중 오류 발생: {str(e)}")
                     slide_failed += 1
-                
-                print()  # 슬라이드 간 구분을 위한 빈 줄
+
+            applied_slides = 0
+            own_executor = executor is None
+            if own_executor:
+                executor = ThreadPoolExecutor(max_workers=self.max_workers)
+            try:
+                for slide_idx, slide in enumerate(prs.slides):
+                    logger.debug(f"슬라이드 {slide_idx + 1}/{total_slides} 처리 중...")
+                    
+                    # 1단계: 텍스트 요소와 서식 템플릿 추출
+                    start = time.perf_counter()
+                    try:
+                        text_elements = self.extract_text_elements_from_slide(slide, styles)
+                    except Exception as e:
+                        logger.warning(f"  슬라이드 {slide_idx + 1} 추출 중 오류 발생: {str(e)}")
+                        text_elements = None
+                    elapsed = time.perf_counter() - start
+                    metrics.add_stage_time("extract", elapsed)
+                    metrics.record_slide(slide_idx, extract_seconds=elapsed,
+                                         elements=len(text_elements) if text_elements is not None else None)
+                    slide_elements[slide_idx] = text_elements
+
+                    # 2단계: 번역 단위를 작업자에게 제출 (다음 슬라이드 추출과 겹쳐서 진행)
+                    batches = []
+                    followers = []
+                    if text_elements:
+                        elements_to_translate = text_elements
+                        if incremental:
+                            elements_to_translate = self.reuse_manifest_translations(text_elements, manifest)
+                            reused_count += len(text_elements) - len(elements_to_translate)
+                        if journal is not None:
+                            remaining = self.restore_from_journal(elements_to_translate, journal)
+                            resumed_count += len(elements_to_translate) - len(remaining)
+                            elements_to_translate = remaining
+                        leaders, followers = deduplicator.split(elements_to_translate)
+                        batches = self.prepare_translation_units(leaders, target_language)
+
+                    # 제출 도중 슬라이드가 완료 처리되지 않도록 1을 더해 두고 마지막에 해제합니다
+                    remaining_units[slide_idx] = len(batches) + 1
+                    submitted_at[slide_idx] = time.perf_counter()
+                    metrics.record_slide(slide_idx, translation_units=len(batches))
+                    if batches:
+                        logger.debug(f"  2단계: {sum(len(batch) for batch in batches)}개 텍스트 요소 번역 요청 제출")
+                    for batch in batches:
+                        future = self.submit(executor, self.translate_unit, batch, target_language)
+                        deduplicator.attach_future(batch, future)
+                        future.add_done_callback(lambda _, idx=slide_idx: on_unit_done(idx))
+
+                    # 중복 세그먼트는 대표 요소의 번역이 끝나면 결과를 공유합니다
+                    for follower, leader in followers:
+                        leader_future = deduplicator.future_of(leader)
+                        if leader_future is None:
+                            deduplicator.copy_translation(follower, leader)
+                            continue
+                        with remaining_lock:
+                            remaining_units[slide_idx] += 1
+                        leader_future.add_done_callback(
+                            lambda _, f=follower, l=leader, idx=slide_idx: (
+                                deduplicator.copy_translation(f, l), on_unit_done(idx)))
+                    on_unit_done(slide_idx)
+
+                    # 번역이 끝난 슬라이드는 기다리지 않고 바로 적용합니다
+                    while True:
+                        try:
+                            apply_slide(completed_slides.get_nowait())
+                            applied_slides += 1
+                        except queue.Empty:
+                            break
+
+                # 남은 슬라이드는 번역이 끝나는 대로 적용합니다 (대기 시간은 번역 대기 단계로 기록)
+                while applied_slides < total_slides:
+                    with metrics.stage("translate_wait"):
+                        slide_idx = completed_slides.get()
+                    apply_slide(slide_idx)
+                    applied_slides += 1
+            finally:
+                if own_executor:
+                    executor.shutdown(wait=True)
+
+            if incremental:
+                logger.info(f"\n증분 번역: {reused_count}개 요소 재사용")
+            if resumed_count:
+                logger.info(f"체크포인트 재개: {resumed_count}개 요소를 저널에서 복원")
+            self.print_dedup_stats(deduplicator)
+            self.print_style_stats(styles)
             
             # 번역된 파일 저장
             try:
-                prs.save(output_file)
-                print(f"번역 완료! 저장된 파일: {output_file}")
-                print(f"슬라이드 처리 결과: 성공 {slide_success}개, 실패 {slide_failed}개")
-                print(f"텍스트 요소 처리 결과: 성공 {total_success}개, 실패 {total_failed}개")
+                with metrics.stage("save"):
+                    self.save_presentation(prs, input_file, output_file, modified_parts)
+                    if incremental:
+                        self.save_manifest(output_file, target_language, manifest_elements)
+                # 결과 파일이 저장되었으므로 체크포인트 저널은 더 이상 필요 없습니다
+                if journal is not None:
+                    journal.discard()
+                logger.info(f"번역 완료! 저장된 파일: {output_file}")
+                logger.info(f"슬라이드 처리 결과: 성공 {slide_success}개, 실패 {slide_failed}개")
+                logger.info(f"텍스트 요소 처리 결과: 성공 {total_success}개, 실패 {total_failed}개")
+                cache_stats = self.cache.stats()
+                logger.info(f"번역 캐시: 메모리 적중 {cache_stats['memory_hits']}개, 디스크 적중 {cache_stats['disk_hits']}개, "
+                            f"미스 {cache_stats['misses']}개 (적중률 {cache_stats['hit_rate']:.1%})")
+                limiter_stats = self.rate_limiter.stats()
+                logger.info(f"요청 스케줄러: 요청 {limiter_stats['requests']}개, 제한 오류 {limiter_stats['throttles']}개, "
+                            f"재시도 {limiter_stats['retries']}개, 포기 {limiter_stats['give_ups']}개, "
+                            f"평균 대기 {limiter_stats['avg_queue_wait']}초")
+                self.print_peak_memory()
+                report = self.build_run_report(
+                    metrics, input_file=input_file, output_files=[output_file], target_languages=[target_language],
+                    slides={"success": slide_success, "failed": slide_failed},
+                    elements={"success": total_success, "failed": total_failed, "reused": reused_count,
+                              "resumed": resumed_count},
+                    dedup=deduplicator.stats(), styles=styles.stats()
+                )
+                self.print_usage_stats(report)
+                if self.write_report:
+                    self.save_run_report(output_file, report)
                 return slide_success > 0
             except Exception as e:
-                print(f"파일 저장 중 오류 발생: {str(e)}")
+                logger.warning(f"파일 저장 중 오류 발생: {str(e)}")
                 return False
             
         except Exception as e:
-            print(f"프레젠테이션 로드 중 오류 발생: {str(e)}")
+            logger.warning(f"프레젠테이션 로드 중 오류 발생: {str(e)}")
             return False
+        finally:
+            # 실행 중 모아 둔 캐시 적중 항목의 사용 시각을 기록합니다
+            self.cache.flush()
+            current_glossary.reset(glossary_token)
+            current_journals.reset(journals_token)
+            current_run_metrics.reset(metrics_token)
+            if journal is not None:
+                journal.close()
+            if prs is not None:
+                self.close_presentation(prs)
     
+    def print_dedup_stats(self, deduplicator: SegmentDeduplicator):
+        """중복 제거 통계를 출력합니다."""
+        dedup_stats = deduplicator.stats()
+        logger.info(f"중복 제거: 전체 {dedup_stats['total_segments']}개 세그먼트 중 고유 {dedup_stats['unique_segments']}개 "
+                    f"(중복 {dedup_stats['duplicate_segments']}개, 중복률 {dedup_stats['dedup_ratio']:.1%})")
+    def report_path(self, output_file: str) -> str:
+        """출력 파일 옆에 저장되는 실행 보고서 경로를 반환합니다."""
+        return f"{output_file}.report.json"
+    def build_run_report(self, metrics: RunMetrics, **summary) -> Dict[str, Any]:
+        """계측값과 실행 결과 요약, 캐시/스케줄러 통계를 하나의 실행 보고서로 묶습니다."""
+        report = {
+            "version": 1,
+            "model_id": self.model_id,
+            "settings": {
+                "max_workers": self.max_workers,
+                "small_model_id": self.small_model_id,
+                "dynamic_max_tokens": self.dynamic_max_tokens,
+                "prefilter": list(self.segment_filter.rules) if self.segment_filter else None,
+                "chunk_tokens": self.chunk_tokens,
+                "prompt_caching": self.prompt_caching,
+                "glossary": current_glossary.get().source if current_glossary.get() is not None else None,
+                "batch_mode": self.batch_mode,
+                "streaming": self.streaming,
+                "extraction_engine": self.extraction_engine,
+                "apply_engine": self.apply_engine,
+                "lazy_loading": self.lazy_loading,
+                "partial_save": self.partial_save
+            }
+        }
+        report.update(summary)
+        report.update(metrics.report())
+        report["cache"] = self.cache.stats()
+        report["scheduler"] = self.rate_limiter.stats()
+        report["peak_memory_mb"] = peak_memory_mb()
+        return report
+    def save_run_report(self, output_file: str, report: Dict[str, Any], path: Optional[str] = None):
+        """실행 보고서를 JSON 파일로 저장합니다 (path를 생략하면 출력 파일 옆의 기본 경로)."""
+        path = path or self.report_path(output_file)
+        try:
+            temp_path = f"{path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            os.replace(temp_path, path)
+            logger.info(f"실행 보고서 저장: {path}")
+        except Exception as e:
+            logger.warning(f"실행 보고서 저장 중 오류: {str(e)}")
+    def print_usage_stats(self, report: Dict[str, Any]):
+        """단계별 소요 시간과 토큰 사용량, 예상 비용을 출력합니다."""
+        stages = ", ".join(f"{name} {seconds:.2f}초" for name, seconds in report["stages"].items())
+        logger.info(f"단계별 소요 시간: {stages} (전체 {report['wall_seconds']:.2f}초)")
+        totals = report["totals"]
+        cost = f"${totals['estimated_cost_usd']:.4f}" if report["models"] else "$0"
+        logger.info(f"토큰 사용량: 요청 {totals['requests']}개, 입력 {totals['input_tokens']}개, "
+                    f"출력 {totals['output_tokens']}개, 예상 비용 {cost}")
+        if totals["cache_read_input_tokens"] or totals["cache_creation_input_tokens"]:
+            logger.info(f"프롬프트 캐시: 캐시 읽기 {totals['cache_read_input_tokens']}토큰, "
+                        f"캐시 쓰기 {totals['cache_creation_input_tokens']}토큰")
+        prefilter = report["prefilter"]
+        if prefilter["segments"]:
+            reasons = ", ".join(f"{reason} {count}개" for reason, count in prefilter["segments"].items())
+            logger.info(f"사전 필터: {sum(prefilter['segments'].values())}개 세그먼트를 번역 없이 유지 ({reasons}), "
+                        f"모델 호출 {prefilter['saved_calls']}회 절약")
+    def print_style_stats(self, styles: StyleTable):
+        """스타일 테이블 통계를 출력합니다."""
+        style_stats = styles.stats()
+        logger.info(f"스타일 테이블: Run {style_stats['runs']}개 중 고유 서식 {style_stats['run_styles']}개, "
+                    f"단락 {style_stats['paragraphs']}개 중 고유 서식 {style_stats['paragraph_styles']}개")
+    def translate_presentation_multi(self, input_file: str, target_languages: List[str],
+                                     output_dir: Optional[str] = None, combined_prompt: bool = False,
+                                     incremental: bool = False,
+                                     executor: Optional[ThreadPoolExecutor] = None) -> Dict[str, bool]:
+        """프레젠테이션을 한 번만 로드/추출하여 여러 언어로 번역하고 언어별 파일로 저장합니다.
+
+        combined_prompt=True이면 한 번의 모델 호출로 모든 대상 언어의 번역을 요청합니다.
+        결과는 출력 파일 경로별 성공 여부입니다.
+        """
+        unsupported = [lang for lang in target_languages if lang not in self.supported_languages]
+        if unsupported:
+            logger.error(f"지원하지 않는 언어입니다: {unsupported}. 지원 언어: {list(self.supported_languages.keys())}")
+            return {}
+        
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        output_files = {lang: self.build_output_path(input_file, lang, output_dir) for lang in target_languages}
+        results = {output_file: False for output_file in output_files.values()}
+        
+        metrics = RunMetrics(parent=self.metrics)
+        metrics_token = current_run_metrics.set(metrics)
+        journals: Dict[str, TranslationJournal] = {}
+        journals_token = current_journals.set(journals)
+        glossary_token = current_glossary.set(self.load_glossary(input_file))
+        try:
+            return self._translate_presentation_multi(input_file, target_languages, output_files, results, metrics,
+                                                      combined_prompt, incremental, executor)
+        finally:
+            # 실행 중 모아 둔 캐시 적중 항목의 사용 시각을 기록합니다
+            self.cache.flush()
+            current_glossary.reset(glossary_token)
+            current_journals.reset(journals_token)
+            current_run_metrics.reset(metrics_token)
+            for journal in journals.values():
+                journal.close()
+    def _translate_presentation_multi(self, input_file: str, target_languages: List[str], output_files: Dict[str, str],
+                                      results: Dict[str, bool], metrics: RunMetrics, combined_prompt: bool,
+                                      incremental: bool, executor: Optional[ThreadPoolExecutor]) -> Dict[str, bool]:
+        """translate_presentation_multi의 본체: 로드, 추출, 번역, 언어별 적용과 저장을 계측하며 수행합니다."""
+        try:
+            with metrics.stage("load"):
+                prs = self.load_presentation(input_file)
+            # python-pptx 프록시 객체가 캐시되기 전에 원본 패키지 사본을 만들어 둡니다.
+            # (추출 후 복사하면 캐시된 프록시가 원본과 분리된 XML 사본을 가리키게 됩니다)
+            # 지연 로딩 패키지는 적용할 때마다 원본 ZIP에서 슬라이드를 다시 파싱하므로 사본이 필요 없습니다.
+            pristine = copy.deepcopy(prs) if len(target_languages) > 1 and not self.lazy_loading else None
+        except Exception as e:
+            logger.warning(f"프레젠테이션 로드 중 오류 발생: {str(e)}")
+            return results
+        
+        total_slides = len(prs.slides)
+        language_names = ", ".join(self.supported_languages[lang] for lang in target_languages)
+        logger.info(f"다국어 번역 시작: {total_slides}개 슬라이드를 {language_names}로 번역합니다...")
+        
+        # 1단계: 추출과 서식 템플릿 생성은 한 번만 수행합니다
+        logger.info("1단계: 텍스트 및 서식 정보 추출 중...")
+        styles = StyleTable()
+        slide_elements = []
+        for slide_idx, slide in enumerate(prs.slides):
+            start = time.perf_counter()
+            try:
+                slide_elements.append(self.extract_text_elements_from_slide(slide, styles))
+            except Exception as e:
+                logger.warning(f"  슬라이드 {slide_idx + 1} 추출 중 오류 발생: {str(e)}")
+                slide_elements.append(None)
+            elapsed = time.perf_counter() - start
+            metrics.add_stage_time("extract", elapsed)
+            metrics.record_slide(slide_idx, extract_seconds=elapsed,
+                                 elements=len(slide_elements[-1]) if slide_elements[-1] is not None else None)
+        
+        self.print_style_stats(styles)
+        
+        # 언어별 요소 사본 (서식 템플릿은 공유하고 번역 결과만 분리)
+        language_elements = {
+            lang: [[copy.copy(element) for element in elements] if elements is not None else None
+                   for elements in slide_elements]
+            for lang in target_languages
+        }
+        flat_elements = {
+            lang: [element for elements in language_elements[lang] if elements for element in elements]
+            for lang in target_languages
+        }
+        
+        if incremental:
+            for lang in target_languages:
+                manifest = self.load_manifest(output_files[lang], lang)
+                changed = self.reuse_manifest_translations(flat_elements[lang], manifest)
+                logger.info(f"  증분 번역 ({lang}): {len(flat_elements[lang]) - len(changed)}개 요소 재사용")
+        
+        if self.checkpoint:
+            journals = current_journals.get()
+            for lang in target_languages:
+                journal = self.open_journal(input_file, output_files[lang], lang)
+                if journal is None:
+                    continue
+                journals[lang] = journal
+                pending = [element for element in flat_elements[lang] if not element.is_translated]
+                remaining = self.restore_from_journal(pending, journal)
+                if len(remaining) < len(pending):
+                    logger.info(f"  체크포인트 재개 ({lang}): {len(pending) - len(remaining)}개 요소를 저널에서 복원")
+        
+        # 2단계: 모든 언어의 번역 요청을 하나의 작업 큐에 제출합니다
+        logger.info(f"2단계: {len(flat_elements[target_languages[0]])}개 텍스트 요소를 {len(target_languages)}개 언어로 번역 중...")
+        own_executor = executor is None
+        if own_executor:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        translate_start = time.perf_counter()
+        try:
+            # 동일한 세그먼트는 언어별로 대표 요소만 번역하고 나머지는 결과를 공유합니다
+            deduplicators = {lang: SegmentDeduplicator() for lang in target_languages}
+            leaders = {}
+            followers = {}
+            for lang in target_languages:
+                pending = [element for element in flat_elements[lang] if not element.is_translated]
+                leaders[lang], followers[lang] = deduplicators[lang].split(pending)
+            
+            futures = []
+            if combined_prompt and len(target_languages) > 1:
+                leader_ids = {lang: {id(element) for element in leaders[lang]} for lang in target_languages}
+                for index in range(len(flat_elements[target_languages[0]])):
+                    elements = {lang: flat_elements[lang][index] for lang in target_languages
+                                if id(flat_elements[lang][index]) in leader_ids[lang]}
+                    units = {lang: self.prepare_translation_units([element], lang)
+                             for lang, element in elements.items()}
+                    languages = [lang for lang, batches in units.items() if batches]
+                    if languages:
+                        futures.append(self.submit(
+                            executor, self.translate_unit_multi, {lang: elements[lang] for lang in languages}))
+            else:
+                for lang in target_languages:
+                    for batch in self.prepare_translation_units(leaders[lang], lang):
+                        futures.append(self.submit(executor, self.translate_unit, batch, lang))
+            for future in futures:
+                future.result()
+            
+            for lang in target_languages:
+                for follower, leader in followers[lang]:
+                    deduplicators[lang].copy_translation(follower, leader)
+            self.print_dedup_stats(deduplicators[target_languages[0]])
+        finally:
+            if own_executor:
+                executor.shutdown(wait=True)
+            metrics.add_stage_time("translate", time.perf_counter() - translate_start)
+        
+        # 3단계: 언어별로 로드된 패키지의 사본에 적용하고 저장합니다 (마지막 언어는 원본에 직접 적용)
+        language_results: Dict[str, Dict[str, Any]] = {}
+        for lang_idx, lang in enumerate(target_languages):
+            output_file = output_files[lang]
+            logger.info(f"\n3단계: {self.supported_languages[lang]} 번역 적용 중...")
+            if self.lazy_loading or lang_idx == len(target_languages) - 1:
+                target_prs = prs
+            else:
+                target_prs = copy.deepcopy(pristine)
+            
+            slide_success = 0
+            slide_failed = 0
+            total_success = 0
+            total_failed = 0
+            modified_parts: Dict[str, Any] = {}
+            for slide_idx, text_elements in enumerate(language_elements[lang]):
+                if text_elements is None:
+                    slide_failed += 1
+                    continue
+                if not text_elements:
+                    slide_success += 1
+                    continue
+                try:
+                    start = time.perf_counter()
+                    applied_count = self.apply_translation_to_slide(target_prs.slides[slide_idx], text_elements,
+                                                                    modified_parts)
+                    elapsed = time.perf_counter() - start
+                    metrics.add_stage_time("apply", elapsed)
+                    metrics.record_slide(slide_idx, apply_seconds=elapsed)
+                    total_success += applied_count
+                    total_failed += len(text_elements) - applied_count
+                    if applied_count > 0:
+                        slide_success += 1
+                    else:
+                        slide_failed += 1
+                except Exception as e:
+                    logger.warning(f"  슬라이드 {slide_idx + 1} 처리 중 오류 발생: {str(e)}")
+                    slide_failed += 1
+            
+            try:
+                with metrics.stage("save"):
+                    self.save_presentation(target_prs, input_file, output_file, modified_parts)
+                    if incremental:
+                        self.save_manifest(output_file, lang, flat_elements[lang])
+                if lang in current_journals.get():
+                    current_journals.get().pop(lang).discard()
+                logger.info(f"번역 완료! 저장된 파일: {output_file}")
+                logger.info(f"슬라이드 처리 결과: 성공 {slide_success}개, 실패 {slide_failed}개")
+                logger.info(f"텍스트 요소 처리 결과: 성공 {total_success}개, 실패 {total_failed}개")
+                results[output_file] = slide_success > 0
+                language_results[lang] = {"slides": {"success": slide_success, "failed": slide_failed},
+                                          "elements": {"success": total_success, "failed": total_failed}}
+            except Exception as e:
+                logger.warning(f"파일 저장 중 오류 발생: {str(e)}")
+            finally:
+                del target_prs
+        
+        del pristine
+        self.close_presentation(prs)
+        self.print_peak_memory()
+        
+        # 모든 언어가 추출과 번역 요청을 공유하므로 같은 실행 보고서를 언어별 출력 파일 옆에 저장합니다
+        report = self.build_run_report(
+            metrics, input_file=input_file, output_files=list(output_files.values()),
+            target_languages=target_languages, languages=language_results,
+            dedup=deduplicators[target_languages[0]].stats(), styles=styles.stats()
+        )
+        self.print_usage_stats(report)
+        if self.write_report:
+            for lang, output_file in output_files.items():
+                if lang in language_results:
+                    self.save_run_report(output_file, report)
+        return results
+    def translate_unit_multi(self, elements: Dict[str, TextElement]) -> Dict[str, TextElement]:
+        """같은 원문을 가진 언어별 요소들을 한 번의 다국어 요청으로 번역하여 기록합니다."""
+        source_text = next(iter(elements.values())).original_text
+        try:
+            translations = self.translate_text_multi(source_text, list(elements.keys()))
+        except Exception as e:
+            logger.warning(f"    번역 작업 중 오류 발생: {str(e)}")
+            translations = {}
+        
+        for lang, element in elements.items():
+            translated_text = translations.get(lang)
+            if translated_text is None:
+                element.translated_text = element.original_text
+            else:
+                element.translated_text = translated_text
+                element.is_translated = True
+                self.cache.put(self.cache.make_key(element.original_text, lang, self.cache_model(element.original_text)),
+                               translated_text)
+                self.checkpoint_translation(element, lang)
+        logger.debug(f"    번역 완료: '{source_text[:30]}...' -> {len(elements)}개 언어")
+        return elements
+    def build_output_path(self, input_file: str, target_language: str, output_dir: Optional[str] = None) -> str:
+        """번역 결과 파일 경로를 생성합니다."""
+        base_name = os.path.splitext(input_file)[0]
+        if output_dir:
+            base_name = os.path.join(output_dir, os.path.basename(base_name))
+        return f"{base_name}_translated_improved_{target_language}.pptx"
+    def collect_input_files(self, inputs: List[str]) -> List[str]:
+        """파일, 디렉터리, glob 패턴 목록에서 번역할 .pptx 파일 목록을 수집합니다."""
+        import glob
+        
+        files = []
+        for item in inputs:
+            if os.path.isdir(item):
+                candidates = sorted(glob.glob(os.path.join(item, "*.pptx")))
+            elif os.path.isfile(item):
+                candidates = [item]
+            else:
+                candidates = sorted(glob.glob(item, recursive=True))
+            
+            for path in candidates:
+                # 이전 실행의 번역 결과와 PowerPoint 임시 파일은 제외합니다
+                name = os.path.basename(path)
+                if "_translated_" in name or name.startswith("~$"):
+                    continue
+                if path.lower().endswith(".pptx") and path not in files:
+                    files.append(path)
+        return files
+    def translate_files(self, input_files: List[str], target_languages: List[str], output_dir: Optional[str] = None,
+                        incremental: bool = False, file_workers: int = 2,
+                        combined_prompt: bool = False) -> Dict[str, bool]:
+        """여러 파일을 여러 언어로 번역합니다.
+
+        모든 (파일, 언어) 작업의 번역 요청은 하나의 작업 큐, 동시성 제한, 캐시, 요청 스케줄러를 공유하며
+        각 파일은 번역이 끝나는 즉시 저장됩니다. 결과는 출력 파일 경로별 성공 여부입니다.
+        """
+        unsupported = [lang for lang in target_languages if lang not in self.supported_languages]
+        if unsupported:
+            logger.error(f"지원하지 않는 언어입니다: {unsupported}. 지원 언어: {list(self.supported_languages.keys())}")
+            return {}
+        
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        
+        total_jobs = len(input_files) * len(target_languages)
+        logger.info(f"일괄 번역 시작: {len(input_files)}개 파일 x {len(target_languages)}개 언어 = {total_jobs}개 작업\n")
+        
+        results = {}
+        
+        def translate_single(input_file):
+            output_file = self.build_output_path(input_file, target_languages[0], output_dir)
+            return {output_file: self.translate_presentation(input_file, output_file, target_languages[0],
+                                                             incremental, translation_executor)}
+        
+        # 번역 요청은 공유 작업 큐에서, 파일 단위 추출/적용/저장은 별도 스레드에서 동시에 진행합니다.
+        # 여러 언어로 번역할 때는 파일마다 한 번만 추출하고 언어별로 분기합니다.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as translation_executor:
+            with ThreadPoolExecutor(max_workers=max(1, file_workers)) as file_executor:
+                futures = {}
+                for input_file in input_files:
+                    if len(target_languages) > 1:
+                        future = file_executor.submit(self.translate_presentation_multi, input_file, target_languages,
+                                                      output_dir, combined_prompt, incremental, translation_executor)
+                    else:
+                        future = file_executor.submit(translate_single, input_file)
+                    futures[future] = input_file
+                
+                for future in as_completed(futures):
+                    input_file = futures[future]
+                    try:
+                        file_results = future.result()
+                    except Exception as e:
+                        logger.warning(f"{input_file} 번역 중 오류 발생: {str(e)}")
+                        file_results = {self.build_output_path(input_file, lang, output_dir): False
+                                        for lang in target_languages}
+                    for output_file, ok in file_results.items():
+                        results[output_file] = ok
+                        logger.info(f"[{len(results)}/{total_jobs}] {'성공' if ok else '실패'}: {output_file}")
+        
+        succeeded = sum(1 for ok in results.values() if ok)
+        logger.info(f"\n일괄 번역 완료: 성공 {succeeded}개, 실패 {len(results) - succeeded}개")
+        return results
     def show_supported_languages(self):
         """지원하는 언어 목록을 출력합니다."""
         print("지원하는 언어:")
         for code, name in self.supported_languages.items():
             print(f"  {code}: {name}")
 
+def parse_args(argv=None):
+    """일괄 번역 모드의 명령줄 인자를 해석합니다."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Amazon Bedrock을 사용한 PowerPoint 번역기")
+    parser.add_argument("inputs", nargs="*", help="번역할 .pptx 파일, 디렉터리 또는 glob 패턴")
+    parser.add_argument("-l", "--languages", nargs="+", default=[], help="대상 언어 코드 목록 (예: ko ja zh)")
+    parser.add_argument("-o", "--output-dir", default=None, help="번역 결과를 저장할 디렉터리 (기본값: 원본과 같은 위치)")
+    parser.add_argument("-w", "--workers", type=int, default=4, help="동시 번역 요청 수")
+    parser.add_argument("--file-workers", type=int, default=2, help="동시에 처리할 파일 수")
+    parser.add_argument("--batch-mode", action="store_true", help="여러 세그먼트를 한 번의 요청으로 묶어 번역")
+    parser.add_argument("--incremental", action="store_true", help="변경된 요소만 다시 번역")
+    parser.add_argument("--combined-languages", action="store_true",
+                        help="여러 대상 언어의 번역을 한 번의 요청으로 받음")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_PATH, help="번역 캐시 파일 경로")
+    parser.add_argument("--no-cache", action="store_true", help="영구 번역 캐시를 사용하지 않음")
+    parser.add_argument("--rpm", type=int, default=None, help="분당 요청 할당량")
+    parser.add_argument("--tpm", type=int, default=None, help="분당 토큰 할당량")
+    parser.add_argument("--pool-size", type=int, default=None, help="Bedrock 연결 풀 크기 (기본값: 동시 요청 수의 2배)")
+    parser.add_argument("--stream", action="store_true", help="입력이 긴 배치/다국어 요청은 응답 스트림으로 받아 완성된 세그먼트를 도착하는 대로 파싱하고, "
+                             "응답이 끊기면 받은 세그먼트는 유지한 채 나머지만 다시 요청")
+    parser.add_argument("--extraction-engine", choices=["pptx", "xpath"], default="pptx",
+                        help="텍스트 추출 엔진 (xpath: 슬라이드 XML을 직접 조회하는 고속 엔진)")
+    parser.add_argument("--backend", choices=["bedrock", "stub"], default="bedrock",
+                        help="번역 백엔드 (stub: Bedrock을 호출하지 않는 오프라인 테스트용)")
+    parser.add_argument("--apply-engine", choices=["pptx", "xml"], default="xml",
+                        help="번역 적용 엔진 (xml: 단락 서브트리를 한 번에 교체, pptx: python-pptx 객체로 재구성)")
+    parser.add_argument("--benchmark-apply", action="store_true",
+                        help="번역 없이 두 적용 엔진의 적용 시간과 결과 일치 여부를 비교")
+    parser.add_argument("--lazy", action="store_true",
+                        help="미디어 파트를 읽지 않는 텍스트 전용 지연 로딩 (대용량 덱의 메모리 사용량 절감)")
+    parser.add_argument("--full-save", action="store_true",
+                        help="변경된 파트만 다시 쓰는 부분 저장 대신 python-pptx로 전체 패키지를 저장")
+    parser.add_argument("-v", "--verbose", action="count", default=0,
+                        help="진행 상황 출력 (-v: 단계/요약, -vv: 슬라이드/요소 단위 상세 로그)")
+    parser.add_argument("--log-level", choices=["debug", "info", "warning", "error"], default=None,
+                        help="로그 수준을 직접 지정 (기본값: warning, -v보다 우선)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Bedrock을 호출하지 않고 추출만 수행하여 호출 수, 토큰, 예상 비용과 소요 시간을 추정")
+    parser.add_argument("--model", default=DEFAULT_MODEL_ID, help="기본 번역 모델 ID")
+    parser.add_argument("--small-model", nargs="?", const=DEFAULT_SMALL_MODEL_ID, default=None,
+                        help=f"짧은 세그먼트를 보낼 경량 모델 ID (값 없이 지정하면 {DEFAULT_SMALL_MODEL_ID})")
+    parser.add_argument("--small-model-max-tokens", type=int, default=40,
+                        help="경량 모델로 보낼 세그먼트의 최대 추정 토큰 수")
+    parser.add_argument("--small-model-max-lines", type=int, default=1,
+                        help="경량 모델로 보낼 세그먼트의 최대 줄 수")
+    parser.add_argument("--fixed-max-tokens", action="store_true",
+                        help="원문 길이로 응답 최대 토큰 수를 계산하지 않고 항상 4000 사용")
+    parser.add_argument("--no-prefilter", action="store_true",
+                        help="숫자, 날짜, URL, 코드 등 번역이 필요 없는 세그먼트도 모델로 보냄")
+    parser.add_argument("--prefilter-rules", nargs="+", choices=SegmentFilter.RULES, default=None,
+                        help="사용할 사전 필터 규칙 (기본값: 모든 규칙)")
+    parser.add_argument("--chunk-tokens", type=int, default=None,
+                        help="추정 토큰 수가 이 값을 넘는 텍스트는 단락/문장 경계에서 나누어 병렬로 번역")
+    parser.add_argument("--glossary", default=None,
+                        help="모든 파일에 적용할 용어집 (.json 또는 '용어 = 번역' 형식의 텍스트, "
+                             "지정하지 않으면 입력 파일 옆의 <파일명>.glossary.json|.txt 사용)")
+    parser.add_argument("--prompt-cache", action="store_true",
+                        help="지시문과 용어집으로 된 고정 접두부에 Bedrock 프롬프트 캐시(cache_control)를 사용")
+    parser.add_argument("--checkpoint", action="store_true",
+                        help="번역 결과를 저널에 즉시 기록하고, 중단된 번역은 다음 실행에서 이어서 진행")
+    parser.add_argument("--bulk", choices=["prepare", "submit", "status", "ingest"], default=None,
+                        help="Bedrock 배치 추론을 사용하는 비동기 일괄 모드의 단계 "
+                             "(prepare: 입력 JSONL 생성, submit: 작업 제출, status: 상태 확인, ingest: 결과 적용)")
+    parser.add_argument("--bulk-dir", default="bulk_job", help="일괄 작업의 입력 JSONL, 매니페스트, 출력을 저장할 디렉터리")
+    parser.add_argument("--bulk-service", choices=["local", "bedrock"], default="local",
+                        help="배치 추론 작업 서비스 (local: 번역 백엔드로 레코드를 처리하는 로컬 파일 기반 대체 서비스)")
+    parser.add_argument("--bulk-s3-uri", default=None, help="Bedrock 배치 추론 입력/출력을 저장할 S3 URI (s3://버킷/경로)")
+    parser.add_argument("--bulk-role-arn", default=None, help="Bedrock 배치 추론 작업이 S3에 접근할 IAM 역할 ARN")
+    parser.add_argument("--bulk-output", default=None,
+                        help="ingest 단계에서 사용할 출력 JSONL (직접 실행한 작업의 결과를 넘겨받을 때)")
+    parser.add_argument("--distributed", choices=["coordinator", "worker", "status"], default=None,
+                        help="분산 모드 (coordinator: 추출/적용/저장과 작업 큐 관리, worker: 큐의 번역 작업 처리, "
+                             "status: 큐 진행 상황 출력)")
+    parser.add_argument("--queue", default="translation_queue.db",
+                        help="분산 모드의 SQLite 작업 큐 파일 (여러 호스트는 공유 파일 시스템 경로 사용)")
+    parser.add_argument("--visibility-timeout", type=float, default=300.0,
+                        help="작업자가 가져간 작업을 다른 작업자가 다시 가져갈 수 있게 되기까지의 시간(초)")
+    parser.add_argument("--max-attempts", type=int, default=3, help="분산 모드에서 작업당 최대 시도 횟수")
+    parser.add_argument("--worker-idle-exit", type=float, default=None,
+                        help="작업자가 이 시간(초) 동안 가져갈 작업이 없으면 종료 (기본값: 계속 대기)")
+    parser.add_argument("--local-workers", type=int, default=0,
+                        help="조정자가 이 호스트에서 함께 실행할 작업자 프로세스 수")
+    parser.add_argument("--stall-timeout", type=float, default=None,
+                        help="조정자가 작업자 활동 없이 기다리는 최대 시간(초) (기본값: 가시성 제한 시간의 2배 + 재시도 지연, "
+                             "0이면 계속 대기)")
+    parser.add_argument("--report", action="store_true",
+                        help="번역이 끝나면 출력 파일 옆에 단계별 시간, 토큰 사용량, 예상 비용을 담은 JSON 보고서 저장")
+    return parser.parse_args(argv)
+
+def run_batch(args) -> bool:
+    """명령줄 인자로 지정된 파일들을 비대화형으로 일괄 번역합니다."""
+    if args.log_level:
+        configure_logging(getattr(logging, args.log_level.upper()))
+    elif args.verbose:
+        configure_logging(logging.DEBUG if args.verbose > 1 else logging.INFO)
+    
+    if args.backend == "stub":
+        backend = StubBackend()
+    else:
+        backend = BedrockBackend(pool_size=args.pool_size or max(10, args.workers * 2))
+    
+    translator = PowerPointTranslatorImproved(
+        backend=backend,
+        streaming=args.stream,
+        extraction_engine=args.extraction_engine,
+        partial_save=not args.full_save,
+        lazy_loading=args.lazy,
+        apply_engine=args.apply_engine,
+        write_report=args.report,
+        checkpoint=args.checkpoint,
+        model_id=args.model,
+        small_model_id=args.small_model,
+        small_model_max_tokens=args.small_model_max_tokens,
+        small_model_max_lines=args.small_model_max_lines,
+        dynamic_max_tokens=not args.fixed_max_tokens,
+        prefilter=not args.no_prefilter,
+        prefilter_rules=args.prefilter_rules,
+        chunk_tokens=args.chunk_tokens,
+        prompt_caching=args.prompt_cache,
+        glossary_path=args.glossary,
+        max_workers=args.workers,
+        batch_mode=args.batch_mode,
+        cache_path=None if args.no_cache else args.cache,
+        requests_per_minute=args.rpm,
+        tokens_per_minute=args.tpm
+    )
+    
+    if args.benchmark_apply:
+        input_files = translator.collect_input_files(args.inputs)
+        for input_file in input_files:
+            result = translator.benchmark_apply_engines(input_file)
+            print(f"{input_file}: 텍스트 프레임 {result['text_frames']}개, "
+                  f"pptx {result['pptx_seconds']}초, xml {result['xml_seconds']}초 "
+                  f"({result['speedup']}배), 결과 일치: {result['identical']}")
+        return bool(input_files)
+    
+    if args.bulk and args.bulk != "prepare":
+        return run_bulk(translator, backend, args)
+    
+    if args.distributed in ("worker", "status"):
+        return run_distributed(translator, args, [])
+    
+    if not args.languages:
+        print("대상 언어를 하나 이상 지정하세요 (-l ko ja ...).")
+        translator.show_supported_languages()
+        return False
+    
+    input_files = translator.collect_input_files(args.inputs)
+    if not input_files:
+        print("번역할 .pptx 파일을 찾을 수 없습니다.")
+        return False
+    
+    if args.dry_run:
+        return run_dry_run(translator, input_files, args.languages, args.output_dir, args.report)
+    
+    if args.distributed == "coordinator":
+        return run_distributed(translator, args, input_files)
+    
+    if args.bulk == "prepare":
+        manifest = translator.prepare_bulk_job(input_files, args.languages, args.bulk_dir, args.output_dir)
+        print(f"일괄 작업 준비 완료: 파일 {len(manifest['decks'])}개, 레코드 {len(manifest['records'])}개 -> "
+              f"{os.path.join(args.bulk_dir, manifest['input_file'])}")
+        return True
+    
+    results = translator.translate_files(input_files, args.languages, args.output_dir,
+                                         args.incremental, args.file_workers, args.combined_languages)
+    return bool(results) and all(results.values())
+
+def run_bulk(translator: PowerPointTranslatorImproved, backend, args) -> bool:
+    """준비된 일괄 작업을 제출하거나, 상태를 확인하거나, 결과를 내려받아 덱에 적용합니다."""
+    if args.bulk_service == "bedrock":
+        if not (args.bulk_s3_uri and args.bulk_role_arn) and args.bulk != "ingest":
+            print("Bedrock 배치 추론에는 --bulk-s3-uri와 --bulk-role-arn이 필요합니다.")
+            return False
+        service = BedrockBatchService(args.bulk_s3_uri or "", args.bulk_role_arn or "")
+    else:
+        service = LocalBatchService(os.path.join(args.bulk_dir, "local_service"), backend)
+    
+    try:
+        if args.bulk == "submit":
+            job_id = translator.submit_bulk_job(args.bulk_dir, service)
+            print(f"배치 추론 작업 제출: {job_id}")
+            return True
+        if args.bulk == "status":
+            manifest = translator.load_bulk_manifest(args.bulk_dir)
+            if not manifest.get("job"):
+                print("제출된 작업이 없습니다.")
+                return False
+            print(f"배치 추론 작업 {manifest['job']['job_id']} 상태: {service.status(manifest['job']['job_id'])}")
+            return True
+        
+        output_path = args.bulk_output
+        if output_path is None:
+            output_path = translator.download_bulk_output(args.bulk_dir, service)
+            if output_path is None:
+                print("배치 추론 작업이 아직 끝나지 않았습니다.")
+                return False
+        results = translator.ingest_bulk_output(args.bulk_dir, output_path)
+    except Exception as e:
+        print(f"일괄 작업 처리 중 오류 발생: {str(e)}")
+        return False
+    
+    succeeded = sum(1 for ok in results.values() if ok)
+    print(f"일괄 작업 적용 완료: 성공 {succeeded}개, 실패 {len(results) - succeeded}개")
+    return bool(results) and all(results.values())
+
+def worker_command(args) -> List[str]:
+    """조정자와 같은 설정으로 작업자 프로세스를 실행하는 명령줄을 만듭니다."""
+    command = [sys.executable, os.path.abspath(__file__), "--distributed", "worker", "--queue", args.queue,
+               "--backend", args.backend, "--model", args.model, "-w", str(args.workers),
+               "--visibility-timeout", str(args.visibility_timeout), "--max-attempts", str(args.max_attempts)]
+    for flag, value in (("--rpm", args.rpm), ("--tpm", args.tpm), ("--chunk-tokens", args.chunk_tokens),
+                        ("--worker-idle-exit", args.worker_idle_exit), ("--pool-size", args.pool_size),
+                        ("--log-level", args.log_level)):
+        if value is not None:
+            command += [flag, str(value)]
+    if args.small_model:
+        command += ["--small-model", args.small_model, "--small-model-max-tokens", str(args.small_model_max_tokens),
+                    "--small-model-max-lines", str(args.small_model_max_lines)]
+    if args.fixed_max_tokens:
+        command.append("--fixed-max-tokens")
+    if args.prompt_cache:
+        command.append("--prompt-cache")
+    if args.stream:
+        command.append("--stream")
+    if args.verbose:
+        command.append("-" + "v" * args.verbose)
+    return command
+
+def run_distributed(translator: PowerPointTranslatorImproved, args, input_files: List[str]) -> bool:
+    """분산 모드의 조정자, 작업자 또는 진행 상황 조회를 실행합니다."""
+    import subprocess
+
+    work_queue = SQLiteWorkQueue(args.queue, visibility_timeout=args.visibility_timeout,
+                                 max_attempts=args.max_attempts)
+    try:
+        if args.distributed == "status":
+            for job_id in work_queue.job_ids():
+                progress = work_queue.progress(job_id)
+                print(f"{job_id}: 완료 {progress['done']}/{progress['total']}, 처리 중 {progress['claimed']}, "
+                      f"대기 {progress['pending']}, 재시도 {progress['retries']}, 실패 {progress['failed']}")
+            return True
+        if args.distributed == "worker":
+            translator.run_worker(work_queue, idle_timeout=args.worker_idle_exit)
+            return True
+        
+        # 조정자와 함께 실행한 작업자는 조정자가 끝나면 종료합니다
+        workers = [subprocess.Popen(worker_command(args)) for _ in range(args.local_workers)]
+        try:
+            results = translator.translate_files_distributed(input_files, args.languages, work_queue, args.output_dir,
+                                                             stall_timeout=args.stall_timeout)
+        finally:
+            for worker in workers:
+                worker.terminate()
+            for worker in workers:
+                worker.wait()
+    finally:
+        work_queue.close()
+    
+    succeeded = sum(1 for ok in results.values() if ok)
+    print(f"분산 번역 완료: 성공 {succeeded}개, 실패 {len(results) - succeeded}개")
+    return bool(results) and all(results.values())
+
+def run_dry_run(translator: PowerPointTranslatorImproved, input_files: List[str], target_languages: List[str],
+                output_dir: Optional[str] = None, write_estimates: bool = False) -> bool:
+    """여러 덱의 번역 비용과 시간을 Bedrock 호출 없이 추정하고 전체 합계를 출력합니다."""
+    totals = {"elements": 0, "unique_segments": 0, "model_calls": 0, "input_tokens": 0, "output_tokens": 0,
+              "estimated_cost_usd": 0.0, "projected_seconds": 0.0}
+    ok = True
+    for input_file in input_files:
+        try:
+            estimate = translator.estimate_presentation(input_file, target_languages)
+        except Exception as e:
+            print(f"{input_file}: 사전 추정 중 오류 발생: {str(e)}")
+            ok = False
+            continue
+        element_types = ", ".join(f"{name} {count}" for name, count in estimate["element_types"].items())
+        print(f"{input_file}: 슬라이드 {estimate['slides']}개, 텍스트 요소 {estimate['elements']}개 ({element_types}), "
+              f"고유 세그먼트 {estimate['unique_segments']}개")
+        for lang, language in estimate["languages"].items():
+            cost = language["estimated_cost_usd"]
+            print(f"  {lang}: 사전 필터 {language['prefiltered_segments']}개, "
+                  f"호출 {language['model_calls']}회, 입력 {language['input_tokens']} / "
+                  f"출력 약 {language['output_tokens']} 토큰, "
+                  f"예상 비용 {'알 수 없음' if cost is None else f'${cost:.4f}'}, "
+                  f"예상 번역 시간 {language['projected_translate_seconds']}초 ({language['bottleneck']})")
+            if language["cache_read_input_tokens"]:
+                print(f"    프롬프트 캐시 읽기 약 {language['cache_read_input_tokens']} 토큰")
+        if write_estimates:
+            # 여러 언어의 추정을 담으므로 출력 디렉터리의 입력 파일 이름 옆에 저장합니다
+            base_path = os.path.join(output_dir, os.path.basename(input_file)) if output_dir else input_file
+            translator.save_run_report(base_path, estimate, translator.estimate_path(base_path))
+        totals["elements"] += estimate["elements"]
+        totals["unique_segments"] += estimate["unique_segments"]
+        for name in ("model_calls", "input_tokens", "output_tokens", "projected_seconds"):
+            totals[name] += estimate["totals"][name]
+        totals["estimated_cost_usd"] += estimate["totals"]["estimated_cost_usd"] or 0.0
+    
+    print(f"\n합계: 파일 {len(input_files)}개, 텍스트 요소 {totals['elements']}개, "
+          f"고유 세그먼트 {totals['unique_segments']}개, 호출 {totals['model_calls']}회, "
+          f"입력 {totals['input_tokens']} / 출력 약 {totals['output_tokens']} 토큰, "
+          f"예상 비용 ${totals['estimated_cost_usd']:.4f}, "
+          f"순차 처리 시 예상 시간 {totals['projected_seconds'] / 60:.1f}분")
+    return ok
+
 def main():
+    # 명령줄 인자가 있으면 비대화형 일괄 번역 모드로 실행합니다
+    if len(sys.argv) > 1:
+        sys.exit(0 if run_batch(parse_args()) else 1)
+    
+    # 대화형 모드는 단계별 진행 상황과 요약을 출력합니다
+    configure_logging(logging.INFO)
     translator = PowerPointTranslatorImproved()
     
     print("=== PowerPoint 번역기 (개선된 버전) ===")
-    print("Amazon Bedrock Claude 3.5 Sonnet 사용")
+    print(f"Amazon Bedrock 모델: {translator.model_id}" +
+          (f" (짧은 세그먼트: {translator.small_model_id})" if translator.small_model_id else ""))
     print("템플릿 기반 서식 보존 방식\n")
     
     # 지원 언어 출력
@@ -726,8 +5108,7 @@ def main():
     target_language = input("번역할 언어 코드를 입력하세요 (예: ko, en, ja): ").strip().lower()
     
     # 출력 파일명 생성
-    base_name = os.path.splitext(input_file)[0]
-    output_file = f"{base_name}_translated_improved_{target_language}.pptx"
+    output_file = translator.build_output_path(input_file, target_language)
     
     # 번역 실행
     success = translator.translate_presentation(input_file, output_file, target_language)
@@ -0,0 +1,416 @@
+import argparse
+import contextlib
+import copy
+import hashlib
+import io
+import json
+import os
+import platform
+import random
+import tempfile
+import threading
+import time
+from typing import List, Dict, Any
+
+from pptx import Presentation
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE
+from pptx.util import Inches, Pt
+
+from app import (
+    PROMPT_CACHE_MIN_TOKENS,
+    BedrockBackend,
+    PowerPointTranslatorImproved,
+    SegmentDeduplicator,
+    StyleTable,
+    default_stub_response,
+)
+
+WORDS = [
+    "revenue", "growth", "customer", "platform", "quarter", "strategy", "market", "cloud", "service",
+    "analysis", "pipeline", "security", "migration", "roadmap", "partner", "region", "latency", "model",
+    "adoption", "forecast", "margin", "operations", "insight", "workload", "capacity", "launch",
+]
+FONT_STYLES = [
+    {"name": "Arial", "size": 18, "bold": True, "color": (0x1F, 0x3A, 0x5F)},
+    {"name": "Arial", "size": 14, "bold": False, "color": (0x33, 0x33, 0x33)},
+    {"name": "Calibri", "size": 12, "bold": False, "color": (0x59, 0x59, 0x59)},
+    {"name": "Calibri", "size": 12, "bold": True, "color": (0xC0, 0x00, 0x00)},
+]
+
+
+def synthetic_sentence(rnd: random.Random, min_words: int = 3, max_words: int = 9) -> str:
+    """결정적 난수로 합성 문장을 만듭니다."""
+    words = [rnd.choice(WORDS) for _ in range(rnd.randint(min_words, max_words))]
+    return " ".join(words).capitalize() + "."
+
+
+def fill_text_frame(text_frame, rnd: random.Random, paragraphs: int, runs: int):
+    """텍스트 프레임을 여러 단락과 서식이 다른 Run으로 채웁니다."""
+    text_frame.clear()
+    for p_idx in range(paragraphs):
+        paragraph = text_frame.paragraphs[0] if p_idx == 0 else text_frame.add_paragraph()
+        for _ in range(runs):
+            run = paragraph.add_run()
+            run.text = synthetic_sentence(rnd) + " "
+            style = rnd.choice(FONT_STYLES)
+            run.font.name = style["name"]
+            run.font.size = Pt(style["size"])
+            run.font.bold = style["bold"]
+            run.font.color.rgb = RGBColor(*style["color"])
+
+
+def generate_synthetic_deck(path: str, slides: int = 20, text_boxes: int = 3, grouped_shapes: int = 1,
+                            group_children: int = 3, tables: int = 1, table_rows: int = 5, table_cols: int = 4,
+                            charts: int = 1, paragraphs: int = 2, runs: int = 2, seed: int = 0) -> Dict[str, Any]:
+    """설정한 구성 요소로 합성 .pptx 파일을 생성하고 생성 조건을 반환합니다.
+
+    모든 슬라이드에는 공통 바닥글 텍스트 상자가 하나씩 있어 중복 세그먼트도 포함됩니다.
+    """
+    rnd = random.Random(seed)
+    prs = Presentation()
+    layout = prs.slide_layouts[5]  # 제목만 있는 레이아웃
+
+    for slide_idx in range(slides):
+        slide = prs.slides.add_slide(layout)
+        slide.shapes.title.text = f"{synthetic_sentence(rnd, 2, 5)} ({slide_idx + 1})"
+
+        for box_idx in range(text_boxes):
+            box = slide.shapes.add_textbox(Inches(0.5 + box_idx * 0.2), Inches(1.5 + box_idx * 0.3),
+                                           Inches(4), Inches(1))
+            fill_text_frame(box.text_frame, rnd, paragraphs, runs)
+
+        for _ in range(grouped_shapes):
+            group = slide.shapes.add_group_shape()
+            for child_idx in range(group_children):
+                child = group.shapes.add_textbox(Inches(5), Inches(1.5 + child_idx * 0.6), Inches(4), Inches(0.5))
+                fill_text_frame(child.text_frame, rnd, 1, runs)
+
+        for _ in range(tables):
+            table = slide.shapes.add_table(table_rows, table_cols, Inches(0.5), Inches(4),
+                                           Inches(9), Inches(0.3 * table_rows)).table
+            for row in range(table_rows):
+                for col in range(table_cols):
+                    table.cell(row, col).text = synthetic_sentence(rnd, 1, 3)
+
+        for chart_idx in range(charts):
+            chart_data = CategoryChartData()
+            chart_data.categories = ["Q1", "Q2", "Q3", "Q4"]
+            chart_data.add_series("Series 1", [rnd.randint(1, 100) for _ in range(4)])
+            chart = slide.shapes.add_chart(XL_CHART_TYPE.COLUMN_CLUSTERED, Inches(6), Inches(4.5 + chart_idx * 0.2),
+                                           Inches(3.5), Inches(2.5), chart_data).chart
+            chart.has_title = True
+            chart.chart_title.text_frame.text = synthetic_sentence(rnd, 2, 4)
+
+        footer = slide.shapes.add_textbox(Inches(0.5), Inches(7), Inches(9), Inches(0.4))
+        footer.text_frame.text = "Confidential - for internal use only"
+
+    prs.save(path)
+    return {
+        "slides": slides, "text_boxes": text_boxes, "grouped_shapes": grouped_shapes,
+        "group_children": group_children, "tables": tables, "table_rows": table_rows,
+        "table_cols": table_cols, "charts": charts, "paragraphs": paragraphs, "runs": runs,
+        "seed": seed, "file_size": os.path.getsize(path)
+    }
+
+
+class MockStreamingBody:
+    """invoke_model 응답의 body처럼 read()를 제공하는 객체"""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
+
+
+class MockBedrockRuntime:
+    """bedrock-runtime 클라이언트의 invoke_model / invoke_model_with_response_stream을 흉내 내는 로컬 모의 서비스
+
+    지연 시간, 제한 오류(ThrottlingException) 비율, 응답 길이를 설정할 수 있습니다.
+    제한 오류 여부는 요청 본문과 시도 횟수로 결정하므로 스레드 실행 순서와 무관하게 재현됩니다.
+    """
+
+    def __init__(self, latency: float = 0.05, latency_per_token: float = 0.0, throttle_rate: float = 0.0,
+                 response_ratio: float = 1.0, seed: int = 0):
+        self.latency = latency
+        self.latency_per_token = latency_per_token
+        self.throttle_rate = throttle_rate
+        self.response_ratio = response_ratio
+        self.seed = seed
+        self._lock = threading.Lock()
+        self._attempts: Dict[str, int] = {}
+        self._cached_prefixes = set()
+        self.calls = 0
+        self.throttles = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+
+    @staticmethod
+    def _tokens(text: str) -> int:
+        return len(text.encode("utf-8")) // 4 + 1
+
+    def _scale(self, text: str) -> str:
+        """응답 길이 비율에 맞춰 번역 결과를 늘리거나 줄입니다 (줄 구조는 유지)."""
+        if self.response_ratio == 1.0:
+            return text
+        lines = []
+        for line in text.split("\n"):
+            length = max(1, int(len(line) * self.response_ratio)) if line else 0
+            lines.append((line * (length // max(1, len(line)) + 1))[:length])
+        return "\n".join(lines)
+
+    def _respond(self, prompt: str) -> str:
+        source = default_stub_response(prompt)
+        try:
+            segments = json.loads(source)
+        except ValueError:
+            return self._scale(source)
+        if isinstance(segments, dict):
+            return json.dumps({key: self._scale(str(value)) for key, value in segments.items()}, ensure_ascii=False)
+        return self._scale(source)
+
+    def _begin(self, body: str, operation: str) -> Dict[str, Any]:
+        """호출 횟수를 기록하고, 제한 오류면 ClientError를 발생시키며, 아니면 응답 본문을 만듭니다."""
+        import botocore.exceptions
+
+        request_key = hashlib.sha256(body.encode("utf-8")).hexdigest()
+        with self._lock:
+            self.calls += 1
+            attempt = self._attempts.get(request_key, 0)
+            self._attempts[request_key] = attempt + 1
+
+        rnd = random.Random(f"{self.seed}:{request_key}:{attempt}")
+        if rnd.random() < self.throttle_rate:
+            with self._lock:
+                self.throttles += 1
+            raise botocore.exceptions.ClientError(
+                {"Error": {"Code": "ThrottlingException", "Message": "Rate exceeded"}}, operation)
+
+        request = json.loads(body)
+        prompt = request["messages"][-1]["content"]
+        if isinstance(prompt, list):
+            prompt = "".join(block.get("text", "") for block in prompt)
+        text = self._respond(prompt)
+        usage = {"input_tokens": self._tokens(prompt), "output_tokens": self._tokens(text)}
+        # cache_control이 붙은 시스템 블록은 프롬프트 캐시처럼 처음에는 캐시 쓰기, 이후에는 캐시 읽기로 집계합니다
+        for block in request.get("system", []):
+            tokens = self._tokens(block["text"])
+            if "cache_control" not in block or tokens < PROMPT_CACHE_MIN_TOKENS:
+                usage["input_tokens"] += tokens
+                continue
+            with self._lock:
+                cached = block["text"] in self._cached_prefixes
+                self._cached_prefixes.add(block["text"])
+            usage["cache_read_input_tokens" if cached else "cache_creation_input_tokens"] = tokens
+        with self._lock:
+            self.input_tokens += usage["input_tokens"]
+            self.output_tokens += usage["output_tokens"]
+
+        delay = self.latency + self.latency_per_token * usage["output_tokens"]
+        if delay > 0:
+            time.sleep(delay)
+        return {"content": [{"type": "text", "text": text}], "usage": usage, "stop_reason": "end_turn"}
+
+    def invoke_model(self, modelId: str, body: str, **kwargs) -> Dict[str, Any]:
+        response_body = self._begin(body, "InvokeModel")
+        return {"body": MockStreamingBody(json.dumps(response_body).encode("utf-8"))}
+
+    def invoke_model_with_response_stream(self, modelId: str, body: str, **kwargs) -> Dict[str, Any]:
+        response_body = self._begin(body, "InvokeModelWithResponseStream")
+        text = response_body["content"][0]["text"]
+        usage = response_body["usage"]
+        chunks = [{"type": "message_start", "message": {"usage": {
+            name: value for name, value in usage.items() if name != "output_tokens"}}}]
+        for start in range(0, len(text), 64):
+            chunks.append({"type": "content_block_delta", "delta": {"type": "text_delta", "text": text[start:start + 64]}})
+        chunks.append({"type": "message_delta", "delta": {"stop_reason": "end_turn"},
+                       "usage": {"output_tokens": usage["output_tokens"]}})
+        events = [{"chunk": {"bytes": json.dumps(chunk).encode("utf-8")}} for chunk in chunks]
+        return {"body": iter(events)}
+
+    def stats(self) -> Dict[str, int]:
+        return {"calls": self.calls, "throttles": self.throttles,
+                "input_tokens": self.input_tokens, "output_tokens": self.output_tokens}
+
+
+# 시나리오: 번역기 설정과 모의 서비스 설정의 조합
+SCENARIOS = {
+    "baseline": {"translator": {}, "mock": {}},
+    "batch": {"translator": {"batch_mode": True}, "mock": {}},
+    "fast-path": {"translator": {"batch_mode": True, "extraction_engine": "xpath", "lazy_loading": True}, "mock": {}},
+    "throttled": {"translator": {"batch_mode": True}, "mock": {"throttle_rate": 0.25}},
+    "streaming": {"translator": {"batch_mode": True, "streaming": True, "stream_min_tokens": 0},
+                  "mock": {"response_ratio": 1.5}},
+}
+
+
+def run_stages(translator: PowerPointTranslatorImproved, input_file: str, output_file: str,
+               target_language: str) -> Dict[str, Any]:
+    """로드, 추출, 번역, 적용, 저장 단계를 차례로 실행하며 단계별 시간을 측정합니다."""
+    timings = {}
+
+    start = time.perf_counter()
+    prs = translator.load_presentation(input_file)
+    timings["load"] = time.perf_counter() - start
+
+    try:
+        start = time.perf_counter()
+        styles = StyleTable()
+        slide_elements = [translator.extract_text_elements_from_slide(slide, styles) for slide in prs.slides]
+        timings["extract"] = time.perf_counter() - start
+        elements = [element for elements in slide_elements for element in elements]
+
+        start = time.perf_counter()
+        deduplicator = SegmentDeduplicator()
+        translated = translator.translate_elements(elements, target_language, deduplicator)
+        timings["translate"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        modified_parts: Dict[str, Any] = {}
+        applied = sum(translator.apply_translation_to_slide(slide, elements, modified_parts)
+                      for slide, elements in zip(prs.slides, slide_elements))
+        timings["apply"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        translator.save_presentation(prs, input_file, output_file, modified_parts)
+        timings["save"] = time.perf_counter() - start
+    finally:
+        translator.close_presentation(prs)
+
+    return {
+        "stages": {stage: round(seconds, 4) for stage, seconds in timings.items()},
+        "segments": len(elements),
+        "unique_segments": deduplicator.stats()["unique_segments"],
+        "translated": translated,
+        "applied": applied,
+    }
+
+
+def run_scenario(name: str, config: Dict[str, Any], deck_path: str, work_dir: str, workers: int,
+                 mock_options: Dict[str, Any], target_language: str = "ko") -> Dict[str, Any]:
+    """시나리오 하나를 단계별 실행과 파이프라인(translate_presentation) 실행으로 측정합니다."""
+    mock_settings = dict(mock_options, **config["mock"])
+    result = {"scenario": name, "translator": config["translator"], "mock": mock_settings}
+
+    for mode in ("stages", "end_to_end"):
+        client = MockBedrockRuntime(**mock_settings)
+        translator = PowerPointTranslatorImproved(
+            max_workers=workers, cache_path=None, backend=BedrockBackend(client=client), **config["translator"])
+        output_file = os.path.join(work_dir, f"{name}_{mode}.pptx")
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            if mode == "stages":
+                result.update(run_stages(translator, deck_path, output_file, target_language))
+            else:
+                result["end_to_end_success"] = translator.translate_presentation(deck_path, output_file, target_language)
+            elapsed = time.perf_counter() - start
+        result[f"{mode}_seconds"] = round(elapsed, 4)
+        result[f"{mode}_service"] = client.stats()
+        result[f"{mode}_scheduler"] = translator.rate_limiter.stats()
+        usage = translator.metrics.report()
+        result[f"{mode}_usage"] = dict(usage["totals"], latency={
+            model_id: {key: model["latency"][key] for key in ("p50", "p90", "p99", "max")}
+            for model_id, model in usage["models"].items()
+        })
+        translator.cache.close()
+    return result
+
+
+def compare_with_baseline(results: Dict[str, Any], baseline_path: str) -> List[str]:
+    """이전 결과 파일과 시나리오별 단계 시간을 비교한 요약 줄을 반환합니다."""
+    with open(baseline_path, "r", encoding="utf-8") as f:
+        baseline = {scenario["scenario"]: scenario for scenario in json.load(f)["scenarios"]}
+    lines = []
+    for scenario in results["scenarios"]:
+        previous = baseline.get(scenario["scenario"])
+        if previous is None:
+            continue
+        parts = []
+        for stage, seconds in scenario["stages"].items():
+            before = previous.get("stages", {}).get(stage)
+            if before:
+                parts.append(f"{stage} {before:.3f}→{seconds:.3f}초 ({seconds / before:.2f}배)")
+        before = previous.get("end_to_end_seconds")
+        if before:
+            parts.append(f"전체 {before:.3f}→{scenario['end_to_end_seconds']:.3f}초")
+        lines.append(f"{scenario['scenario']}: " + ", ".join(parts))
+    return lines
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="PowerPoint 번역기 처리량 벤치마크 (Bedrock 호출 없음)")
+    parser.add_argument("-o", "--output", default="bench_results.json", help="결과 JSON 파일 경로")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=sorted(SCENARIOS),
+                        help="실행할 시나리오")
+    parser.add_argument("--baseline", default=None, help="비교할 이전 결과 JSON 파일")
+    parser.add_argument("--deck", default=None, help="합성 덱 대신 사용할 .pptx 파일")
+    parser.add_argument("--keep-deck", default=None, help="생성한 합성 덱을 저장할 경로")
+    parser.add_argument("--slides", type=int, default=20)
+    parser.add_argument("--text-boxes", type=int, default=3)
+    parser.add_argument("--groups", type=int, default=1, help="슬라이드당 그룹 도형 수")
+    parser.add_argument("--group-children", type=int, default=3)
+    parser.add_argument("--tables", type=int, default=1)
+    parser.add_argument("--table-size", default="5x4", help="표 크기 (행x열)")
+    parser.add_argument("--charts", type=int, default=1)
+    parser.add_argument("--paragraphs", type=int, default=2, help="텍스트 상자당 단락 수")
+    parser.add_argument("--runs", type=int, default=2, help="단락당 Run 수")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-w", "--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.05, help="모의 서비스 기본 지연 시간(초)")
+    parser.add_argument("--latency-per-token", type=float, default=0.0, help="출력 토큰당 추가 지연 시간(초)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="제한 오류 비율 (0~1)")
+    parser.add_argument("--response-ratio", type=float, default=1.0, help="원문 대비 응답 길이 비율")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    rows, cols = (int(value) for value in args.table_size.lower().split("x"))
+    mock_options = {"latency": args.latency, "latency_per_token": args.latency_per_token,
+                    "throttle_rate": args.throttle_rate, "response_ratio": args.response_ratio, "seed": args.seed}
+
+    with tempfile.TemporaryDirectory(prefix="pptx-bench-") as work_dir:
+        if args.deck:
+            deck_path = args.deck
+            deck = {"file": args.deck, "file_size": os.path.getsize(args.deck)}
+        else:
+            deck_path = args.keep_deck or os.path.join(work_dir, "synthetic.pptx")
+            deck = generate_synthetic_deck(
+                deck_path, slides=args.slides, text_boxes=args.text_boxes, grouped_shapes=args.groups,
+                group_children=args.group_children, tables=args.tables, table_rows=rows, table_cols=cols,
+                charts=args.charts, paragraphs=args.paragraphs, runs=args.runs, seed=args.seed)
+        print(f"벤치마크 덱: {deck_path} ({deck['file_size']:,} 바이트)")
+
+        results = {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "workers": args.workers,
+            "deck": deck,
+            "scenarios": []
+        }
+        for name in args.scenarios:
+            print(f"시나리오 실행 중: {name}")
+            scenario = run_scenario(name, copy.deepcopy(SCENARIOS[name]), deck_path, work_dir,
+                                    args.workers, mock_options)
+            results["scenarios"].append(scenario)
+            stages = ", ".join(f"{stage} {seconds:.3f}초" for stage, seconds in scenario["stages"].items())
+            print(f"  단계별: {stages}")
+            print(f"  파이프라인 전체: {scenario['end_to_end_seconds']:.3f}초, "
+                  f"호출 {scenario['end_to_end_service']['calls']}회, "
+                  f"제한 오류 {scenario['end_to_end_service']['throttles']}회")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
+
+    if args.baseline:
+        print("이전 결과와 비교:")
+        for line in compare_with_baseline(results, args.baseline):
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import os
+import sys
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmark import generate_synthetic_deck  # noqa: E402
+
+
+def add_placeholder_slide(path: str):
+    """제목/본문 자리 표시자와 중첩 그룹이 있는 슬라이드를 덱 끝에 추가합니다."""
+    prs = Presentation(path)
+    slide = prs.slides.add_slide(prs.slide_layouts[1])
+    slide.shapes.title.text = "Quarterly review"
+    body = slide.placeholders[1].text_frame
+    body.text = "Revenue grew in every region"
+    body.add_paragraph().text = "Costs stayed flat"
+    outer = slide.shapes.add_group_shape()
+    inner = outer.shapes.add_group_shape()
+    inner.shapes.add_textbox(Inches(1), Inches(5), Inches(3), Inches(0.5)).text_frame.text = "Nested label"
+    outer.shapes.add_textbox(Inches(5), Inches(5), Inches(3), Inches(0.5)).text_frame.text = "Outer label"
+    prs.save(path)
+
+
+@pytest.fixture
+def sample_deck(tmp_path):
+    """표, 그룹, 자리 표시자, 차트가 모두 들어 있는 작은 합성 덱"""
+    path = str(tmp_path / "sample.pptx")
+    generate_synthetic_deck(path, slides=3, text_boxes=2, grouped_shapes=1, group_children=2,
+                            tables=1, table_rows=3, table_cols=3, charts=1, seed=7)
+    add_placeholder_slide(path)
+    return path
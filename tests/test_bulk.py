@@ -0,0 +1,114 @@
+import json
+import zipfile
+
+import pytest
+
+from app import LocalBatchService, PowerPointTranslatorImproved, StubBackend, default_stub_response
+
+
+def responder(prompt):
+    """원문을 대문자로 바꾸어 돌려주는 응답기 (배치 프롬프트는 JSON 값만 변환)"""
+    payload = default_stub_response(prompt)
+    if payload.startswith("{"):
+        return json.dumps({key: value.upper() for key, value in json.loads(payload).items()}, ensure_ascii=False)
+    return payload.upper()
+
+
+class FlakyBackend(StubBackend):
+    """원문에 "Quarterly"가 들어 있는 레코드만 실패하는 백엔드"""
+
+    def invoke(self, model_id, body):
+        if "Quarterly" in json.dumps(body):
+            raise RuntimeError("model error")
+        return super().invoke(model_id, body)
+
+
+def make_translator(tmp_path, backend=None, **kwargs):
+    return PowerPointTranslatorImproved(max_workers=2, cache_path=str(tmp_path / "cache.db"),
+                                        backend=backend or StubBackend(responder), **kwargs)
+
+
+def zip_members(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+@pytest.fixture
+def job_dir(tmp_path):
+    return str(tmp_path / "job")
+
+
+@pytest.mark.parametrize("batch_mode", [False, True])
+def test_bulk_round_trip_matches_online_translation(sample_deck, tmp_path, job_dir, batch_mode):
+    translator = make_translator(tmp_path, batch_mode=batch_mode)
+    service = LocalBatchService(str(tmp_path / "service"), StubBackend(responder))
+
+    manifest = translator.prepare_bulk_job([sample_deck], ["en"], job_dir, str(tmp_path / "bulk"))
+    job_id = translator.submit_bulk_job(job_dir, service)
+
+    assert manifest["records"]
+    assert service.status(job_id) == "Completed"
+    output_path = translator.download_bulk_output(job_dir, service)
+    translations, summary = translator.read_bulk_output(output_path, manifest["records"])
+    assert summary["records"] == len(manifest["records"])
+    assert summary["failed_records"] == 0
+    assert ("en", None, "Quarterly review") in translations
+    assert translations[("en", None, "Quarterly review")] == "QUARTERLY REVIEW"
+
+    results = translator.ingest_bulk_output(job_dir)
+    bulk_output = manifest["decks"][0]["output_files"]["en"]
+    assert results == {bulk_output: True}
+
+    online_output = str(tmp_path / "online.pptx")
+    online = PowerPointTranslatorImproved(max_workers=2, cache_path=None, backend=StubBackend(responder),
+                                          batch_mode=batch_mode)
+    assert online.translate_presentation(sample_deck, online_output, "en")
+    assert zip_members(bulk_output) == zip_members(online_output)
+
+
+def test_local_service_records_failures(sample_deck, tmp_path, job_dir):
+    translator = make_translator(tmp_path)
+    service = LocalBatchService(str(tmp_path / "service"), FlakyBackend(responder))
+
+    manifest = translator.prepare_bulk_job([sample_deck], ["en"], job_dir, str(tmp_path / "bulk"))
+    job_id = translator.submit_bulk_job(job_dir, service)
+
+    assert service.status(job_id) == "PartiallyCompleted"
+    output_path = translator.download_bulk_output(job_dir, service)
+    with open(output_path, encoding="utf-8") as f:
+        errors = [json.loads(line) for line in f if "error" in json.loads(line)]
+    assert errors
+    _, summary = translator.read_bulk_output(output_path, manifest["records"])
+    assert summary["failed_records"] == len(errors)
+
+    output_file = manifest["decks"][0]["output_files"]["en"]
+    assert translator.ingest_bulk_output(job_dir) == {output_file: True}
+    slide = zip_members(output_file)["ppt/slides/slide4.xml"]
+    assert b"Quarterly review" in slide
+    assert b"COSTS STAYED FLAT" in slide
+
+
+def test_download_waits_for_submitted_job(sample_deck, tmp_path, job_dir):
+    translator = make_translator(tmp_path)
+    service = LocalBatchService(str(tmp_path / "service"), StubBackend(responder))
+    translator.prepare_bulk_job([sample_deck], ["en"], job_dir, str(tmp_path / "bulk"))
+
+    with pytest.raises(ValueError):
+        translator.download_bulk_output(job_dir, service)
+    translator.submit_bulk_job(job_dir, service)
+    assert translator.download_bulk_output(job_dir, service) is not None
+
+
+def test_bulk_results_are_reused_by_routed_online_runs(sample_deck, tmp_path, job_dir):
+    translator = make_translator(tmp_path)
+    service = LocalBatchService(str(tmp_path / "service"), StubBackend(responder))
+    translator.prepare_bulk_job([sample_deck], ["en"], job_dir, str(tmp_path / "bulk"))
+    translator.submit_bulk_job(job_dir, service)
+    translator.download_bulk_output(job_dir, service)
+    translator.ingest_bulk_output(job_dir)
+    translator.cache.close()
+
+    backend = StubBackend(responder)
+    routed = make_translator(tmp_path, backend, small_model_id="small-model")
+    assert routed.translate_presentation(sample_deck, str(tmp_path / "online.pptx"), "en")
+    assert backend.calls == 0
@@ -0,0 +1,63 @@
+import sqlite3
+
+from pptx import Presentation
+
+from app import PowerPointTranslatorImproved, StubBackend, StyleTable
+
+
+def make_translator(tmp_path, backend):
+    return PowerPointTranslatorImproved(max_workers=2, cache_path=str(tmp_path / "cache.db"), backend=backend)
+
+
+def extracted_texts(translator, path):
+    prs = Presentation(path)
+    styles = StyleTable()
+    return [element.original_text for slide in prs.slides
+            for element in translator.extract_text_elements_from_slide(slide, styles)]
+
+
+def last_used_rows(path):
+    conn = sqlite3.connect(path)
+    try:
+        return dict(conn.execute("SELECT key, last_used FROM translations").fetchall())
+    finally:
+        conn.close()
+
+
+def test_estimate_counts_segments_without_calling_the_backend(sample_deck, tmp_path):
+    backend = StubBackend()
+    translator = make_translator(tmp_path, backend)
+    texts = extracted_texts(translator, sample_deck)
+
+    estimate = translator.estimate_presentation(sample_deck, ["ko", "ja"])
+
+    assert estimate["elements"] == len(texts)
+    assert sum(estimate["element_types"].values()) == len(texts)
+    assert estimate["unique_segments"] == len({text for text in texts if text.strip()})
+    for language in estimate["languages"].values():
+        assert language["cached_segments"] == 0
+        assert language["segments_to_translate"] + language["prefiltered_segments"] == estimate["unique_segments"]
+        assert language["model_calls"] > 0
+    assert backend.calls == 0
+    translator.cache.close()
+
+
+def test_estimate_does_not_touch_the_translation_cache(sample_deck, tmp_path):
+    translator = make_translator(tmp_path, StubBackend())
+    assert translator.translate_presentation(sample_deck, str(tmp_path / "out.pptx"), "ko")
+    translator.cache.close()
+    cache_path = str(tmp_path / "cache.db")
+    before = last_used_rows(cache_path)
+
+    backend = StubBackend()
+    translator = make_translator(tmp_path, backend)
+    stats = translator.cache.stats()
+    estimate = translator.estimate_presentation(sample_deck, ["ko"])
+
+    language = estimate["languages"]["ko"]
+    assert language["segments_to_translate"] == 0
+    assert language["cached_segments"] + language["prefiltered_segments"] == estimate["unique_segments"]
+    assert translator.cache.stats() == stats
+    assert backend.calls == 0
+    translator.cache.close()
+    assert last_used_rows(cache_path) == before
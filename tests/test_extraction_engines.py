@@ -0,0 +1,46 @@
+import zipfile
+
+from pptx import Presentation
+
+from app import PowerPointTranslatorImproved, StubBackend, StyleTable, default_stub_response
+
+
+def make_translator(**kwargs):
+    backend = StubBackend(lambda prompt: default_stub_response(prompt).upper())
+    return PowerPointTranslatorImproved(max_workers=2, cache_path=None, backend=backend, **kwargs)
+
+
+def extract(path, engine):
+    translator = make_translator(extraction_engine=engine)
+    styles = StyleTable()
+    prs = Presentation(path)
+    return [translator.extract_text_elements_from_slide(slide, styles) for slide in prs.slides]
+
+
+def zip_members(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist()}
+
+
+def test_engines_extract_identical_elements(sample_deck):
+    expected = extract(sample_deck, "pptx")
+    actual = extract(sample_deck, "xpath")
+
+    element_types = {element.element_type for elements in expected for element in elements}
+    assert {"shape", "table_cell", "chart_title", "grouped_shape"} <= element_types
+    assert actual == expected
+
+
+def test_compare_extraction_engines_reports_no_differences(sample_deck):
+    assert make_translator().compare_extraction_engines(sample_deck) == []
+
+
+def test_engines_produce_identical_output(sample_deck, tmp_path):
+    outputs = {}
+    for engine in ("pptx", "xpath"):
+        output = str(tmp_path / f"{engine}.pptx")
+        assert make_translator(extraction_engine=engine).translate_presentation(sample_deck, output, "en")
+        outputs[engine] = zip_members(output)
+
+    assert outputs["xpath"] == outputs["pptx"]
+    assert "QUARTERLY REVIEW".encode() in outputs["pptx"]["ppt/slides/slide4.xml"]
@@ -0,0 +1,54 @@
+from app import PowerPointTranslatorImproved, StubBackend, TextElement, TranslationCache
+
+MAIN_MODEL = "main-model"
+SMALL_MODEL = "small-model"
+SHORT = "Revenue"
+LONG = "Revenue grew in every region while costs stayed flat across the whole fiscal year."
+
+
+def make_translator(cache_path, backend, **kwargs):
+    return PowerPointTranslatorImproved(max_workers=1, cache_path=cache_path, backend=backend, prefilter=False,
+                                        model_id=MAIN_MODEL, small_model_id=SMALL_MODEL,
+                                        small_model_max_tokens=5, **kwargs)
+
+
+def translate(translator, texts):
+    elements = [TextElement(shape_index=i, original_text=text) for i, text in enumerate(texts)]
+    for unit in translator.prepare_translation_units(elements, "ko"):
+        translator.translate_unit(unit, "ko")
+    return elements
+
+
+def test_mixed_batch_is_cached_under_the_model_that_translated_it(tmp_path):
+    cache_path = str(tmp_path / "cache.db")
+    translator = make_translator(cache_path, StubBackend(), batch_mode=True)
+    translate(translator, [SHORT, LONG])
+    translator.cache.close()
+
+    cache = TranslationCache(cache_path)
+    assert cache.get(cache.make_key(SHORT, "ko", MAIN_MODEL)) == SHORT
+    assert cache.get(cache.make_key(SHORT, "ko", SMALL_MODEL)) is None
+    cache.close()
+
+
+def test_main_model_entry_is_reused_for_short_segments(tmp_path):
+    cache_path = str(tmp_path / "cache.db")
+    translator = make_translator(cache_path, StubBackend(), batch_mode=True)
+    translate(translator, [SHORT, LONG])
+    translator.cache.close()
+
+    backend = StubBackend()
+    translator = make_translator(cache_path, backend)
+    elements = translate(translator, [SHORT])
+
+    assert backend.calls == 0
+    assert elements[0].is_translated
+
+
+def test_single_short_segment_is_cached_under_the_small_model(tmp_path):
+    cache_path = str(tmp_path / "cache.db")
+    translator = make_translator(cache_path, StubBackend())
+    translate(translator, [SHORT])
+
+    assert translator.cache.get(translator.cache.make_key(SHORT, "ko", SMALL_MODEL)) == SHORT
+    assert translator.cache.get(translator.cache.make_key(SHORT, "ko", MAIN_MODEL)) is None
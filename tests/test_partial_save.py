@@ -0,0 +1,78 @@
+import zipfile
+
+import pytest
+from pptx import Presentation
+
+from app import PartialPackageWriter, PowerPointTranslatorImproved, StubBackend, default_stub_response
+
+
+def translate(sample_deck, output, **kwargs):
+    backend = StubBackend(lambda prompt: default_stub_response(prompt).upper())
+    translator = PowerPointTranslatorImproved(max_workers=2, cache_path=None, backend=backend, **kwargs)
+    assert translator.translate_presentation(sample_deck, output, "en")
+
+
+def package_parts(path):
+    prs = Presentation(path)
+    return {str(part.partname): part.blob for part in prs.part.package.iter_parts()}
+
+
+@pytest.fixture
+def full_save(sample_deck, tmp_path):
+    output = str(tmp_path / "full.pptx")
+    translate(sample_deck, output, partial_save=False)
+    return output
+
+
+def test_partial_save_matches_full_save(sample_deck, full_save, tmp_path):
+    output = str(tmp_path / "partial.pptx")
+    translate(sample_deck, output)
+
+    assert package_parts(output) == package_parts(full_save)
+    with zipfile.ZipFile(output) as archive:
+        assert archive.testzip() is None
+
+
+def test_partial_save_copies_untouched_members_byte_for_byte(sample_deck, tmp_path):
+    output = str(tmp_path / "partial.pptx")
+    translate(sample_deck, output)
+
+    with zipfile.ZipFile(sample_deck) as source, zipfile.ZipFile(output) as target:
+        media = [info for info in source.infolist() if info.filename.endswith((".xlsx", ".rels"))]
+        assert media
+        for info in media:
+            assert target.getinfo(info.filename).CRC == info.CRC
+            assert target.getinfo(info.filename).compress_size == info.compress_size
+
+
+def test_recompressing_fallback_matches_full_save(sample_deck, full_save, tmp_path, monkeypatch):
+    monkeypatch.setattr(PartialPackageWriter, "RAW_COPY_PYTHON_VERSIONS", ((0, 0), (0, 0)))
+    output = str(tmp_path / "partial.pptx")
+    translate(sample_deck, output)
+
+    assert package_parts(output) == package_parts(full_save)
+
+
+def test_fallback_copies_with_public_api(sample_deck, tmp_path, monkeypatch):
+    monkeypatch.setattr(PartialPackageWriter, "RAW_COPY_PYTHON_VERSIONS", ((0, 0), (0, 0)))
+    writer = PartialPackageWriter(sample_deck)
+    output = str(tmp_path / "copy.pptx")
+
+    writer.write(output, {})
+
+    assert writer.copied_members == 0
+    assert writer.recompressed_members == len(writer.member_names())
+    with zipfile.ZipFile(sample_deck) as source, zipfile.ZipFile(output) as target:
+        for info in source.infolist():
+            assert target.read(info.filename) == source.read(info.filename)
+            assert target.getinfo(info.filename).compress_type == info.compress_type
+
+
+def test_raw_copy_used_on_supported_python(sample_deck, tmp_path):
+    writer = PartialPackageWriter(sample_deck)
+    with zipfile.ZipFile(str(tmp_path / "probe.zip"), "w") as probe:
+        supported = PartialPackageWriter.raw_copy_supported(probe)
+    writer.write(str(tmp_path / "copy.pptx"), {})
+
+    expected = len(writer.member_names())
+    assert (writer.copied_members, writer.recompressed_members) == ((expected, 0) if supported else (0, expected))
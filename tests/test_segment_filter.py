@@ -0,0 +1,50 @@
+import pytest
+
+from app import SegmentFilter
+
+
+@pytest.fixture
+def segment_filter():
+    return SegmentFilter()
+
+
+@pytest.mark.parametrize("text, reason", [
+    ("https://aws.amazon.com/bedrock", "url"),
+    ("HTTP://EXAMPLE.COM", "url"),
+    ("www.example.com", "url"),
+    ("example.com/pricing", "url"),
+    ("docs.aws.amazon.com/bedrock/latest/", "url"),
+    ("12.5%", "percentage"),
+    ("$1,200", "number"),
+    ("2024-01-15", "date"),
+    ("Q3 2024", "date"),
+    ("FY2024", "date"),
+    ("support@example.com", "email"),
+    ("SKU-1234", "code"),
+    ("→ • ※", "symbol"),
+    ("https://example.com\n42", "url"),
+])
+def test_skips_non_translatable_segments(segment_filter, text, reason):
+    assert segment_filter.classify(text, "ko") == reason
+
+
+@pytest.mark.parametrize("text", [
+    "Mr.Smith",
+    "Node.js",
+    "ASP.NET",
+    "Vue.js",
+    "README.md",
+    "Node.js/Express",
+    "ASP.NET/Core",
+    "e.g.",
+    "Revenue grew 12%",
+    "Quarterly review",
+    "https://example.com\nContact us",
+])
+def test_keeps_text_that_needs_translation(segment_filter, text):
+    assert segment_filter.classify(text, "ko") is None
+
+
+def test_text_already_in_target_script_is_skipped(segment_filter):
+    assert segment_filter.classify("분기별 실적 검토", "ko") == "target_script"
+    assert segment_filter.classify("분기별 실적 검토", "en") is None
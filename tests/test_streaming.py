@@ -0,0 +1,128 @@
+import json
+
+import botocore.exceptions
+import pytest
+
+from app import BedrockBackend, PowerPointTranslatorImproved, StreamingJSONParser, StubBackend
+from benchmark import MockStreamingBody
+
+
+def chunk(payload):
+    return {"chunk": {"bytes": json.dumps(payload).encode("utf-8")}}
+
+
+def stream_events(text, size=7, error=None):
+    """텍스트를 size 글자씩 나눈 응답 스트림 이벤트 (error를 지정하면 텍스트 뒤에 오류 이벤트)"""
+    events = [chunk({"type": "message_start", "message": {"usage": {"input_tokens": 11}}})]
+    events += [chunk({"type": "content_block_delta", "delta": {"type": "text_delta", "text": text[i:i + size]}})
+               for i in range(0, len(text), size)]
+    if error is not None:
+        events.append(error)
+    else:
+        events.append(chunk({"type": "message_delta", "delta": {"stop_reason": "end_turn"},
+                             "usage": {"output_tokens": 5}}))
+    return events
+
+
+class ScriptedClient:
+    """스트림 호출마다 정해진 이벤트를 돌려주는 bedrock-runtime 대역"""
+
+    def __init__(self, streams, responses=()):
+        self.streams = list(streams)
+        self.responses = list(responses)
+        self.stream_calls = 0
+        self.calls = 0
+
+    def invoke_model_with_response_stream(self, modelId, body):
+        self.stream_calls += 1
+        return {"body": iter(self.streams.pop(0))}
+
+    def invoke_model(self, modelId, body):
+        self.calls += 1
+        response = {"content": [{"type": "text", "text": self.responses.pop(0)}],
+                    "usage": {"input_tokens": 1, "output_tokens": 1}, "stop_reason": "end_turn"}
+        return {"body": MockStreamingBody(json.dumps(response).encode("utf-8"))}
+
+
+def test_stub_backend_stream_matches_invoke():
+    backend = StubBackend(lambda prompt: "translated")
+    body = {"messages": [{"role": "user", "content": "hello"}]}
+    received = []
+
+    streamed = backend.invoke_stream("model", body, received.append)
+
+    assert "".join(received) == "translated"
+    assert streamed == backend.invoke("model", body)
+
+
+def test_bedrock_stream_assembles_deltas_and_usage():
+    backend = BedrockBackend(client=ScriptedClient([stream_events("Hello, streaming world")]))
+    received = []
+
+    response = backend.invoke_stream("model", {}, received.append)
+
+    assert len(received) > 1
+    assert response["content"][0]["text"] == "".join(received) == "Hello, streaming world"
+    assert response["usage"] == {"input_tokens": 11, "output_tokens": 5}
+    assert response["stop_reason"] == "end_turn"
+
+
+@pytest.mark.parametrize("event_name, code", [
+    ("throttlingException", "ThrottlingException"),
+    ("modelStreamErrorException", "ModelStreamErrorException"),
+])
+def test_in_stream_error_event_raises_client_error(event_name, code):
+    error = {event_name: {"message": "stream failed"}}
+    backend = BedrockBackend(client=ScriptedClient([stream_events("partial", error=error)]))
+
+    with pytest.raises(botocore.exceptions.ClientError) as raised:
+        backend.invoke_stream("model", {})
+
+    assert raised.value.response["Error"] == {"Code": code, "Message": "stream failed"}
+
+
+def test_parser_emits_segments_as_they_complete():
+    parser = StreamingJSONParser()
+    text = 'Sure: {"1": "첫 번째", "2": "say \\"hi\\"\\nthere", "3": "unfinished'
+    seen = []
+    for ch in text:
+        parser.feed(ch)
+        seen.append(dict(parser.values))
+
+    assert parser.values == {"1": "첫 번째", "2": 'say "hi"\nthere'}
+    assert {"1": "첫 번째"} in seen
+    parser.start()
+    parser.feed('{"3": "done"}')
+    assert parser.values == {"1": "첫 번째", "2": 'say "hi"\nthere', "3": "done"}
+
+
+def make_translator(client):
+    return PowerPointTranslatorImproved(max_workers=1, batch_mode=True, cache_path=None, max_retries=1,
+                                        backend=BedrockBackend(client=client), streaming=True,
+                                        stream_min_tokens=0, prefilter=False)
+
+
+def test_failed_stream_keeps_segments_that_arrived():
+    error = {"modelStreamErrorException": {"message": "connection reset"}}
+    client = ScriptedClient([stream_events('{"1": "ONE", "2": "TWO", "3": "TH', error=error)])
+
+    results = make_translator(client).translate_batch(["one", "two", "three", "four"], "en")
+
+    assert results == ["ONE", "TWO", None, None]
+    assert (client.stream_calls, client.calls) == (1, 0)
+
+
+def test_unparseable_stream_retries_only_missing_segments():
+    client = ScriptedClient([stream_events('{"1": "ONE", "2": "TWO", "3": "THREE" oops')], responses=["FOUR"])
+
+    results = make_translator(client).translate_batch(["one", "two", "three", "four"], "en")
+
+    assert results == ["ONE", "TWO", "THREE", "FOUR"]
+    assert (client.stream_calls, client.calls) == (1, 1)
+
+
+def test_short_requests_do_not_stream():
+    client = ScriptedClient([], responses=["ONE"])
+
+    assert make_translator(client).translate_batch(["one"], "en") == ["ONE"]
+    assert client.stream_calls == 0
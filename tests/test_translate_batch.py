@@ -0,0 +1,46 @@
+import json
+
+from app import PowerPointTranslatorImproved, StubBackend, default_stub_response
+
+
+class FailingBackend(StubBackend):
+    """모든 호출이 비스로틀 오류로 실패하는 백엔드"""
+
+    def invoke(self, model_id, body):
+        with self._lock:
+            self.calls += 1
+        raise RuntimeError("service unavailable")
+
+
+def make_translator(backend):
+    return PowerPointTranslatorImproved(max_workers=1, batch_mode=True, cache_path=None,
+                                        backend=backend, max_retries=1, prefilter=False)
+
+
+def test_failed_batch_call_is_not_split():
+    backend = FailingBackend()
+    translator = make_translator(backend)
+
+    results = translator.translate_batch([f"segment {i}" for i in range(8)], "en")
+
+    assert results == [None] * 8
+    assert backend.calls == 1
+
+
+def test_unparseable_batch_response_is_split():
+    def responder(prompt):
+        payload = default_stub_response(prompt)
+        if not payload.startswith("{"):
+            return payload.upper()
+        segments = json.loads(payload)
+        if len(segments) > 2:
+            return "not json"
+        return json.dumps({key: value.upper() for key, value in segments.items()})
+
+    backend = StubBackend(responder)
+    translator = make_translator(backend)
+
+    results = translator.translate_batch([f"segment {i}" for i in range(4)], "en")
+
+    assert results == [f"SEGMENT {i}" for i in range(4)]
+    assert backend.calls == 3
@@ -0,0 +1,70 @@
+from app import TranslationCache
+
+
+def test_replacing_an_entry_does_not_grow_disk_count(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache.db"))
+    key = TranslationCache.make_key("Hello", "ko", "model")
+
+    cache.put(key, "안녕")
+    cache.put(key, "안녕하세요")
+    cache.put(TranslationCache.make_key("Bye", "ko", "model"), "잘 가")
+
+    assert cache.stats()["disk_entries"] == 2
+    cache.close()
+
+    reopened = TranslationCache(str(tmp_path / "cache.db"))
+    assert reopened.stats()["disk_entries"] == 2
+    assert reopened.get(key) == "안녕하세요"
+    reopened.close()
+
+
+def test_eviction_threshold_ignores_replacements(tmp_path):
+    cache = TranslationCache(str(tmp_path / "cache.db"), max_entries=3)
+    key = TranslationCache.make_key("Hello", "ko", "model")
+
+    for i in range(10):
+        cache.put(key, f"안녕 {i}")
+
+    assert cache.evictions == 0
+    assert cache.get(key) == "안녕 9"
+    cache.close()
+
+
+def last_used(path, key):
+    import sqlite3
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT last_used FROM translations WHERE key = ?", (key,)).fetchone()[0]
+    finally:
+        conn.close()
+
+
+def test_disk_hits_are_recorded_in_batches(tmp_path):
+    path = str(tmp_path / "cache.db")
+    key = TranslationCache.make_key("Hello", "ko", "model")
+    cache = TranslationCache(path)
+    cache.put(key, "안녕")
+    cache.close()
+    stored = last_used(path, key)
+
+    cache = TranslationCache(path)
+    assert cache.get(key) == "안녕"
+    assert last_used(path, key) == stored
+    cache.flush()
+    assert last_used(path, key) > stored
+    cache.close()
+
+
+def test_pending_hits_are_written_on_put_and_close(tmp_path):
+    path = str(tmp_path / "cache.db")
+    hello = TranslationCache.make_key("Hello", "ko", "model")
+    cache = TranslationCache(path)
+    cache.put(hello, "안녕")
+    cache.close()
+    stored = last_used(path, hello)
+
+    cache = TranslationCache(path)
+    cache.get(hello)
+    cache.put(TranslationCache.make_key("Bye", "ko", "model"), "잘 가")
+    assert last_used(path, hello) > stored
+    cache.close()
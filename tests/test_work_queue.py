@@ -0,0 +1,198 @@
+import os
+import threading
+import time
+
+import pytest
+
+from app import PowerPointTranslatorImproved, SQLiteWorkQueue, StubBackend, default_stub_response
+
+
+@pytest.fixture
+def queue_path(tmp_path):
+    return str(tmp_path / "queue.db")
+
+
+def make_queue(queue_path, **kwargs):
+    kwargs.setdefault("visibility_timeout", 60.0)
+    kwargs.setdefault("retry_delay", 0.0)
+    return SQLiteWorkQueue(queue_path, **kwargs)
+
+
+def test_each_task_is_claimed_by_one_worker(queue_path):
+    work_queue = make_queue(queue_path)
+    for i in range(50):
+        work_queue.put("job", f"task-{i}", {"i": i})
+    claimed = []
+    claimed_lock = threading.Lock()
+
+    def worker(worker_id):
+        # 작업자마다 별도 연결을 사용해 다른 프로세스처럼 경쟁합니다
+        own_queue = make_queue(queue_path)
+        while True:
+            task = own_queue.claim(worker_id)
+            if task is None:
+                break
+            with claimed_lock:
+                claimed.append(task["task_id"])
+        own_queue.close()
+
+    threads = [threading.Thread(target=worker, args=(f"worker-{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed) == sorted(f"task-{i}" for i in range(50))
+    assert work_queue.claim("late") is None
+    work_queue.close()
+
+
+def test_expired_task_is_redelivered_and_stale_receipt_is_rejected(queue_path):
+    work_queue = make_queue(queue_path, visibility_timeout=0.1)
+    work_queue.put("job", "task", {"texts": ["a"]})
+
+    first = work_queue.claim("worker-1")
+    assert work_queue.claim("worker-2") is None
+    time.sleep(0.15)
+    second = work_queue.claim("worker-2")
+
+    assert second["task_id"] == "task"
+    assert second["attempts"] == 2
+    assert second["receipt"] != first["receipt"]
+    assert not work_queue.complete(first, ["late"])
+    work_queue.fail(first, "late failure")
+    assert work_queue.progress("job")["claimed"] == 1
+    assert work_queue.complete(second, ["ok"])
+    assert not work_queue.complete(second, ["twice"])
+
+    _, finished = work_queue.finished_since("job")
+    assert finished == {"task": ({"texts": ["a"]}, ["ok"])}
+    work_queue.close()
+
+
+def test_failed_task_is_retried_until_max_attempts(queue_path):
+    work_queue = make_queue(queue_path, max_attempts=3)
+    work_queue.put("job", "task", {})
+
+    retries = []
+    for _ in range(3):
+        task = work_queue.claim("worker")
+        retries.append(work_queue.fail(task, "boom"))
+
+    assert retries == [True, True, False]
+    assert work_queue.claim("worker") is None
+    progress = work_queue.progress("job")
+    assert (progress["failed"], progress["retries"]) == (1, 2)
+    _, finished = work_queue.finished_since("job")
+    assert finished == {"task": ({}, None)}
+    work_queue.close()
+
+
+def test_expired_task_without_attempts_left_becomes_failed(queue_path):
+    work_queue = make_queue(queue_path, visibility_timeout=0.05, max_attempts=1)
+    work_queue.put("job", "task", {})
+    task = work_queue.claim("worker")
+    time.sleep(0.1)
+
+    assert work_queue.expire() == 1
+    assert work_queue.progress("job")["failed"] == 1
+    assert not work_queue.complete(task, ["late"])
+    work_queue.close()
+
+
+def test_finished_since_returns_only_new_tasks(queue_path):
+    work_queue = make_queue(queue_path)
+    for i in range(3):
+        work_queue.put("job", f"task-{i}", {"i": i})
+    work_queue.put("other", "task-x", {})
+
+    work_queue.complete(work_queue.claim("worker"), [0])
+    cursor, first = work_queue.finished_since("job")
+    work_queue.complete(work_queue.claim("worker"), [1])
+    work_queue.complete(work_queue.claim("worker"), [2])
+    work_queue.complete(work_queue.claim("worker"), ["other"])
+    cursor, second = work_queue.finished_since("job", cursor)
+
+    assert list(first) == ["task-0"]
+    assert sorted(second) == ["task-1", "task-2"]
+    assert work_queue.finished_since("job", cursor) == (cursor, {})
+    work_queue.close()
+
+
+def make_translator():
+    backend = StubBackend(lambda prompt: default_stub_response(prompt).upper())
+    return PowerPointTranslatorImproved(max_workers=2, cache_path=None, backend=backend)
+
+
+def test_coordinator_saves_decks_translated_by_workers(sample_deck, queue_path, tmp_path):
+    work_queue = make_queue(queue_path)
+    stop_event = threading.Event()
+    worker = threading.Thread(target=make_translator().run_worker,
+                              args=(make_queue(queue_path),), kwargs={"poll_interval": 0.05, "stop_event": stop_event})
+    worker.start()
+    try:
+        results = make_translator().translate_files_distributed([sample_deck], ["en"], work_queue,
+                                                                str(tmp_path / "out"), poll_interval=0.05)
+    finally:
+        stop_event.set()
+        worker.join()
+
+    assert list(results.values()) == [True]
+    assert os.path.exists(next(iter(results)))
+    work_queue.close()
+
+
+def test_coordinator_stops_waiting_when_workers_stall(sample_deck, queue_path, tmp_path):
+    work_queue = make_queue(queue_path)
+    start = time.monotonic()
+
+    results = make_translator().translate_files_distributed([sample_deck], ["en"], work_queue,
+                                                            str(tmp_path / "out"), poll_interval=0.05,
+                                                            stall_timeout=0.3)
+
+    assert list(results.values()) == [False]
+    assert time.monotonic() - start < 10
+    assert work_queue.progress()["pending"] > 0
+    work_queue.close()
+
+
+class RecordingBackend(StubBackend):
+    """요청마다 모델 ID와 응답 최대 토큰 수를 기록하는 백엔드"""
+
+    def __init__(self, responder=None):
+        super().__init__(responder)
+        self.requests = []
+
+    def invoke(self, model_id, body):
+        with self._lock:
+            self.requests.append((model_id, body["max_tokens"]))
+        return super().invoke(model_id, body)
+
+
+def test_worker_uses_the_coordinators_routing(sample_deck, queue_path, tmp_path):
+    coordinator = PowerPointTranslatorImproved(max_workers=2, cache_path=None, backend=StubBackend(),
+                                               small_model_id="small-model", small_model_max_tokens=100,
+                                               small_model_max_lines=10)
+    # 작업자는 기본 설정(경량 모델 없음, 고정 응답 토큰 수)으로 실행된 것처럼 다르게 구성합니다
+    backend = RecordingBackend(lambda prompt: default_stub_response(prompt).upper())
+    worker_translator = PowerPointTranslatorImproved(max_workers=2, cache_path=None, backend=backend,
+                                                     dynamic_max_tokens=False)
+    work_queue = make_queue(queue_path)
+    stop_event = threading.Event()
+    worker = threading.Thread(target=worker_translator.run_worker, args=(make_queue(queue_path),),
+                              kwargs={"poll_interval": 0.05, "stop_event": stop_event})
+    worker.start()
+    try:
+        results = coordinator.translate_files_distributed([sample_deck], ["en"], work_queue,
+                                                          str(tmp_path / "out"), poll_interval=0.05)
+    finally:
+        stop_event.set()
+        worker.join()
+
+    assert list(results.values()) == [True]
+    job_id = work_queue.job_ids()[0]
+    _, finished = work_queue.finished_since(job_id)
+    expected = sorted((payload["model_id"], payload["max_tokens"]) for payload, _ in finished.values())
+    assert "small-model" in {model_id for model_id, _ in expected}
+    assert sorted(backend.requests) == expected
+    work_queue.close()